@@ -0,0 +1,98 @@
+import json
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from util.network_algorithms import create_network
+from nodes.network.util import parallel
+from nodes.network.util.planner import COSTS_FILE, DEFAULT_COSTS, network_profile, work_units
+from nodes.network.util.distance import distance_transform
+from nodes.network.util.reachability import reachability_transform
+from nodes.network.util.path_algebra import (
+    dense_distance_transform,
+    bitset_reachability_transform,
+)
+
+# --- Configuration ---
+NODE_COUNTS = [50, 100, 200, 400]
+DENSITIES = [0.01, 0.05, 0.2]
+WORKERS = parallel.resolve_workers(0)
+SEED = 42
+
+
+def random_network(n, density, weighted, rng):
+    m = max(1, int(density * n * (n - 1)))
+    df = pd.DataFrame(
+        {
+            "source": rng.integers(0, n, m),
+            "target": rng.integers(0, n, m),
+            "weight": rng.integers(1, 10, m).astype(float) if weighted else 1.0,
+        }
+    )
+    df = df[df["source"] != df["target"]].drop_duplicates(["source", "target"])
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    return create_network(df, settings)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    rng = np.random.default_rng(SEED)
+    samples = {key: [] for key in ["traversal_weighted", "traversal_unweighted", "dense", "bitset"]}
+    startup = []
+
+    for n in NODE_COUNTS:
+        for density in DENSITIES:
+            weighted = random_network(n, density, True, rng)
+            unweighted = random_network(n, density, False, rng)
+            units_w = work_units(network_profile(weighted))
+            units_u = work_units(network_profile(unweighted))
+
+            t_weighted = timed(distance_transform, weighted)
+            t_unweighted = timed(reachability_transform, unweighted)
+            t_dense = timed(dense_distance_transform, weighted)
+            t_bitset = timed(bitset_reachability_transform, unweighted)
+            samples["traversal_weighted"].append(t_weighted / units_w["traversal_weighted"])
+            samples["traversal_unweighted"].append(t_unweighted / units_u["traversal_unweighted"])
+            samples["dense"].append(t_dense / units_w["dense"])
+            samples["bitset"].append(t_bitset / units_u["bitset"])
+
+            if WORKERS > 1:
+                t_parallel = timed(distance_transform, weighted, workers=WORKERS)
+                startup.append(max(0.0, t_parallel - t_weighted / WORKERS) / WORKERS)
+
+            print(
+                f"n={n:5d} density={density:.2f}  traversal {t_weighted:.4f}s / {t_unweighted:.4f}s"
+                f"  dense {t_dense:.4f}s  bitset {t_bitset:.4f}s"
+            )
+
+    costs = dict(DEFAULT_COSTS)
+    costs.update({key: statistics.median(values) for key, values in samples.items()})
+    if startup:
+        costs["parallel_startup"] = statistics.median(startup)
+
+    with open(COSTS_FILE, "w") as f:
+        json.dump(costs, f, indent=2)
+    print(f"Calibrated engine costs written to {COSTS_FILE}:")
+    print(json.dumps(costs, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,10 +10,13 @@ attribute_category = cat.attribute_category
 import nodes.network.table
 import nodes.network.factory
 import nodes.network.transform
+import nodes.network.pipeline
+import nodes.network.incremental
 import nodes.network.combine
 
 import nodes.position.table
 import nodes.position.factory
+import nodes.position.walk
 import nodes.position.transform
 import nodes.position.dominance
 
@@ -10,6 +10,18 @@ from util.port_types import (
     network_port_type,
 )
 
+class SnapshotOptions(knext.EnumParameterOptions):
+    NONE = ("No Snapshots", "Create a single network of all edges.")
+    CUMULATIVE = (
+        "Cumulative",
+        "Every snapshot contains all edges up to its time.",
+    )
+    WINDOW = (
+        "Window",
+        "Every snapshot contains the edges of the last snapshot times only.",
+    )
+
+
 @knext.parameter_group(label="Network Settings")
 class NetworkSettings:
     source_label = knext.ColumnParameter(
@@ -39,6 +51,40 @@ class NetworkSettings:
         description="Select if the network is irreflexive.",
         default_value=False,
     )
+    snapshot_mode = knext.EnumParameter(
+        label="Snapshots",
+        description="Slice the edges into time snapshots. Transformations and Position Creation "
+        "run across all snapshots, positions are named 'node@snapshot'.",
+        enum=SnapshotOptions,
+        default_value=SnapshotOptions.NONE.name,
+    )
+    time_label = knext.ColumnParameter(
+        label="Time",
+        description="Select the time or ordinal column that orders the edges. "
+        "Edges without a value belong to every snapshot.",
+    ).rule(
+        knext.OneOf(snapshot_mode, [SnapshotOptions.NONE.name]),
+        knext.Effect.HIDE,
+    )
+    snapshot_count = knext.IntParameter(
+        label="Number of Snapshots",
+        description="Number of snapshots of equal width over the range of a numeric or date "
+        "column, 0 creates a snapshot for every distinct value.",
+        default_value=0,
+        min_value=0,
+    ).rule(
+        knext.OneOf(snapshot_mode, [SnapshotOptions.NONE.name]),
+        knext.Effect.HIDE,
+    )
+    window_size = knext.IntParameter(
+        label="Window Size",
+        description="Number of consecutive snapshot times covered by a window snapshot.",
+        default_value=1,
+        min_value=1,
+    ).rule(
+        knext.OneOf(snapshot_mode, [SnapshotOptions.WINDOW.name]),
+        knext.Effect.SHOW,
+    )
 
 @knext.node(
     name="Network Creation",
@@ -91,6 +137,16 @@ class NetworkFactoryNode:
             raise knext.InvalidParametersError(
                 "Weight column must be different from target column."
             )
+        if self.settings.snapshot_mode != SnapshotOptions.NONE.name:
+            if not self.settings.time_label:
+                raise knext.InvalidParametersError("Time column must be set.")
+            if self.settings.time_label in (
+                self.settings.source_label,
+                self.settings.target_label,
+            ):
+                raise knext.InvalidParametersError(
+                    "Time column must be different from source and target columns."
+                )
         return NetworkPortObjectSpec(
             two_mode=self.settings.two_mode,
             symmetric=self.settings.symmetric,
@@ -110,6 +166,10 @@ class NetworkFactoryNode:
             "two_mode": self.settings.two_mode,
             "symmetric": self.settings.symmetric,
             "irreflexive": self.settings.irreflexive,
+            "snapshot_mode": self.settings.snapshot_mode,
+            "time_label": self.settings.time_label,
+            "snapshot_count": self.settings.snapshot_count,
+            "window_size": self.settings.window_size,
         }
         return create_network(
             input_table.to_pandas(),
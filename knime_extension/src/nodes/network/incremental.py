@@ -0,0 +1,128 @@
+import knime.extension as knext
+
+import networks_ext
+import util.network_algorithms as algo
+from util.port_objects import (
+    NetworkPortObject,
+    NetworkPortObjectSpec,
+)
+from util.port_types import (
+    network_port_type,
+)
+
+
+@knext.parameter_group(label="Incremental Update Settings")
+class IncrementalUpdateSettings:
+    transform_type = knext.EnumParameter(
+        label="Transformation type",
+        description="Transformation that created the previous result.",
+        enum=algo.IncrementalOptions,
+        default_value=algo.IncrementalOptions.DISTANCE.name,
+    )
+    source_label = knext.ColumnParameter(
+        label="Source nodes",
+        description="Select the column of the edge delta with the source nodes.",
+        port_index=2,
+    )
+    target_label = knext.ColumnParameter(
+        label="Target nodes",
+        description="Select the column of the edge delta with the target nodes.",
+        port_index=2,
+    )
+    weight_label = knext.ColumnParameter(
+        label="Values",
+        description="Select the column of the edge delta with the new values. "
+        "A missing value deletes the edge, any other value adds the edge or changes its value.",
+        port_index=2,
+    )
+    max_share = knext.DoubleParameter(
+        label="Full Recomputation Share",
+        description="The transformation is recomputed from scratch if the changed edges exceed "
+        "this share of all edges or the affected sources this share of all nodes (default: 0.2).",
+        default_value=0.2,
+        min_value=0.0,
+        max_value=1.0,
+    )
+
+
+@knext.node(
+    name="Network Incremental Update",
+    node_type=knext.NodeType.MANIPULATOR,
+    category=networks_ext.network_category,
+    icon_path="icons/transform.png",
+)
+@knext.input_port(
+    name="Previous Network",
+    description="Network the previous result was computed from.",
+    port_type=network_port_type,
+)
+@knext.input_port(
+    name="Previous Result",
+    description="Output of the distance or reachability transformation of the previous network.",
+    port_type=network_port_type,
+)
+@knext.input_table(
+    name="Edge Delta",
+    description="Added, deleted and changed edges.",
+)
+@knext.output_port(
+    name="Updated Network",
+    description="Previous network with the edge delta applied.",
+    port_type=network_port_type,
+)
+@knext.output_port(
+    name="Updated Result",
+    description="Transformation of the updated network. Only the sources affected by the "
+    "edge delta are recomputed.",
+    port_type=network_port_type,
+)
+class IncrementalUpdateNode(knext.PythonNode):
+    settings = IncrementalUpdateSettings()
+
+    def configure(
+        self,
+        configure_context: knext.ConfigurationContext,
+        network_schema: NetworkPortObjectSpec,
+        result_schema: NetworkPortObjectSpec,
+        delta_schema: knext.Schema,
+    ):
+        if not self.settings.source_label:
+            raise knext.InvalidParametersError("Source column must be set.")
+        if not self.settings.target_label:
+            raise knext.InvalidParametersError("Target column must be set.")
+        if not self.settings.weight_label:
+            raise knext.InvalidParametersError("Weight column must be set.")
+        if network_schema.two_mode:
+            raise knext.InvalidParametersError(
+                "Incremental updates are not supported for two-mode networks."
+            )
+        expected = algo.INCREMENTAL_RESULT_LABELS[self.settings.transform_type]
+        if result_schema.weight_label != expected:
+            raise knext.InvalidParametersError(
+                f"The previous result has no '{expected}' values, "
+                "select the transformation that created it."
+            )
+        return network_schema, result_schema
+
+    def execute(
+        self,
+        exec_context: knext.ExecutionContext,
+        network: NetworkPortObject,
+        result: NetworkPortObject,
+        delta_table: knext.Table,
+    ):
+        delta = delta_table.to_pandas()[
+            [self.settings.source_label, self.settings.target_label, self.settings.weight_label]
+        ]
+        delta.columns = [
+            network.get_source_label(),
+            network.get_target_label(),
+            network.get_weight_label(),
+        ]
+        return algo.incremental_transform(
+            network,
+            result,
+            delta,
+            transform=self.settings.transform_type,
+            max_share=self.settings.max_share,
+        )
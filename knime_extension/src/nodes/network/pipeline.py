@@ -0,0 +1,66 @@
+import knime.extension as knext
+
+import networks_ext
+import util.network_algorithms as algo
+from util.port_objects import (
+    NetworkPortObject,
+    NetworkPortObjectSpec,
+)
+from util.port_types import (
+    network_port_type,
+)
+
+
+@knext.parameter_group(label="Network Pipeline Settings")
+class NetworkPipelineNodeParameters:
+    steps = knext.StringParameter(
+        label="Steps",
+        description="Transformations to run in order, separated by ';' or new lines. "
+        "Every step starts with a transformation type followed by key=value settings "
+        "named like the settings of the Network Transformation node, "
+        "e.g. 'FILTER filter_mode=GREATER filter_value=2; SYMMETRY symmetrization_method=MAX; "
+        "RESCALE rescale_method=INVERSE; DISTANCE engine=AUTO'. "
+        "Element-wise steps are fused and edge filters are run before path transformations "
+        "where this does not change the result.",
+        default_value="IDENTITY",
+    )
+
+    def validate(self, values: dict):
+        algo.parse_steps(values["steps"])
+
+
+@knext.node(
+    name="Network Transformation Pipeline",
+    node_type=knext.NodeType.MANIPULATOR,
+    category=networks_ext.network_category,
+    icon_path="icons/transform.png",
+)
+@knext.input_port(
+    name="Input Network",
+    description="Input network to transform.",
+    port_type=network_port_type,
+)
+@knext.output_port(
+    name="Output Network",
+    description="Network after all transformation steps.",
+    port_type=network_port_type,
+)
+class NetworkPipelineNode(knext.PythonNode):
+    settings = NetworkPipelineNodeParameters()
+
+    def configure(
+        self,
+        configure_context: knext.ConfigurationContext,
+        input_schema: NetworkPortObjectSpec,
+    ) -> NetworkPortObjectSpec:
+        try:
+            steps = algo.parse_steps(self.settings.steps)
+        except ValueError as e:
+            raise knext.InvalidParametersError(str(e))
+        return algo.pipeline_schema(input_schema, steps)
+
+    def execute(
+        self, exec_context: knext.ExecutionContext, input: NetworkPortObject
+    ) -> NetworkPortObject:
+        steps = algo.parse_steps(self.settings.steps)
+        return algo.run_pipeline(input, steps)
@@ -1,6 +1,8 @@
 import knime.extension as knext
+import pandas as pd
 
 import networks_ext
+from util.network_algorithms import snapshot_edges
 from util.port_objects import (
     NetworkPortObject,
     NetworkPortObjectSpec,
@@ -9,6 +11,16 @@ from util.port_types import (
     network_port_type,
 )
 
+@knext.parameter_group(label="Network to Table Settings")
+class NetworkTableSettings:
+    matrix_columns = knext.BoolParameter(
+        label="Matrix as Columns",
+        description="Output networks stored as a matrix with one row per source node and one "
+        "column per target node instead of one row per edge.",
+        default_value=False,
+    )
+
+
 @knext.node(
     name="Network to Table",
     node_type=knext.NodeType.MANIPULATOR,
@@ -25,6 +37,8 @@ from util.port_types import (
     description="Output table with network data.",
 )
 class NetworkTableNode:
+    settings = NetworkTableSettings()
+
     def configure(
         self,
         configure_context: knext.ConfigurationContext,
@@ -33,6 +47,24 @@ class NetworkTableNode:
         return None
 
     def execute(self, context, input: NetworkPortObject) -> knext.Table:
+        if input.is_matrix() and self.settings.matrix_columns:
+            matrix = input.get_matrix()
+            wide = pd.DataFrame(
+                matrix.values.astype("float64"), columns=matrix.col_labels.astype(str)
+            )
+            wide.insert(0, input.get_source_label(), matrix.row_labels)
+            return knext.Table.from_pandas(wide)
+
+        if input.is_spilled():
+            # copy the chunked file chunk by chunk
+            table = knext.BatchOutputTable.create(row_ids="generate")
+            for chunk in input.get_network_chunks():
+                table.append(chunk)
+            return table
+
         network = input.get_network()
+        if input.get_snapshots() is not None:
+            # one row per edge and snapshot
+            network = snapshot_edges(input)
 
         return knext.Table.from_pandas(network)
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 import knime.extension as knext
 
 import networks_ext
@@ -33,6 +35,65 @@ class NetworkTransformationNodeParameters:
         knext.Effect.SHOW,
     )
 
+    # +-----------------------------------------------------------+
+    # Parameters for path transformations
+    # +-----------------------------------------------------------+
+    engine = knext.EnumParameter(
+        label="Path Engine",
+        description="Select the algorithm used to compute paths between all node pairs.",
+        enum=algo.PathEngineOptions,
+        default_value=algo.PathEngineOptions.TRAVERSAL.name,
+    ).rule(
+        knext.OneOf(
+            transform_type,
+            [
+                algo.TransformOptions.DISTANCE.name,
+                algo.TransformOptions.REACHABILITY.name,
+            ],
+        ),
+        knext.Effect.SHOW,
+    )
+    split_components = knext.BoolParameter(
+        label="Split Into Components",
+        description="Compute every weakly connected component separately and in parallel. "
+        "Node pairs in different components are unrelated and are left out of the output "
+        "(this also drops the zero flows between components of the max flow transformation).",
+        default_value=False,
+    ).rule(
+        knext.OneOf(
+            transform_type,
+            [
+                algo.TransformOptions.DISTANCE.name,
+                algo.TransformOptions.REACHABILITY.name,
+                algo.TransformOptions.DEPENDENCY.name,
+                algo.TransformOptions.MAX_FLOW.name,
+                algo.TransformOptions.BOTTLENECK.name,
+                algo.TransformOptions.RELIABILITY.name,
+            ],
+        ),
+        knext.Effect.SHOW,
+    )
+    workers = knext.IntParameter(
+        label="Worker Processes",
+        description="Number of processes for the parallel engine and for split components, 0 uses all available cores.",
+        default_value=0,
+        min_value=0,
+        is_advanced=True,
+    ).rule(
+        knext.OneOf(
+            transform_type,
+            [
+                algo.TransformOptions.DISTANCE.name,
+                algo.TransformOptions.REACHABILITY.name,
+                algo.TransformOptions.DEPENDENCY.name,
+                algo.TransformOptions.MAX_FLOW.name,
+                algo.TransformOptions.BOTTLENECK.name,
+                algo.TransformOptions.RELIABILITY.name,
+            ],
+        ),
+        knext.Effect.SHOW,
+    )
+
     # +-----------------------------------------------------------+
     # Parameters for k-reachability transformations
     # +-----------------------------------------------------------+
@@ -47,15 +108,53 @@ class NetworkTransformationNodeParameters:
 
     k_value = knext.IntParameter(
         label="Maximum Steps (k)",
-        description="Maximum number of steps for K-Reachability",
+        description="Maximum number of steps for K-Reachability, number of steps for walk transformations.",
         default_value=5,
+    ).rule(
+        knext.Or(
+            knext.And(
+                knext.OneOf(transform_type, [algo.TransformOptions.REACHABILITY.name]),
+                knext.OneOf(set_k, [True]),
+            ),
+            knext.OneOf(transform_type, [algo.TransformOptions.WALK.name]),
+        ),
+        knext.Effect.SHOW,
+    )
+
+    # +-----------------------------------------------------------+
+    # Parameters for walk transformations
+    # +-----------------------------------------------------------+
+    walk_method = knext.EnumParameter(
+        label="Walk Method",
+        description="Select the walk measure to compute.",
+        enum=algo.WalkOptions,
+        default_value=algo.WalkOptions.WALK_COUNT.name,
+    ).rule(
+        knext.OneOf(transform_type, [algo.TransformOptions.WALK.name]),
+        knext.Effect.SHOW,
+    )
+    walk_attenuation = knext.DoubleParameter(
+        label="Attenuation Factor",
+        description="Factor applied per step to attenuated walks (default: 0.1).",
+        default_value=0.1,
     ).rule(
         knext.And(
-            knext.OneOf(transform_type, [algo.TransformOptions.REACHABILITY.name]),
-            knext.OneOf(set_k, [True]),
+            knext.OneOf(transform_type, [algo.TransformOptions.WALK.name]),
+            knext.OneOf(walk_method, [algo.WalkOptions.ATTENUATED_WALK.name]),
         ),
         knext.Effect.SHOW,
     )
+    dense_cutoff = knext.DoubleParameter(
+        label="Dense Cutoff",
+        description="Density above which blocks are computed as dense matrices (default: 0.1).",
+        default_value=0.1,
+        min_value=0.0,
+        max_value=1.0,
+        is_advanced=True,
+    ).rule(
+        knext.OneOf(transform_type, [algo.TransformOptions.WALK.name]),
+        knext.Effect.SHOW,
+    )
 
     # +-----------------------------------------------------------+
     # Parameters for rescale transformations
@@ -162,16 +261,37 @@ class NetworkTransformationNodeParameters:
         enum=algo.ThresholdOptions,
         default_value=algo.ThresholdOptions.ABSOLUTE_THRESHOLD.name,
     ).rule(
-        knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
+        knext.And(
+            knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
+            knext.OneOf(
+                filter_type,
+                [
+                    algo.FilterOptions.NODE.name,
+                    algo.FilterOptions.EDGE.name,
+                    algo.FilterOptions.CORE.name,
+                ],
+            ),
+        ),
         knext.Effect.SHOW,
     )
     filter_mode = knext.EnumParameter(
         label="Filter Mode",
-        description="Whether to use ≥ or ≤ for filtering edges based on the selected filter type.",
+        description="Whether to use ≥ or ≤ for filtering edges based on the selected filter type. "
+        "For top-k edges, whether to keep the largest or the smallest weights.",
         enum=algo.FilterModeOptions,
         default_value=algo.FilterModeOptions.LESS.name,
     ).rule(
-        knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
+        knext.And(
+            knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
+            knext.OneOf(
+                filter_type,
+                [
+                    algo.FilterOptions.NODE.name,
+                    algo.FilterOptions.EDGE.name,
+                    algo.FilterOptions.TOP_K.name,
+                ],
+            ),
+        ),
         knext.Effect.SHOW,
     )
     strength_mode = knext.BoolParameter(
@@ -181,7 +301,22 @@ class NetworkTransformationNodeParameters:
     ).rule(
         knext.And(
             knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
-            knext.OneOf(filter_type, [algo.FilterOptions.NODE.name]),
+            knext.OneOf(
+                filter_type,
+                [algo.FilterOptions.NODE.name, algo.FilterOptions.CORE.name],
+            ),
+        ),
+        knext.Effect.SHOW,
+    )
+    add_core_columns = knext.BoolParameter(
+        label="Add Core Numbers",
+        description="Add the core numbers of the source and target node of every edge as "
+        "the columns '<source>_core' and '<target>_core'.",
+        default_value=False,
+    ).rule(
+        knext.And(
+            knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
+            knext.OneOf(filter_type, [algo.FilterOptions.CORE.name]),
         ),
         knext.Effect.SHOW,
     )
@@ -190,7 +325,98 @@ class NetworkTransformationNodeParameters:
         description="Value to use for filtering edges based on the selected filter type.",
         default_value=0.0,
     ).rule(
-        knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
+        knext.And(
+            knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
+            knext.OneOf(
+                filter_type,
+                [
+                    algo.FilterOptions.NODE.name,
+                    algo.FilterOptions.EDGE.name,
+                    algo.FilterOptions.CORE.name,
+                ],
+            ),
+        ),
+        knext.Effect.SHOW,
+    )
+    sketch_size = knext.IntParameter(
+        label="Sketch Size",
+        description="Accuracy of the quantile sketch, the percentile rank is off by about 1.7 / size (default: 200).",
+        default_value=200,
+        min_value=8,
+        is_advanced=True,
+    ).rule(
+        knext.And(
+            knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
+            knext.OneOf(
+                filter_threshold, [algo.ThresholdOptions.APPROX_PERCENTILE_THRESHOLD.name]
+            ),
+        ),
+        knext.Effect.SHOW,
+    )
+    filter_top_k = knext.IntParameter(
+        label="Edges per Node (k)",
+        description="Number of edges kept per node, an edge is kept if one of its nodes keeps it.",
+        default_value=10,
+        min_value=1,
+    ).rule(
+        knext.And(
+            knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
+            knext.OneOf(filter_type, [algo.FilterOptions.TOP_K.name]),
+        ),
+        knext.Effect.SHOW,
+    )
+    filter_alpha = knext.DoubleParameter(
+        label="Significance Level (alpha)",
+        description="Edges with a p-value below alpha at one of their nodes form the backbone (default: 0.05).",
+        default_value=0.05,
+        min_value=0.0,
+        max_value=1.0,
+    ).rule(
+        knext.And(
+            knext.OneOf(transform_type, [algo.TransformOptions.FILTER.name]),
+            knext.OneOf(filter_type, [algo.FilterOptions.BACKBONE.name]),
+        ),
+        knext.Effect.SHOW,
+    )
+
+    # +-----------------------------------------------------------+
+    # Parameters for similarity transformations
+    # +-----------------------------------------------------------+
+    similarity_method = knext.EnumParameter(
+        label="Similarity Method",
+        description="Select the neighborhood overlap measure to compute.",
+        enum=algo.SimilarityOptions,
+        default_value=algo.SimilarityOptions.JACCARD.name,
+    ).rule(
+        knext.OneOf(transform_type, [algo.TransformOptions.SIMILARITY.name]),
+        knext.Effect.SHOW,
+    )
+    set_top_k = knext.BoolParameter(
+        label="Keep Top-k Only",
+        description="Enable to keep only the k most similar nodes of every node instead of all pairs.",
+        default_value=False,
+    ).rule(
+        knext.OneOf(transform_type, [algo.TransformOptions.SIMILARITY.name]),
+        knext.Effect.SHOW,
+    )
+    top_k = knext.IntParameter(
+        label="Top-k",
+        description="Number of most similar nodes to keep per node.",
+        default_value=10,
+        min_value=1,
+    ).rule(
+        knext.And(
+            knext.OneOf(transform_type, [algo.TransformOptions.SIMILARITY.name]),
+            knext.OneOf(set_top_k, [True]),
+        ),
+        knext.Effect.SHOW,
+    )
+    similarity_threshold = knext.DoubleParameter(
+        label="Minimum Similarity",
+        description="Node pairs with a lower similarity are dropped from the output.",
+        default_value=0.0,
+    ).rule(
+        knext.OneOf(transform_type, [algo.TransformOptions.SIMILARITY.name]),
         knext.Effect.SHOW,
     )
 
@@ -222,9 +448,13 @@ class NetworkTransformationNodeParameters:
                     filter_type,
                     [
                         algo.FilterOptions.NODE.name,
+                        algo.FilterOptions.CORE.name,
+                        algo.FilterOptions.TOP_K.name,
+                        algo.FilterOptions.BACKBONE.name,
                     ],
                 ),
             ),
+            knext.OneOf(transform_type, [algo.TransformOptions.SIMILARITY.name]),
         ),
         knext.Effect.SHOW,
     )
@@ -246,22 +476,161 @@ class NetworkTransformationNodeParameters:
         knext.Effect.SHOW,
     )
 
+    block_size = knext.IntParameter(
+        label="Block Size",
+        description="Number of nodes processed per block. Smaller blocks use less memory.",
+        default_value=1024,
+        min_value=1,
+        is_advanced=True,
+    ).rule(
+        knext.OneOf(
+            transform_type,
+            [
+                algo.TransformOptions.DISTANCE.name,
+                algo.TransformOptions.REACHABILITY.name,
+                algo.TransformOptions.BOTTLENECK.name,
+                algo.TransformOptions.RELIABILITY.name,
+                algo.TransformOptions.SIMILARITY.name,
+                algo.TransformOptions.WALK.name,
+            ],
+        ),
+        knext.Effect.SHOW,
+    )
+
+    matrix_output = knext.BoolParameter(
+        label="Matrix Output",
+        description="Output all-pairs results as a dense single precision matrix instead of "
+        "an edge list, about a third of the memory for dense results. Position Creation, "
+        "edge filters and Network to Table use the matrix directly. "
+        "Not used with split components.",
+        default_value=False,
+        is_advanced=True,
+    ).rule(
+        knext.OneOf(
+            transform_type,
+            [
+                algo.TransformOptions.DISTANCE.name,
+                algo.TransformOptions.REACHABILITY.name,
+                algo.TransformOptions.DEPENDENCY.name,
+                algo.TransformOptions.MAX_FLOW.name,
+                algo.TransformOptions.BOTTLENECK.name,
+                algo.TransformOptions.RELIABILITY.name,
+            ],
+        ),
+        knext.Effect.SHOW,
+    )
+    spill_to_disk = knext.BoolParameter(
+        label="Write Output to Disk",
+        description="Write the output of the all-pairs transformations to a temporary file in "
+        "chunks instead of collecting it in memory. Not used with split components.",
+        default_value=False,
+        is_advanced=True,
+    ).rule(
+        knext.OneOf(
+            transform_type,
+            [
+                algo.TransformOptions.DISTANCE.name,
+                algo.TransformOptions.DEPENDENCY.name,
+                algo.TransformOptions.MAX_FLOW.name,
+            ],
+        ),
+        knext.Effect.SHOW,
+    )
+    spill_size = knext.IntParameter(
+        label="Chunk Size (MB)",
+        description="Memory used for the output rows of one chunk (default: 256).",
+        default_value=256,
+        min_value=1,
+        is_advanced=True,
+    ).rule(
+        knext.And(
+            knext.OneOf(
+                transform_type,
+                [
+                    algo.TransformOptions.DISTANCE.name,
+                    algo.TransformOptions.DEPENDENCY.name,
+                    algo.TransformOptions.MAX_FLOW.name,
+                ],
+            ),
+            knext.OneOf(spill_to_disk, [True]),
+        ),
+        knext.Effect.SHOW,
+    )
+    max_share = knext.DoubleParameter(
+        label="Full Recomputation Share",
+        description="Distances and reachability of snapshots are updated from the previous "
+        "snapshot; they are recomputed from scratch if the changed edges exceed this share of "
+        "all edges or the affected sources this share of all nodes (default: 0.2).",
+        default_value=0.2,
+        min_value=0.0,
+        max_value=1.0,
+        is_advanced=True,
+    ).rule(
+        knext.OneOf(
+            transform_type,
+            [
+                algo.TransformOptions.DISTANCE.name,
+                algo.TransformOptions.REACHABILITY.name,
+            ],
+        ),
+        knext.Effect.SHOW,
+    )
+
+    # +-----------------------------------------------------------+
+    # Result cache
+    # +-----------------------------------------------------------+
+    use_cache = knext.BoolParameter(
+        label="Cache Results",
+        description="Store the results of path, flow, walk and similarity transformations on "
+        "disk and reuse them when the same network is transformed with the same settings. "
+        "Matrix outputs are not cached.",
+        default_value=False,
+        is_advanced=True,
+    )
+    cache_directory = knext.StringParameter(
+        label="Cache Directory",
+        description="Directory of the result cache, empty uses '.knime_networks_cache' in the "
+        "home directory.",
+        default_value="",
+        is_advanced=True,
+    ).rule(
+        knext.OneOf(use_cache, [True]),
+        knext.Effect.SHOW,
+    )
+    cache_size = knext.IntParameter(
+        label="Cache Size (MB)",
+        description="Least recently used results are removed when the cache grows beyond this size.",
+        default_value=1024,
+        min_value=1,
+        is_advanced=True,
+    ).rule(
+        knext.OneOf(use_cache, [True]),
+        knext.Effect.SHOW,
+    )
+
+    # +-----------------------------------------------------------+
+    # Parameter sweep
+    # +-----------------------------------------------------------+
+    sweep_parameter = knext.EnumParameter(
+        label="Sweep Parameter",
+        description="Parameter to sweep. Every sweep value gives one network on the sweep "
+        "output ports, add one port per value.",
+        enum=algo.SweepOptions,
+        default_value=algo.SweepOptions.NONE.name,
+    )
+    sweep_values = knext.StringParameter(
+        label="Sweep Values",
+        description="Comma separated values of the swept parameter, e.g. '1, 2, 5, 10'.",
+        default_value="",
+    ).rule(
+        knext.OneOf(sweep_parameter, [algo.SweepOptions.NONE.name]),
+        knext.Effect.HIDE,
+    )
+
     def validate(self, values: dict):
-        match values["transform_type"]:
-            case algo.TransformOptions.RESCALE.name:
-                a = values["interval_a"]
-                b = values["interval_b"]
-                if a >= b:
-                    raise ValueError(
-                        "For interval [a,b], a must be less than b for Min-Max rescaling."
-                    )
-            case algo.TransformOptions.FILTER.name:
-                if values["filter_threshold"] == algo.ThresholdOptions.PERCENTILE_THRESHOLD.name and (
-                    values["filter_value"] < 0 or values["filter_value"] > 1
-                ):
-                    raise ValueError(
-                        "For absolute threshold filtering, the filter value must be non-negative."
-                    )
+        settings = SimpleNamespace(**values)
+        algo.validate_transform(settings)
+        algo.parse_sweep_values(settings.sweep_values, settings.sweep_parameter, settings)
 
 @knext.node(
     name="Network Transformation",
@@ -279,6 +648,11 @@ class NetworkTransformationNodeParameters:
     description="Output transformed network.",
     port_type=network_port_type,
 )
+@knext.output_port_group(
+    name="Sweep Networks",
+    description="One transformed network per sweep value, in the order of the values.",
+    port_type=network_port_type,
+)
 class NetworkTransformationNode(knext.PythonNode):
     settings = NetworkTransformationNodeParameters()
 
@@ -286,99 +660,40 @@ class NetworkTransformationNode(knext.PythonNode):
         self,
         configure_context: knext.ConfigurationContext,
         input_schema: NetworkPortObjectSpec,
-    ) -> NetworkPortObjectSpec:
-        return algo.get_transform_schema(
+    ):
+        try:
+            values = algo.parse_sweep_values(
+                self.settings.sweep_values, self.settings.sweep_parameter, self.settings
+            )
+        except ValueError as e:
+            raise knext.InvalidParametersError(str(e))
+        # number of ports of every output, the sweep networks are the second
+        sweep_ports = configure_context.get_connected_output_port_numbers()[1]
+        if sweep_ports != len(values):
+            raise knext.InvalidParametersError(
+                f"The sweep has {len(values)} value(s) but {sweep_ports} sweep output "
+                "port(s) are added, add one Sweep Networks port per sweep value."
+            )
+        schema = algo.get_transform_schema(
             input_schema,
             settings=self.settings,
         )
+        return schema, [schema] * len(values)
 
-    def execute(
-        self, exec_context: knext.ExecutionContext, input: NetworkPortObject
-    ) -> NetworkPortObject:
-        self.network = input.get_network()
-        self.source_label = input.get_source_label()
-        self.target_label = input.get_target_label()
-        self.weight_label = input.get_weight_label()
-        self.symmetric = input.is_symmetric()
-        self.two_mode = input.is_two_mode()
-
-        match self.settings.transform_type:
-            case algo.TransformOptions.DISTANCE.name:
-                return algo.distance_transform(input)
-            case algo.TransformOptions.REACHABILITY.name:
-                if self.settings.set_k:
-                    return algo.k_reachability_transform(
-                        input, max_step=self.settings.k_value
-                    )
-                else:
-                    return algo.reachability_transform(input)
-            case algo.TransformOptions.DEPENDENCY.name:
-                return algo.dependency_transform(input)
-            case algo.TransformOptions.MAX_FLOW.name:
-                raise algo.max_flow_transform(input)
-            case algo.TransformOptions.IDENTITY.name:
-                return algo.identity_transform(input)
-            case algo.TransformOptions.RESCALE.name:
-                match self.settings.rescale_method:
-                    case algo.RescaleOptions.GLOBAL_MIN_MAX.name:
-                        return algo.min_max_rescale_transform(
-                            input,
-                            a=self.settings.interval_a,
-                            b=self.settings.interval_b,
-                        )
-                    case algo.RescaleOptions.RANDOM_WALK.name:
-                        return algo.row_normalize_transform(
-                            input,
-                            degree_type=self.settings.degree_type.name,
-                        )
-                    case algo.RescaleOptions.DEGREE_SUM.name:
-                        return algo.degree_sum_rescale_transform(
-                            input,
-                            degree_type=self.settings.degree_type.name,
-                        )
-                    case algo.RescaleOptions.DEGREE_PROD.name:
-                        return algo.degree_prod_rescale_transform(
-                            input,
-                            degree_type=self.settings.degree_type.name,
-                        )
-                    case algo.RescaleOptions.INVERSE.name:
-                        return algo.inverse_transform(
-                            input,
-                            epsilon=self.settings.epsilon,
-                        )
-                    case algo.RescaleOptions.LOG.name:
-                        return algo.log_transform(
-                            input,
-                            base=self.settings.log_base,
-                            epsilon=self.settings.epsilon,
-                        )
-                    case _:
-                        raise ValueError("Invalid rescale method selected.")
-            case algo.TransformOptions.SYMMETRY.name:
-                match self.settings.symmetrization_method:
-                    case algo.SymmetrizationOptions.SUM.name:
-                        return algo.sum_symmetrize_transform(input)
-                    case algo.SymmetrizationOptions.AVERAGE.name:
-                        return algo.average_symmetrize_transform(input)
-                    case algo.SymmetrizationOptions.MAX.name:
-                        return algo.max_symmetrize_transform(input)
-                    case algo.SymmetrizationOptions.MIN.name:
-                        return algo.min_symmetrize_transform(input)
-                    case algo.SymmetrizationOptions.BIN_OR.name:
-                        return algo.bin_or_symmetrize_transform(input)
-                    case algo.SymmetrizationOptions.BIN_AND.name:
-                        return algo.bin_and_symmetrize_transform(input)
-                    case _:
-                        raise ValueError("Invalid symmetrization method selected.")
-            case algo.TransformOptions.FILTER.name:
-                return algo.filter_transform(
-                    input,
-                    degree_type=self.settings.degree_type.name,
-                    filter_type=self.settings.filter_type.name,
-                    filter_threshold=self.settings.filter_threshold.name,
-                    filter_mode=self.settings.filter_mode.name,
-                    filter_value=self.settings.filter_value,
-                    strength_mode=self.settings.strength_mode,
-                )
-            case _:
-                raise ValueError("Invalid transformation type selected.")
+    def execute(self, exec_context: knext.ExecutionContext, input: NetworkPortObject):
+        values = algo.parse_sweep_values(
+            self.settings.sweep_values, self.settings.sweep_parameter, self.settings
+        )
+        sweeps = algo.sweep_transform(
+            input, self.settings, self.settings.sweep_parameter, values
+        )
+        if self.settings.use_cache:
+            output = algo.cached_transform(
+                input,
+                self.settings,
+                directory=self.settings.cache_directory,
+                max_mb=self.settings.cache_size,
+            )
+        else:
+            output = algo.apply_transform(input, self.settings)
+        return output, sweeps
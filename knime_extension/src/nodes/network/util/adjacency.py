@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from util.port_objects import NetworkPortObject
+
+
+def encode_network(networkObj: NetworkPortObject):
+    """
+    Encodes the source and target labels of a network as integer ids.
+    One-mode networks share one node index, two-mode networks get one index per mode.
+    Returns (row_labels, col_labels, src_ids, tgt_ids, weights).
+    """
+    df = networkObj.get_network()
+    src = df[networkObj.get_source_label()]
+    tgt = df[networkObj.get_target_label()]
+    weights = df[networkObj.get_weight_label()].to_numpy()
+
+    if networkObj.is_two_mode():
+        src_ids, row_labels = pd.factorize(src)
+        tgt_ids, col_labels = pd.factorize(tgt)
+    else:
+        ids, labels = pd.factorize(pd.concat([src, tgt], ignore_index=True))
+        src_ids, tgt_ids = ids[: len(src)], ids[len(src) :]
+        row_labels = col_labels = labels
+
+    return row_labels, col_labels, src_ids, tgt_ids, weights
+
+
+def adjacency_matrix(
+    networkObj: NetworkPortObject, weighted: bool = True
+) -> tuple[pd.Index, pd.Index, sp.csr_matrix]:
+    """
+    Builds the CSR adjacency matrix of a network.
+    Symmetric networks are mirrored, duplicate edges keep the last value (like networkx).
+    With weighted=False all stored entries are set to 1.
+    Returns (row_labels, col_labels, matrix).
+    """
+    row_labels, col_labels, src_ids, tgt_ids, weights = encode_network(networkObj)
+    if weighted:
+        if not pd.api.types.is_numeric_dtype(weights):
+            raise ValueError("Weight column must be numeric.")
+        data = weights.astype(np.float64)
+    else:
+        data = np.ones(len(src_ids), dtype=np.float64)
+
+    if networkObj.is_symmetric() and not networkObj.is_two_mode():
+        # interleave both directions so that the last edge of a pair wins either way
+        src_ids, tgt_ids = (
+            np.column_stack([src_ids, tgt_ids]).ravel(),
+            np.column_stack([tgt_ids, src_ids]).ravel(),
+        )
+        data = np.repeat(data, 2)
+
+    n_rows, n_cols = len(row_labels), len(col_labels)
+    # keep the last occurrence of every (source, target) pair
+    keys = src_ids.astype(np.int64) * n_cols + tgt_ids
+    _, last = np.unique(keys[::-1], return_index=True)
+    keep = len(keys) - 1 - last
+
+    matrix = sp.csr_matrix(
+        (data[keep], (src_ids[keep], tgt_ids[keep])), shape=(n_rows, n_cols)
+    )
+    return row_labels, col_labels, matrix
+
+
+def segment_ranks(indptr: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Rank of every value within its CSR row segment, largest first and starting at 0.
+    Equal values keep their order in the segment, missing values rank last.
+    """
+    segments = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    order = np.lexsort((-values, segments))
+    ranks = np.empty(len(values), dtype=np.int64)
+    ranks[order] = np.arange(len(values)) - indptr[segments[order]]
+    return ranks
+
+
+def top_k_mask(indptr: np.ndarray, values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Marks the k largest values of every CSR row segment with one rank cut over all segments.
+    Ties at the k-th value keep the values that come first in the segment.
+    """
+    return segment_ranks(indptr, values) < k
@@ -0,0 +1,257 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+import pandas as pd
+
+from nodes.network.util.options_transform import TransformOptions, WalkOptions
+from nodes.network.util.pipeline import apply_transform
+from util.port_objects import (
+    NetworkPortObject,
+    NetworkPortObjectSpec,
+    NetworkSnapshots,
+    SpilledEdges,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# bump when the stored format or a cached transform changes its output
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".knime_networks_cache")
+
+# transforms worth caching, the others are cheaper than reading the result back
+CACHED_TRANSFORMS = [
+    TransformOptions.DISTANCE.name,
+    TransformOptions.REACHABILITY.name,
+    TransformOptions.DEPENDENCY.name,
+    TransformOptions.MAX_FLOW.name,
+    TransformOptions.BOTTLENECK.name,
+    TransformOptions.RELIABILITY.name,
+    TransformOptions.WALK.name,
+    TransformOptions.SIMILARITY.name,
+]
+# settings of the all-pairs transforms that change their output
+ALL_PAIRS_SETTINGS = ["split_components", "matrix_output"]
+
+SNAPSHOT_START = "__snapshot_start"
+SNAPSHOT_END = "__snapshot_end"
+
+
+def cache_key(networkObj: NetworkPortObject, settings) -> str:
+    """
+    Content hash of a network and the transform settings.
+    The edge list is hashed with pandas' vectorized row hash, the digests are combined
+    with BLAKE2b.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(str(CACHE_VERSION).encode())
+    h.update(json.dumps(networkObj.spec.serialize(), sort_keys=True).encode())
+    df = networkObj.get_network()
+    h.update(json.dumps([str(col) for col in df.columns]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    snapshots = networkObj.get_snapshots()
+    if snapshots is not None:
+        h.update(json.dumps(snapshots.labels).encode())
+        h.update(snapshots.start.tobytes())
+        h.update(snapshots.end.tobytes())
+    h.update(json.dumps(result_settings(settings), sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+def result_settings(settings) -> dict:
+    """
+    Settings the cached transform reads in apply_transform, without the ones that only
+    change its speed or memory use (workers, block sizes, spilling, max_share).
+    """
+    keys = ["transform_type"]
+    match settings.transform_type:
+        case TransformOptions.DISTANCE.name:
+            keys += ["engine", *ALL_PAIRS_SETTINGS]
+        case TransformOptions.REACHABILITY.name if settings.set_k:
+            keys += ["set_k", "k_value"]
+        case TransformOptions.REACHABILITY.name:
+            keys += ["set_k", "engine", *ALL_PAIRS_SETTINGS]
+        case (
+            TransformOptions.DEPENDENCY.name
+            | TransformOptions.MAX_FLOW.name
+            | TransformOptions.BOTTLENECK.name
+            | TransformOptions.RELIABILITY.name
+        ):
+            keys += ALL_PAIRS_SETTINGS
+        case TransformOptions.WALK.name:
+            keys += ["walk_method", "k_value"]
+            if settings.walk_method == WalkOptions.ATTENUATED_WALK.name:
+                keys.append("walk_attenuation")
+        case TransformOptions.SIMILARITY.name:
+            keys += ["similarity_method", "degree_type", "similarity_threshold", "set_top_k"]
+            if settings.set_top_k:
+                keys.append("top_k")
+    values = {key: getattr(settings, key) for key in keys}
+    if settings.transform_type == TransformOptions.DISTANCE.name:
+        # only set by pipelines that push a distance filter into the search
+        values["cutoff"] = getattr(settings, "cutoff", None)
+    return values
+
+
+class ResultCache:
+    """
+    Directory of transform results stored as Parquet files named by their cache key.
+    Reading an entry refreshes its modification time; after every write the least
+    recently used entries are removed until the directory fits max_bytes.
+    Edge lists spilled to disk are written chunk by chunk and read back as a spilled copy
+    of the entry, matrix results are not cached.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.parquet")
+
+    def get(self, key: str) -> NetworkPortObject | None:
+        import pyarrow.parquet as pq
+
+        path = self.path(key)
+        try:
+            meta = json.loads(pq.read_schema(path).metadata[b"network"])
+            spec = NetworkPortObjectSpec.deserialize(meta["spec"])
+            if meta["spilled"]:
+                # the result stays on disk, in a copy owned by the port object
+                network = self._spilled_copy(path)
+            else:
+                table = pq.read_table(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            LOGGER.warning(f"Dropping unreadable cache entry {key}: {e}")
+            self._remove(path)
+            return None
+        os.utime(path)
+
+        if meta["spilled"]:
+            return NetworkPortObject(spec, network)
+        df = table.to_pandas()
+        snapshots = None
+        if meta["snapshots"] is not None:
+            snapshots = NetworkSnapshots(
+                meta["snapshots"],
+                df.pop(SNAPSHOT_START).to_numpy(),
+                df.pop(SNAPSHOT_END).to_numpy(),
+            )
+        return NetworkPortObject(spec, df, snapshots)
+
+    def put(self, key: str, networkObj: NetworkPortObject) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if networkObj.is_matrix():
+            # converting would replace the matrix of the returned result by an edge list
+            LOGGER.info("Result not cached, matrix results are kept as they are.")
+            return
+        snapshots = networkObj.get_snapshots()
+        meta = {
+            "spec": networkObj.spec.serialize(),
+            "snapshots": None if snapshots is None else snapshots.labels,
+            # snapshot results are never spilled, their edge lists are concatenated
+            "spilled": networkObj.is_spilled() and snapshots is None,
+        }
+        metadata = {b"network": json.dumps(meta).encode()}
+        # write to a temporary file first, so readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        writer = None
+        try:
+            start = 0
+            for chunk in networkObj.get_network_chunks():
+                chunk = chunk.reset_index(drop=True)
+                if snapshots is not None:
+                    rows = slice(start, start + len(chunk))
+                    chunk = chunk.assign(
+                        **{
+                            SNAPSHOT_START: snapshots.start[rows],
+                            SNAPSHOT_END: snapshots.end[rows],
+                        }
+                    )
+                start += len(chunk)
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    schema = table.schema.with_metadata(
+                        {**(table.schema.metadata or {}), **metadata}
+                    )
+                    writer = pq.ParquetWriter(tmp, schema)
+                writer.write_table(table.cast(writer.schema))
+            if writer is None:
+                # without a chunk there are no columns to store
+                LOGGER.info("Result not cached, it has no edges.")
+                return
+            writer.close()
+            writer = None
+            os.replace(tmp, self.path(key))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            LOGGER.warning(f"Result not cached, its columns cannot be stored: {e}")
+            return
+        finally:
+            if writer is not None:
+                writer.close()
+            self._remove(tmp)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".parquet"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            LOGGER.info(f"Evicted cache entry {os.path.basename(path)}.")
+
+    @staticmethod
+    def _spilled_copy(path: str) -> SpilledEdges:
+        import pyarrow.parquet as pq
+
+        fd, copy = tempfile.mkstemp(prefix="knime_networks_", suffix=".parquet")
+        os.close(fd)
+        shutil.copyfile(path, copy)
+        return SpilledEdges(copy, pq.ParquetFile(copy).metadata.num_rows)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def cached_transform(
+    networkObj: NetworkPortObject,
+    settings,
+    directory: str = "",
+    max_mb: int = 1024,
+) -> NetworkPortObject:
+    """
+    Runs apply_transform through the result cache in directory (default
+    ~/.knime_networks_cache) holding at most max_mb megabytes.
+    Transforms that are not in CACHED_TRANSFORMS run without the cache.
+    """
+    if settings.transform_type not in CACHED_TRANSFORMS:
+        return apply_transform(networkObj, settings)
+    cache = ResultCache(directory or DEFAULT_CACHE_DIRECTORY, max_mb * 1024 * 1024)
+    key = cache_key(networkObj, settings)
+    result = cache.get(key)
+    if result is not None:
+        LOGGER.info(f"Cache hit {key} for {settings.transform_type}.")
+        return result
+    LOGGER.info(f"Cache miss {key} for {settings.transform_type}.")
+    result = apply_transform(networkObj, settings)
+    cache.put(key, result)
+    return result
@@ -0,0 +1,87 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+
+from nodes.network.util import parallel
+from util.port_objects import (
+    NetworkPortObject,
+    NetworkPortObjectSpec,
+)
+
+
+def component_labels(networkObj: NetworkPortObject) -> np.ndarray:
+    """
+    Labels the weakly connected component of every edge.
+    Nodes are matched by label across the source and target column, like in networkx.
+    """
+    df = networkObj.get_network()
+    src = df[networkObj.get_source_label()]
+    tgt = df[networkObj.get_target_label()]
+    ids, labels = pd.factorize(pd.concat([src, tgt], ignore_index=True))
+    src_ids, tgt_ids = ids[: len(df)], ids[len(df) :]
+
+    n = len(labels)
+    A = sp.csr_matrix((np.ones(len(df)), (src_ids, tgt_ids)), shape=(n, n))
+    _, node_components = connected_components(A, directed=True, connection="weak")
+    return node_components[src_ids]
+
+
+def split_components(networkObj: NetworkPortObject) -> list[NetworkPortObject]:
+    """
+    Splits a network into one network per weakly connected component, largest first.
+    """
+    df = networkObj.get_network()
+    edge_components = component_labels(networkObj)
+    order = np.argsort(edge_components, kind="stable")
+    sizes = np.bincount(edge_components)
+    parts = np.split(order, np.cumsum(sizes)[:-1])
+    parts.sort(key=len, reverse=True)
+    return [NetworkPortObject(networkObj.spec, df.iloc[rows]) for rows in parts]
+
+
+def component_transform(
+    networkObj: NetworkPortObject,
+    transform,
+    transform_args: dict | None = None,
+    workers: int = 0,
+) -> NetworkPortObject:
+    """
+    Runs transform(component, **transform_args) on every weakly connected component and
+    concatenates the results. Only valid for transforms where node pairs in different
+    components have no relation (distance, reachability, dependency, max flow, ...),
+    such pairs are not computed and do not appear in the output.
+    Components are submitted to a process pool largest-first.
+    """
+    kwargs = transform_args or {}
+    components = split_components(networkObj)
+    if len(components) == 1:
+        return transform(networkObj, **kwargs)
+
+    workers = min(parallel.resolve_workers(workers), len(components))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    _run_component, transform, c.spec.serialize(), c.get_network(), kwargs
+                )
+                for c in components
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [
+            _run_component(transform, c.spec.serialize(), c.get_network(), kwargs)
+            for c in components
+        ]
+
+    spec_data = results[0][0]
+    df = pd.concat([result for _, result in results], ignore_index=True)
+    return NetworkPortObject(NetworkPortObjectSpec.deserialize(spec_data), df)
+
+
+def _run_component(transform, spec_data: dict, df: pd.DataFrame, kwargs: dict):
+    component = NetworkPortObject(NetworkPortObjectSpec.deserialize(spec_data), df)
+    result = transform(component, **kwargs)
+    return result.spec.serialize(), result.get_network()
@@ -0,0 +1,143 @@
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from nodes.network.util.adjacency import encode_network
+from util.port_objects import NetworkPortObject
+
+
+def peeling_order(networkObj: NetworkPortObject, degree_type: str):
+    """
+    Encodes a network for core decomposition.
+    Returns (n, src_ids, tgt_ids, removed, affected, weights): removing node removed[i]
+    lowers the degree (strength) of node affected[i] by one (weights[i]).
+    Two-mode networks get separate ids for both modes.
+    The degree type selects which edges count for a node in directed networks:
+    out-edges ("OUT"), in-edges ("IN") or both ("TOTAL"). Symmetric networks always use both.
+    Every pair (unordered in symmetric networks) counts once, duplicate rows use the
+    weight of the last one like a networkx graph built from the edge list.
+    """
+    row_labels, col_labels, src_ids, tgt_ids, weights = encode_network(networkObj)
+    n = len(row_labels)
+    if networkObj.is_two_mode():
+        tgt_ids = tgt_ids + len(row_labels)
+        n += len(col_labels)
+
+    keep = unique_pairs(n, src_ids, tgt_ids, networkObj.is_symmetric())
+    sources, targets, weights = src_ids[keep], tgt_ids[keep], weights[keep]
+    if networkObj.is_symmetric() or degree_type == "TOTAL":
+        removed = np.concatenate([sources, targets])
+        affected = np.concatenate([targets, sources])
+        weights = np.concatenate([weights, weights])
+    elif degree_type == "OUT":
+        # removing a target lowers the out-degree of its source
+        removed, affected = targets, sources
+    elif degree_type == "IN":
+        removed, affected = sources, targets
+    else:
+        raise ValueError(f"Unknown degree_type: {degree_type}")
+    return n, src_ids, tgt_ids, removed, affected, weights
+
+
+def unique_pairs(
+    n: int, src_ids: np.ndarray, tgt_ids: np.ndarray, symmetric: bool
+) -> np.ndarray:
+    """
+    Sorted positions of the last row of every (source, target) pair, of every unordered
+    pair if symmetric.
+    """
+    if symmetric:
+        src_ids, tgt_ids = np.minimum(src_ids, tgt_ids), np.maximum(src_ids, tgt_ids)
+    keys = src_ids.astype(np.int64) * n + tgt_ids
+    _, last = np.unique(keys[::-1], return_index=True)
+    return np.sort(len(keys) - 1 - last)
+
+
+def k_core_numbers(n: int, removed: np.ndarray, affected: np.ndarray) -> np.ndarray:
+    """
+    Core numbers with the bucket-queue algorithm of Batagelj and Zaversnik in O(n + m).
+    Nodes are kept in an array sorted by current degree with the start of every degree bucket,
+    so the node with the smallest degree is removed and its neighbors move down one bucket
+    in constant time.
+    """
+    order = np.argsort(removed, kind="stable")
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(removed, minlength=n))]).tolist()
+    neighbors = affected[order].tolist()
+    degree = np.bincount(affected, minlength=n)
+
+    vert = np.argsort(degree, kind="stable").tolist()
+    counts = np.bincount(degree) if n else np.zeros(1, dtype=np.int64)
+    bucket = np.concatenate([[0], np.cumsum(counts)[:-1]]).tolist()
+    pos = np.empty(n, dtype=np.int64)
+    pos[vert] = np.arange(n)
+    pos = pos.tolist()
+    degree = degree.tolist()
+
+    for i in range(n):
+        v = vert[i]
+        for u in neighbors[indptr[v] : indptr[v + 1]]:
+            if degree[u] > degree[v]:
+                # swap u with the first node of its bucket and shrink the bucket
+                du, pu = degree[u], pos[u]
+                pw = bucket[du]
+                w = vert[pw]
+                if u != w:
+                    vert[pu], vert[pw] = w, u
+                    pos[u], pos[w] = pw, pu
+                bucket[du] += 1
+                degree[u] -= 1
+    return np.asarray(degree)
+
+
+def s_core_numbers(
+    n: int, removed: np.ndarray, affected: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """
+    Weighted core numbers (s-cores): a node belongs to the s-core if it keeps a strength of
+    at least s after repeatedly removing all nodes with a smaller strength.
+    Strengths are real valued, so a heap with lazy updates replaces the buckets, O(m log n).
+    """
+    order = np.argsort(removed, kind="stable")
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(removed, minlength=n))]).tolist()
+    neighbors = affected[order].tolist()
+    edge_weights = weights[order].tolist()
+    strength = np.bincount(affected, weights=weights, minlength=n).tolist()
+
+    heap = [(s, v) for v, s in enumerate(strength)]
+    heapq.heapify(heap)
+    done = [False] * n
+    core = [0.0] * n
+    level = -np.inf
+    while heap:
+        s, v = heapq.heappop(heap)
+        if done[v] or s != strength[v]:
+            continue
+        done[v] = True
+        level = max(level, s)
+        core[v] = level
+        for u, w in zip(
+            neighbors[indptr[v] : indptr[v + 1]], edge_weights[indptr[v] : indptr[v + 1]]
+        ):
+            if not done[u]:
+                strength[u] -= w
+                heapq.heappush(heap, (strength[u], u))
+    return np.asarray(core)
+
+
+def core_numbers(networkObj: NetworkPortObject, degree_type: str, weighted: bool = False):
+    """
+    Computes the k-core (or with weighted=True the s-core) number of every node.
+    Returns (cores, src_ids, tgt_ids) with the core number per encoded node and the
+    encoded endpoints of every edge.
+    """
+    n, src_ids, tgt_ids, removed, affected, weights = peeling_order(networkObj, degree_type)
+    if weighted:
+        if not pd.api.types.is_numeric_dtype(weights):
+            raise ValueError("Weight column must be numeric.")
+        if (weights < 0).any():
+            raise ValueError("Weight column must be non-negative.")
+        cores = s_core_numbers(n, removed, affected, weights.astype(np.float64))
+    else:
+        cores = k_core_numbers(n, removed, affected)
+    return cores, src_ids, tgt_ids
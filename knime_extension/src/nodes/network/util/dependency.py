@@ -4,16 +4,23 @@ from networkx.algorithms.centrality.betweenness import (
     _single_source_shortest_path_basic,
     _single_source_dijkstra_path_basic,
 )
+from nodes.network.util.matrix import collect_matrix
+from nodes.network.util.spill import collect_rows
 from util.port_objects import (
     NetworkPortObject,
     NetworkPortObjectSpec,
 )
 
-def dependency_transform(networkObj: NetworkPortObject) -> NetworkPortObject:
+def dependency_transform(
+    networkObj: NetworkPortObject, spill_mb: int | None = None, matrix: bool = False
+) -> NetworkPortObject:
     """
     Compute δ_s(v) for all ordered pairs (s,v) in a NetworkX graph G.
     Returns a new complete network where an edge (v,s) = δ_s(v).
     If weight is None, unweighted shortest paths are used; otherwise, weighted.
+    With spill_mb the edges are written to a temporary file in chunks of about spill_mb
+    megabytes instead of being collected in memory.
+    With matrix the dependencies are written into a dense NetworkMatrix instead.
     """
     source_label = networkObj.get_source_label()
     target_label = networkObj.get_target_label()
@@ -41,9 +48,35 @@ def dependency_transform(networkObj: NetworkPortObject) -> NetworkPortObject:
         create_using=nx.Graph() if networkObj.is_symmetric() else nx.DiGraph(),
     )
 
-    nodes = list(G.nodes())
-    newGraph = nx.DiGraph()
+    rows = _dependency_rows(G, weight_label)
+    if matrix:
+        df = collect_matrix(rows, list(G.nodes))
+    else:
+        df = collect_rows(
+            rows,
+            [source_label, target_label, "dependency"],
+            spill_mb=spill_mb,
+            dtypes={"dependency": "float64"},
+        )
+
+    return NetworkPortObject(
+        NetworkPortObjectSpec(
+            source_label=source_label,
+            target_label=target_label,
+            weight_label="dependency",
+            irreflexive=networkObj.is_irreflexive(),
+            symmetric=False, 
+            two_mode=networkObj.is_two_mode(),
+        ),
+        df,
+    )
 
+
+def _dependency_rows(G, weight_label):
+    """
+    Yields the (v, s, δ_s(v)) rows, one source s at a time.
+    """
+    nodes = list(G.nodes())
     for s in nodes:
         # Use NetworkX's internal shortest-path routine to get S, P, sigma
         if weight_label is None:
@@ -58,18 +91,4 @@ def dependency_transform(networkObj: NetworkPortObject) -> NetworkPortObject:
             for u in P[w]:
                 delta[u] += (sigma[u] / sigma[w]) * (1.0 + delta[w])
             if w != s:
-                newGraph.add_edge(w, s, dependency=delta[w])
-
-    df = nx.to_pandas_edgelist(newGraph, source=source_label, target=target_label)
-
-    return NetworkPortObject(
-        NetworkPortObjectSpec(
-            source_label=source_label,
-            target_label=target_label,
-            weight_label="dependency",
-            irreflexive=networkObj.is_irreflexive(),
-            symmetric=False, 
-            two_mode=networkObj.is_two_mode(),
-        ),
-        df,
-    )
+                yield w, s, delta[w]
@@ -1,6 +1,9 @@
 import pandas as pd
 import networkx as nx
 
+from nodes.network.util import parallel
+from nodes.network.util.matrix import collect_matrix
+from nodes.network.util.spill import collect_rows
 from util.port_objects import (
     NetworkPortObject,
     NetworkPortObjectSpec,
@@ -8,9 +11,21 @@ from util.port_objects import (
 
 
 
-def distance_transform(networkObj: NetworkPortObject) -> NetworkPortObject:
+def distance_transform(
+    networkObj: NetworkPortObject,
+    workers: int = 1,
+    cutoff: float | None = None,
+    spill_mb: int | None = None,
+    matrix: bool = False,
+) -> NetworkPortObject:
     """
     Computes the distance transform of a network.
+    Networks with a constant weight use breadth-first search instead of Dijkstra.
+    With workers > 1 the sources are distributed over a process pool.
+    With a cutoff the searches stop early and only distances <= cutoff are returned.
+    With spill_mb the distances are written to a temporary file in chunks of about spill_mb
+    megabytes instead of being collected in memory.
+    With matrix the distances are written into a dense NetworkMatrix instead.
     The output is a NetworkPortObject with the distances between all nodes.
     """
     source_label = networkObj.get_source_label()
@@ -35,26 +50,22 @@ def distance_transform(networkObj: NetworkPortObject) -> NetworkPortObject:
         create_using=nx.Graph() if networkObj.is_symmetric() else nx.DiGraph(),
     )
 
-    all_pairs_distances = dict(
-        nx.all_pairs_dijkstra_path_length(G, weight=weight_label)
-    )
-    edges = [
-        (source, target, distance)
-        for source, targets in all_pairs_distances.items()
-        for target, distance in targets.items()
-        if source != target
-    ]
-    df = pd.DataFrame(edges, columns=[source_label, target_label, "distance"])
-    if networkObj.is_symmetric():
-        df_sorted = df.apply(
-            lambda row: sorted([row[source_label], row[target_label]])
-            + [row["distance"]],
-            axis=1,
-            result_type="expand",
+    # a constant weight is a scaled hop count
+    step = df[weight_label].iloc[0] if df[weight_label].nunique() == 1 else None
+    rows = _distance_rows(G, weight_label, step, cutoff, workers)
+    if matrix:
+        # every pair of a symmetric network is found from both ends and fills both halves
+        df = collect_matrix(rows, list(G.nodes))
+    else:
+        if networkObj.is_symmetric():
+            # every pair is found from both ends, keep it once in sorted orientation
+            rows = (row for row in rows if row[0] < row[1])
+        df = collect_rows(
+            rows,
+            [source_label, target_label, "distance"],
+            spill_mb=spill_mb,
+            dtypes={"distance": "float64"},
         )
-        df_sorted.columns = [source_label, target_label, "distance"]
-        df_sorted = df_sorted.drop_duplicates()
-        df = df_sorted
 
     return NetworkPortObject(
         NetworkPortObjectSpec(
@@ -65,4 +76,27 @@ def distance_transform(networkObj: NetworkPortObject) -> NetworkPortObject:
             two_mode=networkObj.is_two_mode(),
         ),
         df,
-    )
\ No newline at end of file
+    )
+
+
+def _distance_rows(G, weight_label, step, cutoff, workers):
+    """
+    Yields the (source, target, distance) rows of all sources, one source (or one chunk
+    of sources of the process pool) at a time.
+    """
+    if workers > 1:
+        for rows in parallel.iter_sources(
+            G, parallel.distance_rows, workers, weight_label, step, cutoff
+        ):
+            yield from rows
+        return
+    if step is not None:
+        lengths = nx.all_pairs_shortest_path_length(
+            G, cutoff=None if cutoff is None else int(cutoff // step)
+        )
+    else:
+        lengths = nx.all_pairs_dijkstra_path_length(G, cutoff=cutoff, weight=weight_label)
+    for source, targets in lengths:
+        for target, distance in targets.items():
+            if source != target:
+                yield source, target, distance if step is None else distance * step
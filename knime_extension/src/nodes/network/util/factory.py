@@ -1,4 +1,5 @@
 import pandas as pd
+from nodes.network.util.snapshots import snapshot_network
 from util.port_objects import (
     NetworkPortObject,
     NetworkPortObjectSpec,
@@ -12,6 +13,8 @@ from util.port_objects import (
 def create_network(table: pd.DataFrame, settings: dict) -> NetworkPortObject:
     """
     Creates a network from a KNIME table.
+    With a snapshot_mode other than "NONE" the edges are sliced into snapshots by the
+    time_label column, see snapshot_network.
     """
     df = table
 
@@ -38,5 +41,15 @@ def create_network(table: pd.DataFrame, settings: dict) -> NetworkPortObject:
         network_table,
     )
 
+    snapshot_mode = settings.get("snapshot_mode", "NONE")
+    if snapshot_mode != "NONE":
+        network_obj = snapshot_network(
+            network_obj,
+            df[settings["time_label"]],
+            snapshot_mode,
+            count=settings.get("snapshot_count", 0),
+            window=settings.get("window_size", 1),
+        )
+
     return network_obj
 
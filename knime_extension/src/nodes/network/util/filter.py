@@ -1,6 +1,9 @@
 import pandas as pd
 import numpy as np
-from util.port_objects import NetworkPortObject
+from nodes.network.util.adjacency import segment_ranks
+from nodes.network.util.cores import core_numbers
+from nodes.network.util.sketch import approximate_percentile, threshold_mask
+from util.port_objects import NetworkMatrix, NetworkPortObject
 
 # Filtering transformation function
 def filter_transform(
@@ -10,66 +13,67 @@ def filter_transform(
     filter_threshold: str,
     filter_mode: str,
     filter_value: float,
-    strength_mode: bool
+    strength_mode: bool,
+    top_k: int = 10,
+    alpha: float = 0.05,
+    sketch_size: int = 200,
+    core_columns: bool = False,
 ) -> NetworkPortObject:
     """
     Filter nodes or edges based on user settings:
     - degree_type: "OUT", "IN", or "TOTAL" for node strength calculation
-    - filter_type: "NODE" or "EDGE"
-    - filter_threshold: "ABSOLUTE_THRESHOLD" or "PERCENTILE_THRESHOLD"
+    - filter_type: "NODE", "EDGE", "CORE", "TOP_K" or "BACKBONE"
+    - filter_threshold: "ABSOLUTE_THRESHOLD", "PERCENTILE_THRESHOLD" or "APPROX_PERCENTILE_THRESHOLD"
     - filter_mode: "GREATER" or "LESS"
-    - filter_value: threshold value or percentile
-    - strength_mode: if True and filter_type=="NODE", filter on node strength; otherwise filter on degree
+    - filter_value: threshold value or percentile (0-100)
+    - strength_mode: if True and filter_type is "NODE" or "CORE", filter on node strength; otherwise filter on degree
+    - top_k: edges kept per node by the "TOP_K" filter, the largest ones for "GREATER"
+    - alpha: significance level of the "BACKBONE" filter
+    - sketch_size: accuracy of the quantile sketch of "APPROX_PERCENTILE_THRESHOLD",
+      the rank error is about 1.7 / sketch_size
+    - core_columns: if True the "CORE" filter adds the core numbers of the edge nodes as
+      the columns "<source>_core" and "<target>_core"
+    "CORE" keeps the nodes with a core number of at least the threshold, the k-core
+    (or s-core with strength_mode) that is stable under removal of the other nodes.
+    For "TOP_K" and "BACKBONE" degree_type selects the edges of a node ("OUT", "IN" or both
+    for "TOTAL"), an edge is kept if it is selected by one of its nodes.
+    "EDGE" filters keep networks stored as a matrix in matrix form.
     """
+    if filter_type == "EDGE" and networkObj.is_matrix():
+        return matrix_edge_filter(
+            networkObj, filter_threshold, filter_mode, filter_value, sketch_size
+        )
     src = networkObj.get_source_label()
     tgt = networkObj.get_target_label()
     wgt = networkObj.get_weight_label()
     df = networkObj.get_network().copy()
 
     if filter_type == "NODE":
-        # Compute node metric: strength or degree based on degree_type
-        if strength_mode:
-            if degree_type == "OUT":
-                node_vals = df.groupby(src)[wgt].sum()
-            elif degree_type == "IN":
-                node_vals = df.groupby(tgt)[wgt].sum()
-            elif degree_type == "TOTAL":
-                node_vals = pd.concat([
-                    df.groupby(src)[wgt].sum(),
-                    df.groupby(tgt)[wgt].sum()
-                ]).groupby(level=0).sum()
-            else:
-                raise ValueError(f"Unknown degree_type: {degree_type}")
-        else:
-            # count of incident edges per node
-            if degree_type == "OUT":
-                node_vals = df[src].value_counts()
-            elif degree_type == "IN":
-                node_vals = df[tgt].value_counts()
-            elif degree_type == "TOTAL":
-                node_vals = pd.concat([
-                    df[src].value_counts(),
-                    df[tgt].value_counts()
-                ]).groupby(level=0).sum()
-            else:
-                raise ValueError(f"Unknown degree_type: {degree_type}")
+        # Compute node metric: strength or degree based on degree_type,
+        # nodes without an edge of that type are dropped
+        index = networkObj.get_node_index()
+        present = index.has_edges(degree_type)
+        node_vals = index.degree(degree_type, strength=strength_mode)[present]
 
         # Determine threshold value
         if filter_threshold == "ABSOLUTE_THRESHOLD":
             thresh = filter_value
         elif filter_threshold == "PERCENTILE_THRESHOLD":
-            thresh = np.percentile(node_vals.values, filter_value)
+            thresh = np.percentile(node_vals, filter_value)
+        elif filter_threshold == "APPROX_PERCENTILE_THRESHOLD":
+            thresh = approximate_percentile(node_vals, filter_value, k=sketch_size)
         else:
             raise ValueError(f"Unknown filter_threshold: {filter_threshold}")
 
         # Select nodes to keep
+        keep_nodes = present.copy()
         if filter_mode == "GREATER":
-            keep_nodes = node_vals[node_vals >= thresh].index
+            keep_nodes[present] = node_vals >= thresh
         else:
-            keep_nodes = node_vals[node_vals <= thresh].index
+            keep_nodes[present] = node_vals <= thresh
 
         # Filter edges where both endpoints are in keep_nodes
-        df = df[df[src].isin(keep_nodes) & df[tgt].isin(keep_nodes)]
+        df = df[keep_nodes[index.src_ids] & keep_nodes[index.tgt_ids]]
         return NetworkPortObject(networkObj.spec, df)
 
     # Edge filtering
@@ -81,6 +85,13 @@ def filter_transform(
             thresh = filter_value
         elif filter_threshold == "PERCENTILE_THRESHOLD":
             thresh = np.percentile(weights.values, filter_value)
+        elif filter_threshold == "APPROX_PERCENTILE_THRESHOLD":
+            # one pass to sketch the weights chunk by chunk, a second one to filter
+            thresh = approximate_percentile(weights.values, filter_value, k=sketch_size)
+            return NetworkPortObject(
+                networkObj.spec,
+                df[threshold_mask(weights.values, thresh, greater=filter_mode == "GREATER")],
+            )
         else:
             raise ValueError(f"Unknown filter_threshold: {filter_threshold}")
 
@@ -92,9 +103,153 @@ def filter_transform(
 
         return NetworkPortObject(networkObj.spec, df)
 
+    elif filter_type == "CORE":
+        cores, src_ids, tgt_ids = core_numbers(networkObj, degree_type, weighted=strength_mode)
+        if filter_threshold == "ABSOLUTE_THRESHOLD":
+            thresh = filter_value
+        elif filter_threshold == "PERCENTILE_THRESHOLD":
+            thresh = np.percentile(cores, filter_value)
+        elif filter_threshold == "APPROX_PERCENTILE_THRESHOLD":
+            thresh = approximate_percentile(cores, filter_value, k=sketch_size)
+        else:
+            raise ValueError(f"Unknown filter_threshold: {filter_threshold}")
+
+        if core_columns:
+            df[f"{src}_core"] = cores[src_ids]
+            df[f"{tgt}_core"] = cores[tgt_ids]
+        df = df[(cores[src_ids] >= thresh) & (cores[tgt_ids] >= thresh)]
+        return NetworkPortObject(networkObj.spec, df)
+
+    elif filter_type == "TOP_K":
+        keep = top_k_edges(networkObj, degree_type, top_k, largest=filter_mode == "GREATER")
+        return NetworkPortObject(networkObj.spec, df[keep])
+
+    elif filter_type == "BACKBONE":
+        keep = disparity_edges(networkObj, degree_type, alpha)
+        return NetworkPortObject(networkObj.spec, df[keep])
+
     else:
         raise ValueError(f"Unknown filter_type: {filter_type}")
 
 
+def matrix_edge_filter(
+    networkObj: NetworkPortObject,
+    filter_threshold: str,
+    filter_mode: str,
+    filter_value: float,
+    sketch_size: int = 200,
+) -> NetworkPortObject:
+    """
+    Edge filter of a network stored as a matrix, dropped entries are set to NaN.
+    Percentiles of symmetric networks are taken over the upper triangle, like for their
+    edge list.
+    """
+    M = networkObj.get_matrix()
+    W = M.values
+    if filter_threshold == "ABSOLUTE_THRESHOLD":
+        thresh = filter_value
+    else:
+        present = ~np.isnan(W)
+        if networkObj.is_symmetric():
+            present = np.triu(present)
+        values = W[present].astype(np.float64)
+        if filter_threshold == "PERCENTILE_THRESHOLD":
+            thresh = np.percentile(values, filter_value)
+        elif filter_threshold == "APPROX_PERCENTILE_THRESHOLD":
+            thresh = approximate_percentile(values, filter_value, k=sketch_size)
+        else:
+            raise ValueError(f"Unknown filter_threshold: {filter_threshold}")
+
+    with np.errstate(invalid="ignore"):
+        keep = W >= thresh if filter_mode == "GREATER" else W <= thresh
+    return NetworkPortObject(
+        networkObj.spec,
+        NetworkMatrix(M.row_labels, M.col_labels, np.where(keep, W, np.nan).astype(W.dtype)),
+    )
+
+
+def edge_ends(networkObj: NetworkPortObject, degree_type: str):
+    """
+    Groups the edge ends of a network by node for per-node edge filters.
+    Returns (groups, rows): every entry is one end of edge rows[i] at node group groups[i].
+    Symmetric networks use both ends of every edge with one group per node,
+    directed networks use the sources ("OUT"), the targets ("IN") or both ("TOTAL"),
+    where out- and in-edges of a node form separate groups.
+    """
+    index = networkObj.get_node_index()
+    src_ids, tgt_ids = index.src_ids, index.tgt_ids
+    rows = np.arange(len(src_ids))
+
+    if networkObj.is_symmetric():
+        return np.concatenate([src_ids, tgt_ids]), np.concatenate([rows, rows])
+    if degree_type == "OUT":
+        return src_ids, rows
+    if degree_type == "IN":
+        return tgt_ids, rows
+    if degree_type == "TOTAL":
+        return np.concatenate([src_ids, tgt_ids + len(index.labels)]), np.concatenate([rows, rows])
+    raise ValueError(f"Unknown degree_type: {degree_type}")
+
+
+def edge_end_ranks(
+    networkObj: NetworkPortObject, degree_type: str, largest: bool = True
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Ranks the edge ends of every node by weight, largest (or smallest) first.
+    Returns (rows, ranks): edge rows[i] has rank ranks[i] at one of its nodes, ties keep the
+    order of the edges. The top-k edges of any k are a cut rank < k.
+    """
+    weights = networkObj.get_network()[networkObj.get_weight_label()].to_numpy()
+    if not pd.api.types.is_numeric_dtype(weights):
+        raise ValueError("Weight column must be numeric.")
+    groups, rows = edge_ends(networkObj, degree_type)
+    order = np.argsort(groups, kind="stable")
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(groups))])
+    values = weights[rows[order]].astype(np.float64)
+    return rows[order], segment_ranks(indptr, values if largest else -values)
+
 
+def top_k_edges(
+    networkObj: NetworkPortObject, degree_type: str, k: int, largest: bool = True
+) -> np.ndarray:
+    """
+    Boolean mask of the edges among the k largest (or smallest) of at least one of their nodes.
+    """
+    rows, ranks = edge_end_ranks(networkObj, degree_type, largest)
+    keep = np.zeros(len(networkObj.get_network()), dtype=bool)
+    keep[rows[ranks < k]] = True
+    return keep
+
+
+def disparity_edges(
+    networkObj: NetworkPortObject, degree_type: str, alpha: float
+) -> np.ndarray:
+    """
+    Boolean mask of the disparity filter backbone.
+    The edge is kept if its p-value is below alpha for at least one of its nodes.
+    """
+    p_values, rows = disparity_p_values(networkObj, degree_type)
+    keep = np.zeros(len(networkObj.get_network()), dtype=bool)
+    keep[rows[p_values < alpha]] = True
+    return keep
+
+
+def disparity_p_values(networkObj: NetworkPortObject, degree_type: str):
+    """
+    p-values of the disparity filter for every edge end, returns (p_values, rows).
+    For an edge end at a node with degree k and strength s the p-value of the edge weight w is
+    (1 - w / s)^(k - 1). Nodes with a single edge never make it significant.
+    """
+    weights = networkObj.get_network()[networkObj.get_weight_label()].to_numpy()
+    if not pd.api.types.is_numeric_dtype(weights):
+        raise ValueError("Weight column must be numeric.")
+    if (weights < 0).any():
+        raise ValueError("Weight column must be non-negative.")
+    groups, rows = edge_ends(networkObj, degree_type)
+    w = weights[rows].astype(np.float64)
+    strength = np.bincount(groups, weights=w)
+    degree = np.bincount(groups)
 
+    with np.errstate(divide="ignore", invalid="ignore"):
+        share = np.where(strength[groups] > 0, w / strength[groups], 0.0)
+    return (1.0 - share) ** (degree[groups] - 1), rows
@@ -0,0 +1,244 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+
+from nodes.network.util import parallel
+from nodes.network.util.distance import distance_transform
+from nodes.network.util.reachability import reachability_transform
+from util.port_objects import NetworkPortObject
+
+LOGGER = logging.getLogger(__name__)
+
+INCREMENTAL_RESULT_LABELS = {
+    "DISTANCE": "distance",
+    "REACHABILITY": "reachable",
+}
+
+
+def edge_keys(df: pd.DataFrame, source_label: str, target_label: str, symmetric: bool):
+    source = df[source_label]
+    target = df[target_label]
+    if symmetric:
+        # an undirected edge matches in both orientations
+        swap = source > target
+        source, target = source.where(~swap, target), target.where(~swap, source)
+    return pd.MultiIndex.from_arrays([source, target])
+
+
+def apply_edge_delta(networkObj: NetworkPortObject, delta: pd.DataFrame):
+    """
+    Applies an edge delta to a network.
+    The delta has the source, target and weight columns of the network: a row with a missing
+    weight deletes the edge, any other row adds the edge or changes its weight.
+    Returns the updated network and the effective changes as (source, target, "old", "new")
+    rows, where a missing old (new) weight marks an added (deleted) edge.
+    """
+    source_label = networkObj.get_source_label()
+    target_label = networkObj.get_target_label()
+    weight_label = networkObj.get_weight_label()
+    symmetric = networkObj.is_symmetric()
+    df = networkObj.get_network()
+
+    delta = delta[[source_label, target_label, weight_label]].reset_index(drop=True)
+    delta_keys = edge_keys(delta, source_label, target_label, symmetric)
+    # the last row of an edge wins
+    delta = delta[~delta_keys.duplicated(keep="last")].reset_index(drop=True)
+    delta_keys = delta_keys[~delta_keys.duplicated(keep="last")]
+
+    keys = edge_keys(df, source_label, target_label, symmetric)
+    if not keys.is_unique:
+        raise ValueError("The network contains duplicate edges.")
+    positions = keys.get_indexer(delta_keys)
+    found = positions >= 0
+
+    old = pd.Series(np.nan, index=delta.index, dtype=object)
+    old[found] = df[weight_label].to_numpy()[positions[found]]
+    new = delta[weight_label].astype(object)
+    deleted = found & new.isna().to_numpy()
+    updated = found & new.notna().to_numpy()
+    added = ~found & new.notna().to_numpy()
+    changed = deleted | added | (updated & (old != new).to_numpy())
+
+    df = df.copy()
+    df.loc[df.index[positions[updated]], weight_label] = delta.loc[
+        updated, weight_label
+    ].to_numpy()
+    df = df.drop(index=df.index[positions[deleted]])
+    df = pd.concat([df, delta.loc[added]], ignore_index=True)
+
+    changes = pd.DataFrame(
+        {
+            source_label: delta[source_label],
+            target_label: delta[target_label],
+            "old": old,
+            "new": new,
+        }
+    )[changed].reset_index(drop=True)
+    return NetworkPortObject(networkObj.spec, df), changes
+
+
+def affected_sources(
+    result: NetworkPortObject, changes: pd.DataFrame, transform: str, symmetric: bool
+) -> set:
+    """
+    Sources whose row of the result can change with the edge changes, found with the
+    previous result only.
+    For distances an added edge (or lowered weight) u -> v matters for a source s if
+    d(s, u) + w < d(s, v), a deleted edge (or raised weight) if it lies on a shortest path
+    from s, d(s, u) + w = d(s, v). For reachability an added edge matters for the sources
+    that reach u but not v, a deleted edge for all sources that reach u.
+    """
+    source_label = result.get_source_label()
+    target_label = result.get_target_label()
+    ends = pd.concat([changes.iloc[:, 0], changes.iloc[:, 1]]).unique()
+
+    prev = result.get_network()
+    prev = pd.DataFrame(
+        {
+            "source": prev[source_label],
+            "target": prev[target_label],
+            "value": prev[result.get_weight_label()],
+        }
+    )
+    changes = changes.set_axis(["u", "v", "old", "new"], axis=1)
+    if symmetric:
+        prev = prev[prev["source"].isin(ends) | prev["target"].isin(ends)]
+        prev = pd.concat(
+            [prev, prev.rename(columns={"source": "target", "target": "source"})]
+        ).drop_duplicates(["source", "target"])
+        changes = pd.concat([changes, changes.rename(columns={"u": "v", "v": "u"})])
+    else:
+        prev = prev[prev["target"].isin(ends)]
+
+    # every source that reaches the tail of a change, the tail itself at distance 0
+    tails = changes["u"].unique()
+    reach = pd.concat(
+        [
+            prev[prev["target"].isin(tails)].set_axis(["source", "u", "d_u"], axis=1),
+            pd.DataFrame({"source": tails, "u": tails, "d_u": 0.0}),
+        ]
+    ).drop_duplicates(["source", "u"], keep="last")
+    pairs = changes.merge(reach, on="u").merge(
+        prev.set_axis(["source", "v", "d_v"], axis=1), on=["source", "v"], how="left"
+    )
+
+    old = pairs["old"]
+    new = pairs["new"]
+    if transform == "DISTANCE":
+        old = old.astype(np.float64)
+        new = new.astype(np.float64)
+        d_u = pairs["d_u"].astype(np.float64)
+        d_v = pairs["d_v"].astype(np.float64).fillna(np.inf)
+        lost = old.notna() & (new.isna() | (new > old)) & np.isclose(d_u + old, d_v)
+        gained = new.notna() & (old.isna() | (new < old)) & (d_u + new < d_v)
+    else:
+        lost = old.notna() & new.isna()
+        gained = old.isna() & new.notna() & pairs["d_v"].isna()
+    return set(pairs.loc[lost | gained, "source"])
+
+
+def _nodes(networkObj: NetworkPortObject) -> pd.Index:
+    df = networkObj.get_network()
+    return pd.Index(
+        pd.concat([df[networkObj.get_source_label()], df[networkObj.get_target_label()]]).unique()
+    )
+
+
+def incremental_transform(
+    networkObj: NetworkPortObject,
+    result: NetworkPortObject,
+    delta: pd.DataFrame,
+    transform: str,
+    max_share: float = 0.2,
+):
+    """
+    Updates a distance or reachability transform result with an edge delta.
+    Only the rows of the affected sources are recomputed; if the delta or the affected
+    sources exceed max_share of the edges or nodes the transform is recomputed from scratch.
+    Returns (updated network, updated result).
+    """
+    if result.get_weight_label() != INCREMENTAL_RESULT_LABELS[transform]:
+        raise ValueError(
+            f"The previous result has no '{INCREMENTAL_RESULT_LABELS[transform]}' values, "
+            "select the transformation that created it."
+        )
+    updated, changes = apply_edge_delta(networkObj, delta)
+    weight_label = updated.get_weight_label()
+    if transform == "DISTANCE":
+        weights = updated.get_network()[weight_label]
+        if not pd.api.types.is_numeric_dtype(weights):
+            raise ValueError("Weight column must be numeric.")
+        if (weights <= 0).any():
+            raise ValueError("Weight column must be positive.")
+    full = distance_transform if transform == "DISTANCE" else reachability_transform
+
+    if len(changes) > max_share * len(networkObj.get_network()):
+        LOGGER.info(f"{len(changes)} edge changes, recomputing the full transform.")
+        return updated, full(updated)
+    nodes = _nodes(updated)
+    old_nodes = _nodes(networkObj)
+    affected = affected_sources(result, changes, transform, updated.is_symmetric())
+    affected |= set(nodes.difference(old_nodes))
+    if len(affected) > max_share * len(nodes):
+        LOGGER.info(f"{len(affected)} affected sources, recomputing the full transform.")
+        return updated, full(updated)
+    LOGGER.info(
+        f"{len(changes)} edge changes, recomputing {len(affected)} of {len(nodes)} sources."
+    )
+    # removed nodes lost all their edges, so every source that reached them is affected
+    removed = set(old_nodes.difference(nodes))
+    return updated, _update_result(updated, result, affected | removed, transform)
+
+
+def _update_result(
+    networkObj: NetworkPortObject, result: NetworkPortObject, affected: set, transform: str
+) -> NetworkPortObject:
+    """
+    Replaces the rows of the affected sources (of both ends for symmetric networks) with
+    rows recomputed on the updated network.
+    """
+    source_label = result.get_source_label()
+    target_label = result.get_target_label()
+    weight_label = networkObj.get_weight_label()
+    symmetric = networkObj.is_symmetric()
+
+    df = networkObj.get_network()
+    G = nx.from_pandas_edgelist(
+        df,
+        source=networkObj.get_source_label(),
+        target=networkObj.get_target_label(),
+        edge_attr=weight_label if transform == "DISTANCE" else None,
+        create_using=nx.Graph() if symmetric else nx.DiGraph(),
+    )
+    sources = [s for s in affected if s in G]
+
+    if transform == "DISTANCE":
+        # a constant weight is a scaled hop count, like in distance_transform
+        step = df[weight_label].iloc[0] if df[weight_label].nunique() == 1 else None
+        rows = parallel.graph_distance_rows(G, sources, weight_label, step)
+    else:
+        rows = []
+        for s in sources:
+            targets = nx.descendants(G, s)
+            if networkObj.is_irreflexive() or G.has_edge(s, s):
+                targets.add(s)
+            rows.extend((s, t, 1) for t in targets)
+    rows = pd.DataFrame(rows, columns=[source_label, target_label, result.get_weight_label()])
+    if symmetric:
+        # pairs are kept once in sorted orientation, pairs of two affected nodes are found twice
+        swap = rows[source_label] > rows[target_label]
+        rows[source_label], rows[target_label] = (
+            rows[source_label].where(~swap, rows[target_label]),
+            rows[target_label].where(~swap, rows[source_label]),
+        )
+        rows = rows.drop_duplicates([source_label, target_label])
+
+    prev = result.get_network()
+    keep = ~prev[source_label].isin(affected)
+    if symmetric:
+        keep &= ~prev[target_label].isin(affected)
+    return NetworkPortObject(
+        result.spec, pd.concat([prev[keep], rows], ignore_index=True)
+    )
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from util.port_objects import NetworkMatrix
+
+
+def collect_matrix(
+    rows, row_labels, col_labels=None, symmetric: bool = False
+) -> NetworkMatrix:
+    """
+    Dense float32 matrix of the (source, target, value) rows of an all-pairs transform,
+    filled row by row without an intermediate edge list. Pairs without a row stay NaN,
+    symmetric results are mirrored.
+    """
+    row_labels = pd.Index(row_labels)
+    col_labels = row_labels if col_labels is None else pd.Index(col_labels)
+    W = np.full((len(row_labels), len(col_labels)), np.nan, dtype=np.float32)
+    row_ids = {label: i for i, label in enumerate(row_labels)}
+    col_ids = row_ids if col_labels is row_labels else {
+        label: i for i, label in enumerate(col_labels)
+    }
+    for source, target, value in rows:
+        W[row_ids[source], col_ids[target]] = value
+        if symmetric:
+            W[col_ids[target], row_ids[source]] = value
+    return NetworkMatrix(row_labels, col_labels, W)
+
+
+def dense_to_matrix(
+    labels: pd.Index, W: np.ndarray, missing, diagonal: bool
+) -> NetworkMatrix:
+    """
+    NetworkMatrix of a dense closure result, entries equal to missing become NaN.
+    """
+    values = np.where(W != missing, W, np.nan).astype(np.float32)
+    if not diagonal:
+        np.fill_diagonal(values, np.nan)
+    return NetworkMatrix(labels, labels, values)
@@ -1,12 +1,22 @@
-import pandas as pd
 import networkx as nx
-from typing import List, Tuple, Any
+from networkx.algorithms.flow import preflow_push
+from nodes.network.util.matrix import collect_matrix
+from nodes.network.util.spill import collect_rows
 from util.port_objects import (
     NetworkPortObject,
     NetworkPortObjectSpec,
 )
 
-def max_flow_transform(input: NetworkPortObject) -> NetworkPortObject:
+def max_flow_transform(
+    input: NetworkPortObject, spill_mb: int | None = None, matrix: bool = False
+) -> NetworkPortObject:
+    """
+    Maximum flow between all node pairs, from a Gomory-Hu tree for symmetric networks.
+    With spill_mb the flows are written to a temporary file in chunks of about spill_mb
+    megabytes instead of being collected in memory.
+    With matrix the flows are written into a dense NetworkMatrix instead, with one row per
+    source and one column per target node.
+    """
     edge_list = input.get_network()
     source_label = input.get_source_label()
     target_label = input.get_target_label()
@@ -30,10 +40,35 @@ def max_flow_transform(input: NetworkPortObject) -> NetworkPortObject:
         mode_u = list(G.nodes())
         mode_v = mode_u
 
-    results: List[Tuple[Any, Any, float]] = []
+    rows = _max_flow_rows(G, mode_u, mode_v, weight_label, symmetric, irreflexive, two_mode)
+    if matrix:
+        df = collect_matrix(rows, mode_u, mode_v)
+    else:
+        df = collect_rows(
+            rows,
+            [source_label, target_label, "max_flow"],
+            spill_mb=spill_mb,
+            dtypes={"max_flow": "float64"},
+        )
+    return NetworkPortObject(
+        NetworkPortObjectSpec(
+            source_label=source_label,
+            target_label=target_label,
+            weight_label="max_flow",
+            irreflexive=irreflexive,
+            symmetric=symmetric,
+            two_mode=two_mode,
+        ),
+        df,
+    )
 
+
+def _max_flow_rows(G, mode_u, mode_v, weight_label, symmetric, irreflexive, two_mode):
+    """
+    Yields the (u, v, flow) rows of all node pairs, one pair at a time.
+    """
     if symmetric:
-        T = nx.gomory_hu_tree(G, capacity="capacity")
+        T = nx.gomory_hu_tree(G, capacity=weight_label)
         def min_cut(u, v):
             path = nx.shortest_path(T, u, v)
             return min(T[a][b]["weight"] for a, b in zip(path, path[1:]))
@@ -45,7 +80,7 @@ def max_flow_transform(input: NetworkPortObject) -> NetworkPortObject:
                 if two_mode and (u not in mode_u or v not in mode_v):
                     continue
                 flow = min_cut(u, v) if (u in T and v in T) else 0.0
-                results.append((u, v, flow))
+                yield u, v, flow
 
     else:
         for u in mode_u:
@@ -56,21 +91,8 @@ def max_flow_transform(input: NetworkPortObject) -> NetworkPortObject:
                     continue
                 try:
                     flow_value, _ = nx.maximum_flow(
-                        G, u, v, capacity="capacity", flow_func=nx.preflow_push
+                        G, u, v, capacity=weight_label, flow_func=preflow_push
                     )
                 except (nx.NetworkXError, nx.NetworkXNoPath):
                     flow_value = 0.0
-                results.append((u, v, flow_value))
-
-    df = pd.DataFrame(results, columns=[source_label, target_label, "max_flow"])
-    return NetworkPortObject(
-        NetworkPortObjectSpec(
-            source_label=source_label,
-            target_label=target_label,
-            weight_label="max_flow",
-            irreflexive=irreflexive,
-            symmetric=symmetric,
-            two_mode=two_mode,
-        ),
-        df,
-    )
\ No newline at end of file
+                yield u, v, flow_value
@@ -15,6 +15,18 @@ class TransformOptions(knext.EnumParameterOptions):
         "Max Flow Transformation",
         "Compute the maximum flow between all node pairs.",
     )
+    BOTTLENECK = (
+        "Bottleneck Transformation",
+        "Compute the widest-path capacity (largest minimum edge weight) between all node pairs.",
+    )
+    RELIABILITY = (
+        "Reliability Transformation",
+        "Compute the most reliable path (largest product of edge probabilities) between all node pairs.",
+    )
+    WALK = (
+        "Walk Transformation",
+        "Compute k-step walk counts, attenuated walks or random-walk probabilities between all node pairs.",
+    )
 
     # Neighborhood-based transformations
     IDENTITY = (
@@ -33,6 +45,48 @@ class TransformOptions(knext.EnumParameterOptions):
         "Filter Transformation",
         "Filter the network relations of each node based on a condition.",
     )
+    SIMILARITY = (
+        "Similarity Transformation",
+        "Compute the neighborhood overlap between node pairs (structural equivalence).",
+    )
+
+
+class PathEngineOptions(knext.EnumParameterOptions):
+    AUTO = (
+        "Automatic",
+        "Pick the engine with the lowest estimated cost based on the size, density, weights and symmetry of the network.",
+    )
+    TRAVERSAL = (
+        "Sparse Traversal",
+        "Run a shortest-path search from every node. Best for large and sparse networks.",
+    )
+    PARALLEL_TRAVERSAL = (
+        "Parallel Traversal",
+        "Run the searches from every node in a pool of worker processes.",
+    )
+    DENSE = (
+        "Dense Path Algebra",
+        "Vectorized Floyd–Warshall on the adjacency matrix. Best for small and dense networks.",
+    )
+    BITSET = (
+        "Bitset Closure",
+        "Transitive closure on a bit-packed adjacency matrix. Reachability only.",
+    )
+
+
+class WalkOptions(knext.EnumParameterOptions):
+    WALK_COUNT = (
+        "Walk Count",
+        "Number (total weight) of walks of exactly k steps, the entries of A^k.",
+    )
+    ATTENUATED_WALK = (
+        "Attenuated Walks",
+        "Katz-style sum of walks up to k steps, each step attenuated by a constant factor.",
+    )
+    TRANSITION_PROBABILITY = (
+        "Transition Probability",
+        "Probability of a random walk to move from one node to another in exactly k steps.",
+    )
 
 
 class RescaleOptions(knext.EnumParameterOptions):
@@ -67,6 +121,25 @@ class SymmetrizationOptions(knext.EnumParameterOptions):
     )
 
 
+class SimilarityOptions(knext.EnumParameterOptions):
+    COMMON_NEIGHBORS = (
+        "Common Neighbors",
+        "Number of neighbors shared by both nodes.",
+    )
+    JACCARD = (
+        "Jaccard",
+        "Shared neighbors divided by the size of the union of both neighborhoods.",
+    )
+    COSINE = (
+        "Cosine",
+        "Shared neighbors divided by the geometric mean of both neighborhood sizes.",
+    )
+    ADAMIC_ADAR = (
+        "Adamic-Adar",
+        "Shared neighbors weighted by the inverse logarithm of their degree.",
+    )
+
+
 class FilterOptions(knext.EnumParameterOptions):
     NODE = (
         "Node Filter",
@@ -76,6 +149,19 @@ class FilterOptions(knext.EnumParameterOptions):
         "Edge Filter",
         "Filter edges based on their weights.",
     )
+    TOP_K = (
+        "Top-k Edges",
+        "Keep the k strongest (or weakest) edges of every node.",
+    )
+    CORE = (
+        "k-Core",
+        "Repeatedly remove nodes with a degree (or strength) below the filter value.",
+    )
+    BACKBONE = (
+        "Disparity Backbone",
+        "Keep the edges whose weight is significant compared to the strength of their node "
+        "(disparity filter by Serrano, Boguñá and Vespignani).",
+    )
 
 
 class ThresholdOptions(knext.EnumParameterOptions):
@@ -87,6 +173,11 @@ class ThresholdOptions(knext.EnumParameterOptions):
         "Percentile Threshold",
         "Filter based on a percentile of weights. For example, 50 means the median weight.",
     )
+    APPROX_PERCENTILE_THRESHOLD = (
+        "Approximate Percentile Threshold",
+        "Filter based on a percentile estimated with a mergeable quantile sketch, "
+        "computed chunk by chunk without sorting all weights.",
+    )
 
 
 class FilterModeOptions(knext.EnumParameterOptions):
@@ -117,3 +208,35 @@ class DegreeTypeOptions(knext.EnumParameterOptions):
     IN = ("In-Degree", "Use in-degree for normalization.")
     OUT = ("Out-Degree", "Use out-degree for normalization.")
     TOTAL = ("Total Degree", "Use total degree (in + out) for normalization.")
+
+
+class SweepOptions(knext.EnumParameterOptions):
+    NONE = ("No Sweep", "Only compute the transformation with the settings above.")
+    FILTER_VALUE = (
+        "Filter Value",
+        "Sweep the threshold of node, edge or core filters. The weights are sorted once for all values.",
+    )
+    FILTER_TOP_K = (
+        "Edges per Node (k)",
+        "Sweep k of the top-k edge filter. The edges of every node are ranked once for all values.",
+    )
+    FILTER_ALPHA = (
+        "Significance Level (alpha)",
+        "Sweep alpha of the backbone filter. The p-values are computed once for all values.",
+    )
+    K_VALUE = (
+        "Maximum Steps (k)",
+        "Sweep the maximum steps of k-reachability (one search per node for all values) "
+        "or the steps of walk transformations.",
+    )
+
+
+class IncrementalOptions(knext.EnumParameterOptions):
+    DISTANCE = (
+        "Distance Transformation",
+        "The previous result is the output of the distance transformation.",
+    )
+    REACHABILITY = (
+        "Reachability Transformation",
+        "The previous result is the output of the reachability transformation (without maximum steps).",
+    )
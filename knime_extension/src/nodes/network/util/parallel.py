@@ -0,0 +1,87 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+
+# graph of the current worker process, set once by the pool initializer
+_graph = None
+
+
+def resolve_workers(workers: int) -> int:
+    """
+    Number of worker processes to use, 0 or less uses all available cores.
+    """
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def map_sources(graph, func, workers: int, *args) -> list:
+    """
+    Runs func(sources, *args) on chunks of the graph nodes in a process pool.
+    The graph is sent once to every worker, the rows returned by the chunks are concatenated.
+    """
+    return [row for rows in iter_sources(graph, func, workers, *args) for row in rows]
+
+
+def iter_sources(graph, func, workers: int, *args):
+    """
+    map_sources yielding the rows of every chunk as soon as it is done, in chunk order.
+    """
+    nodes = list(graph.nodes)
+    n_chunks = max(1, min(len(nodes), workers * 4))
+    chunks = [nodes[i::n_chunks] for i in range(n_chunks)]
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(graph,)
+    ) as pool:
+        yield from pool.map(func, chunks, *[[arg] * n_chunks for arg in args])
+
+
+def _init_worker(graph) -> None:
+    global _graph
+    _graph = graph
+
+
+def distance_rows(sources, weight_label, step, cutoff=None) -> list:
+    """
+    Shortest path lengths from every source, as (source, target, distance) rows.
+    With step set the network is unweighted and a breadth-first search is used.
+    With cutoff set only distances <= cutoff are returned.
+    """
+    return graph_distance_rows(_graph, sources, weight_label, step, cutoff)
+
+
+def graph_distance_rows(graph, sources, weight_label, step, cutoff=None) -> list:
+    """
+    distance_rows on the given graph instead of the graph of the worker process.
+    """
+    rows = []
+    for s in sources:
+        if step is not None:
+            lengths = nx.single_source_shortest_path_length(
+                graph, s, cutoff=None if cutoff is None else int(cutoff // step)
+            )
+            rows.extend((s, t, d * step) for t, d in lengths.items() if t != s)
+        else:
+            lengths = nx.single_source_dijkstra_path_length(
+                graph, s, cutoff=cutoff, weight=weight_label
+            )
+            rows.extend((s, t, d) for t, d in lengths.items() if t != s)
+    return rows
+
+
+def reachability_rows(sources, reflexive) -> list:
+    """
+    Reachable targets of every source, as (source, target) rows.
+    Self-loops are added for all sources if reflexive, otherwise only for existing ones.
+    Undirected graphs list every unordered pair once.
+    """
+    rows = []
+    directed = _graph.is_directed()
+    order = None if directed else {v: i for i, v in enumerate(_graph.nodes)}
+    for s in sources:
+        targets = nx.descendants(_graph, s)
+        if reflexive or _graph.has_edge(s, s):
+            targets.add(s)
+        if not directed:
+            targets = [t for t in targets if order[s] <= order[t]]
+        rows.extend((s, t) for t in targets)
+    return rows
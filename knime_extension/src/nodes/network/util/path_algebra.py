@@ -0,0 +1,267 @@
+import numpy as np
+import pandas as pd
+
+from nodes.network.util.adjacency import adjacency_matrix
+from nodes.network.util.matrix import dense_to_matrix
+from util.port_objects import (
+    NetworkPortObject,
+    NetworkPortObjectSpec,
+    sorted_pairs,
+)
+
+
+class Semiring:
+    """
+    Path algebra (add, mul, zero, one) used by the dense closure.
+    add combines alternative paths, mul extends a path by an edge,
+    zero marks a missing path and one is the neutral element of mul.
+    """
+
+    def __init__(self, add, mul, zero, one, dtype) -> None:
+        self.add = add
+        self.mul = mul
+        self.zero = zero
+        self.one = one
+        self.dtype = dtype
+
+
+# shortest path length
+MIN_PLUS = Semiring(np.minimum, np.add, np.inf, 0.0, np.float64)
+# reachability
+BOOLEAN = Semiring(np.logical_or, np.logical_and, False, True, np.bool_)
+# widest path, the capacity of a path is its weakest edge
+MAX_MIN = Semiring(np.maximum, np.minimum, 0.0, np.inf, np.float64)
+# most reliable path, the reliability of a path is the product of its edges
+MAX_PRODUCT = Semiring(np.maximum, np.multiply, 0.0, 1.0, np.float64)
+
+
+def closure(W: np.ndarray, semiring: Semiring, block_size: int = 1024) -> np.ndarray:
+    """
+    Vectorized Floyd–Warshall over a dense matrix W in the given semiring.
+    W[i, j] holds the edge value or semiring.zero, it is updated in place and returned.
+    The diagonal is not initialized, afterwards W[i, i] is the best closed walk through i.
+    For every pivot k only rows with a path to k are updated, in row blocks of block_size
+    so the temporary arrays stay small.
+    """
+    for k in range(W.shape[0]):
+        pivot_row = W[k].copy()
+        rows = np.flatnonzero(W[:, k] != semiring.zero)
+        for start in range(0, len(rows), block_size):
+            idx = rows[start : start + block_size]
+            W[idx] = semiring.add(W[idx], semiring.mul(W[idx, k, None], pivot_row))
+    return W
+
+
+def dense_matrix(
+    networkObj: NetworkPortObject, semiring: Semiring, weighted: bool = True
+) -> tuple[pd.Index, np.ndarray]:
+    """
+    Builds the dense n×n matrix of a one-mode network filled with the semiring zero.
+    """
+    labels, _, A = adjacency_matrix(networkObj, weighted=weighted)
+    A = A.tocoo()
+    W = np.full(A.shape, semiring.zero, dtype=semiring.dtype)
+    W[A.row, A.col] = A.data
+    return labels, W
+
+
+def matrix_to_edges(
+    labels: pd.Index,
+    W: np.ndarray,
+    missing,
+    source_label: str,
+    target_label: str,
+    weight_label: str,
+    symmetric: bool,
+    diagonal: bool,
+) -> pd.DataFrame:
+    """
+    Converts a dense result matrix into an edge list, skipping entries equal to missing.
+    Symmetric results keep every unordered pair once with source <= target.
+    """
+    mask = W != missing
+    if symmetric:
+        mask &= np.triu(np.ones(W.shape, dtype=bool), k=0 if diagonal else 1)
+    elif not diagonal:
+        np.fill_diagonal(mask, False)
+    rows, cols = np.nonzero(mask)
+    sources = labels.to_numpy()[rows]
+    targets = labels.to_numpy()[cols]
+    if symmetric:
+        sources, targets = sorted_pairs(sources, targets)
+    return pd.DataFrame(
+        {
+            source_label: sources,
+            target_label: targets,
+            weight_label: W[rows, cols],
+        }
+    )
+
+
+def dense_distance_transform(
+    networkObj: NetworkPortObject, block_size: int = 1024, matrix: bool = False
+) -> NetworkPortObject:
+    """
+    Computes the distance transform of a network with the min-plus closure.
+    Same edges as distance_transform, symmetric pairs are oriented source <= target.
+    Intended for small and dense networks.
+    """
+    _check_one_mode(networkObj, "Distance")
+    _check_positive(networkObj)
+    labels, W = dense_matrix(networkObj, MIN_PLUS)
+    W = closure(W, MIN_PLUS, block_size)
+    return _wrap(networkObj, labels, W, MIN_PLUS.zero, "distance", False, matrix)
+
+
+def dense_reachability_transform(
+    networkObj: NetworkPortObject, block_size: int = 1024, matrix: bool = False
+) -> NetworkPortObject:
+    """
+    Computes the reachability transform of a network with the boolean closure.
+    Same edges as reachability_transform, symmetric pairs are oriented
+    source <= target. Intended for small and dense networks.
+    """
+    _check_one_mode(networkObj, "Reachability")
+    labels, W = dense_matrix(networkObj, BOOLEAN, weighted=False)
+    self_loops = np.diagonal(W).copy()
+    W = closure(W, BOOLEAN, block_size)
+    # like networkx' transitive closure, cycles only create self-loops when reflexive
+    np.fill_diagonal(W, True if networkObj.is_irreflexive() else self_loops)
+    result = _wrap(networkObj, labels, W, BOOLEAN.zero, "reachable", True, matrix)
+    if not matrix:
+        result.get_network()["reachable"] = 1
+    return result
+
+
+def bitset_closure(R: np.ndarray) -> np.ndarray:
+    """
+    Warshall's transitive closure on a bit-packed boolean matrix.
+    R has one row per node with the bits of its successors packed into uint64 words
+    (see bitset_matrix). For every pivot k all rows reaching k are OR-ed with row k.
+    """
+    words = R.view(np.uint8)
+    for k in range(R.shape[0]):
+        # np.packbits stores the most significant bit first
+        rows = np.flatnonzero(words[:, k >> 3] & (0x80 >> (k & 7)))
+        if len(rows):
+            R[rows] |= R[k]
+    return R
+
+
+def bitset_matrix(networkObj: NetworkPortObject) -> tuple[pd.Index, np.ndarray]:
+    """
+    Builds the bit-packed adjacency matrix of a one-mode network, one uint64 word per 64 nodes.
+    """
+    labels, _, A = adjacency_matrix(networkObj, weighted=False)
+    n = A.shape[0]
+    n_bytes = -(-n // 64) * 8
+    dense = np.zeros((n, n_bytes * 8), dtype=bool)
+    A = A.tocoo()
+    dense[A.row, A.col] = True
+    return labels, np.ascontiguousarray(np.packbits(dense, axis=1)).view(np.uint64)
+
+
+def bitset_reachability_transform(
+    networkObj: NetworkPortObject, matrix: bool = False
+) -> NetworkPortObject:
+    """
+    Computes the reachability transform of a network with a bit-packed Warshall closure.
+    Same edges as reachability_transform, symmetric pairs are oriented
+    source <= target. 64 node pairs are handled per word operation.
+    """
+    _check_one_mode(networkObj, "Reachability")
+    labels, R = bitset_matrix(networkObj)
+    n = R.shape[0]
+    self_loops = np.unpackbits(R.view(np.uint8), axis=1, count=n).diagonal().astype(bool)
+    R = bitset_closure(R)
+    W = np.unpackbits(R.view(np.uint8), axis=1, count=n).astype(bool)
+    np.fill_diagonal(W, True if networkObj.is_irreflexive() else self_loops)
+    result = _wrap(networkObj, labels, W, BOOLEAN.zero, "reachable", True, matrix)
+    if not matrix:
+        result.get_network()["reachable"] = 1
+    return result
+
+
+def bottleneck_transform(
+    networkObj: NetworkPortObject, block_size: int = 1024, matrix: bool = False
+) -> NetworkPortObject:
+    """
+    Computes the widest-path (bottleneck) capacity between all node pairs
+    with the max-min closure. The capacity of a path is its smallest edge weight.
+    """
+    _check_one_mode(networkObj, "Bottleneck")
+    _check_positive(networkObj)
+    labels, W = dense_matrix(networkObj, MAX_MIN)
+    W = closure(W, MAX_MIN, block_size)
+    return _wrap(networkObj, labels, W, MAX_MIN.zero, "bottleneck", False, matrix)
+
+
+def reliability_transform(
+    networkObj: NetworkPortObject, block_size: int = 1024, matrix: bool = False
+) -> NetworkPortObject:
+    """
+    Computes the most reliable path between all node pairs with the max-product closure.
+    Edge weights are probabilities in (0, 1], the reliability of a path is their product.
+    """
+    _check_one_mode(networkObj, "Reliability")
+    _check_positive(networkObj)
+    weights = networkObj.get_network()[networkObj.get_weight_label()]
+    if (weights > 1).any():
+        raise ValueError(
+            "Weight column must be in (0, 1]. Consider using a rescale transformation first."
+        )
+    labels, W = dense_matrix(networkObj, MAX_PRODUCT)
+    W = closure(W, MAX_PRODUCT, block_size)
+    return _wrap(networkObj, labels, W, MAX_PRODUCT.zero, "reliability", False, matrix)
+
+
+def _check_one_mode(networkObj: NetworkPortObject, name: str) -> None:
+    if networkObj.is_two_mode():
+        raise ValueError(
+            f"{name} transform is not supported for two-mode networks. Consider projection to one-mode network."
+        )
+
+
+def _check_positive(networkObj: NetworkPortObject) -> None:
+    weights = networkObj.get_network()[networkObj.get_weight_label()]
+    if not pd.api.types.is_numeric_dtype(weights):
+        raise ValueError("Weight column must be numeric.")
+    if (weights <= 0).any():
+        raise ValueError("Weight column must be positive.")
+
+
+def _wrap(
+    networkObj: NetworkPortObject,
+    labels: pd.Index,
+    W: np.ndarray,
+    missing,
+    weight_label: str,
+    diagonal: bool,
+    matrix: bool = False,
+) -> NetworkPortObject:
+    source_label = networkObj.get_source_label()
+    target_label = networkObj.get_target_label()
+    if matrix:
+        df = dense_to_matrix(labels, W, missing, diagonal)
+    else:
+        df = matrix_to_edges(
+            labels,
+            W,
+            missing,
+            source_label,
+            target_label,
+            weight_label,
+            symmetric=networkObj.is_symmetric(),
+            diagonal=diagonal,
+        )
+    return NetworkPortObject(
+        NetworkPortObjectSpec(
+            source_label=source_label,
+            target_label=target_label,
+            weight_label=weight_label,
+            irreflexive=networkObj.is_irreflexive(),
+            symmetric=networkObj.is_symmetric(),
+            two_mode=False,
+        ),
+        df,
+    )
@@ -0,0 +1,633 @@
+import logging
+import math
+from types import SimpleNamespace
+
+import numpy as np
+
+from nodes.network.util.options_transform import (
+    TransformOptions,
+    PathEngineOptions,
+    WalkOptions,
+    RescaleOptions,
+    SymmetrizationOptions,
+    SimilarityOptions,
+    FilterOptions,
+    ThresholdOptions,
+    FilterModeOptions,
+    ConstantHandlingOptions,
+    LogBaseOptions,
+    DegreeTypeOptions,
+)
+from nodes.network.util.schema_gen import get_transform_schema
+from nodes.network.util.planner import path_transform
+from nodes.network.util.components import component_transform
+from nodes.network.util.reachability import k_reachability_transform
+from nodes.network.util.dependency import dependency_transform
+from nodes.network.util.max_flow import max_flow_transform
+from nodes.network.util.path_algebra import bottleneck_transform, reliability_transform
+from nodes.network.util.walks import walk_transform
+from nodes.network.util.similarity import similarity_transform
+from nodes.network.util.filter import filter_transform
+from nodes.network.util.incremental import edge_keys
+from nodes.network.util.sketch import approximate_percentile
+from nodes.network.util.snapshots import snapshot_transform
+from nodes.network.util.symmetry import (
+    sum_symmetrize_transform,
+    average_symmetrize_transform,
+    max_symmetrize_transform,
+    min_symmetrize_transform,
+    bin_and_symmetrize_transform,
+    bin_or_symmetrize_transform,
+)
+from nodes.network.util.rescale import (
+    identity_transform,
+    min_max_rescale_transform,
+    row_normalize_transform,
+    degree_sum_rescale_transform,
+    degree_prod_rescale_transform,
+    inverse_transform,
+    log_transform,
+)
+from util.port_objects import (
+    NetworkPortObject,
+    NetworkPortObjectSpec,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# Settings of a pipeline step, same names and defaults as the Network Transformation node.
+STEP_DEFAULTS = {
+    "transform_type": TransformOptions.IDENTITY.name,
+    "engine": PathEngineOptions.TRAVERSAL.name,
+    "split_components": False,
+    "workers": 0,
+    "set_k": False,
+    "k_value": 5,
+    "walk_method": WalkOptions.WALK_COUNT.name,
+    "walk_attenuation": 0.1,
+    "dense_cutoff": 0.1,
+    "rescale_method": RescaleOptions.GLOBAL_MIN_MAX.name,
+    "interval_a": 0.0,
+    "interval_b": 1.0,
+    "handle_constant": ConstantHandlingOptions.ERROR.name,
+    "log_base": LogBaseOptions.E.name,
+    "log_custom_base": 2.718,
+    "symmetrization_method": SymmetrizationOptions.SUM.name,
+    "filter_type": FilterOptions.EDGE.name,
+    "filter_threshold": ThresholdOptions.ABSOLUTE_THRESHOLD.name,
+    "filter_mode": FilterModeOptions.LESS.name,
+    "strength_mode": False,
+    "add_core_columns": False,
+    "filter_value": 0.0,
+    "filter_top_k": 10,
+    "filter_alpha": 0.05,
+    "sketch_size": 200,
+    "similarity_method": SimilarityOptions.JACCARD.name,
+    "set_top_k": False,
+    "top_k": 10,
+    "similarity_threshold": 0.0,
+    "degree_type": DegreeTypeOptions.TOTAL.name,
+    "epsilon": 1e-10,
+    "block_size": 1024,
+    "spill_to_disk": False,
+    "spill_size": 256,
+    "matrix_output": False,
+    "max_share": 0.2,
+}
+
+STEP_ENUMS = {
+    "transform_type": TransformOptions,
+    "engine": PathEngineOptions,
+    "walk_method": WalkOptions,
+    "rescale_method": RescaleOptions,
+    "handle_constant": ConstantHandlingOptions,
+    "log_base": LogBaseOptions,
+    "symmetrization_method": SymmetrizationOptions,
+    "filter_type": FilterOptions,
+    "filter_threshold": ThresholdOptions,
+    "filter_mode": FilterModeOptions,
+    "similarity_method": SimilarityOptions,
+    "degree_type": DegreeTypeOptions,
+}
+
+LOG_BASES = {
+    LogBaseOptions.E.name: math.e,
+    LogBaseOptions.TEN.name: 10.0,
+    LogBaseOptions.TWO.name: 2.0,
+}
+
+# element-wise rescales, computed on the weight column only
+ELEMENTWISE_RESCALES = [
+    RescaleOptions.GLOBAL_MIN_MAX.name,
+    RescaleOptions.INVERSE.name,
+    RescaleOptions.LOG.name,
+]
+# transforms that change the weights but never the edges
+POINTWISE_RESCALES = [
+    RescaleOptions.INVERSE.name,
+    RescaleOptions.LOG.name,
+]
+
+
+def parse_steps(text: str) -> list[SimpleNamespace]:
+    """
+    Parses a pipeline definition, one step per line (or separated by ';'):
+        FILTER filter_type=EDGE filter_mode=GREATER filter_value=2
+        SYMMETRY symmetrization_method=MAX
+        RESCALE rescale_method=INVERSE
+        DISTANCE engine=AUTO
+    Every step starts with the transformation type followed by key=value settings
+    of the Network Transformation node, missing settings use its defaults.
+    Text after '#' is ignored.
+    """
+    steps = []
+    for line in text.replace(";", "\n").splitlines():
+        tokens = line.split("#", 1)[0].split()
+        if not tokens:
+            continue
+        values = dict(STEP_DEFAULTS)
+        values["transform_type"] = _parse_value("transform_type", tokens[0])
+        for token in tokens[1:]:
+            key, sep, value = token.partition("=")
+            if not sep or key not in STEP_DEFAULTS or key == "transform_type":
+                raise ValueError(f"Invalid setting '{token}' in step '{line.strip()}'.")
+            values[key] = _parse_value(key, value)
+        step = SimpleNamespace(**values)
+        validate_transform(step)
+        steps.append(step)
+    if not steps:
+        raise ValueError("The pipeline must contain at least one step.")
+    return steps
+
+
+def _parse_value(key: str, value: str):
+    default = STEP_DEFAULTS[key]
+    if key in STEP_ENUMS:
+        name = value.upper()
+        if name not in STEP_ENUMS[key].__members__:
+            raise ValueError(
+                f"Invalid value '{value}' for {key}, expected one of "
+                f"{', '.join(STEP_ENUMS[key].__members__)}."
+            )
+        return name
+    try:
+        if isinstance(default, bool):
+            if value.lower() not in ("true", "false"):
+                raise ValueError
+            return value.lower() == "true"
+        return type(default)(value)
+    except ValueError:
+        raise ValueError(f"Invalid value '{value}' for {key}.") from None
+
+
+def validate_transform(settings) -> None:
+    """
+    Checks the settings of a single transformation.
+    """
+    match settings.transform_type:
+        case TransformOptions.DISTANCE.name:
+            if settings.engine == PathEngineOptions.BITSET.name:
+                raise ValueError(
+                    "The bitset closure only computes reachability, select another path engine."
+                )
+        case TransformOptions.RESCALE.name:
+            a = settings.interval_a
+            b = settings.interval_b
+            if a >= b:
+                raise ValueError(
+                    "For interval [a,b], a must be less than b for Min-Max rescaling."
+                )
+        case TransformOptions.WALK.name:
+            if settings.k_value < 1:
+                raise ValueError("The number of steps must be at least 1.")
+        case TransformOptions.FILTER.name:
+            if settings.filter_threshold in [
+                ThresholdOptions.PERCENTILE_THRESHOLD.name,
+                ThresholdOptions.APPROX_PERCENTILE_THRESHOLD.name,
+            ] and (settings.filter_value < 0 or settings.filter_value > 100):
+                raise ValueError(
+                    "For percentile threshold filtering, the filter value must be between 0 and 100."
+                )
+
+
+def log_base(settings) -> float:
+    if settings.log_base == LogBaseOptions.CUSTOM.name:
+        return settings.log_custom_base
+    return LOG_BASES[settings.log_base]
+
+
+def apply_transform(networkObj: NetworkPortObject, settings) -> NetworkPortObject:
+    """
+    Runs a single transformation configured like the Network Transformation node.
+    Networks with snapshots are transformed snapshot by snapshot.
+    """
+    if networkObj.get_snapshots() is not None:
+        return snapshot_transform(
+            networkObj,
+            settings,
+            _apply_transform,
+            row_local=_is_pointwise(settings)
+            or _is_edge_threshold(settings, FilterModeOptions.GREATER.name)
+            or _is_edge_threshold(settings, FilterModeOptions.LESS.name),
+            incremental=_incremental_type(settings),
+            max_share=settings.max_share,
+        )
+    return _apply_transform(networkObj, settings)
+
+
+def _incremental_type(settings) -> str | None:
+    """
+    Transformation type if the result can be updated with an edge delta.
+    """
+    match settings.transform_type:
+        case TransformOptions.DISTANCE.name if getattr(settings, "cutoff", None) is None:
+            return settings.transform_type
+        case TransformOptions.REACHABILITY.name if not settings.set_k:
+            return settings.transform_type
+    return None
+
+
+def _apply_transform(networkObj: NetworkPortObject, settings) -> NetworkPortObject:
+    match settings.transform_type:
+        case TransformOptions.DISTANCE.name:
+            return _by_component(
+                networkObj,
+                settings,
+                path_transform,
+                transform=settings.transform_type,
+                engine=settings.engine,
+                block_size=settings.block_size,
+                # the components are already processed in parallel
+                workers=1 if settings.split_components else settings.workers,
+                # only set by pipelines that push a distance filter into the search
+                cutoff=getattr(settings, "cutoff", None),
+                spill_mb=_spill_mb(settings),
+                matrix=_matrix_output(settings),
+            )
+        case TransformOptions.REACHABILITY.name:
+            if settings.set_k:
+                return k_reachability_transform(networkObj, max_step=settings.k_value)
+            return _by_component(
+                networkObj,
+                settings,
+                path_transform,
+                transform=settings.transform_type,
+                engine=settings.engine,
+                block_size=settings.block_size,
+                workers=1 if settings.split_components else settings.workers,
+                matrix=_matrix_output(settings),
+            )
+        case TransformOptions.BOTTLENECK.name:
+            return _by_component(
+                networkObj,
+                settings,
+                bottleneck_transform,
+                block_size=settings.block_size,
+                matrix=_matrix_output(settings),
+            )
+        case TransformOptions.RELIABILITY.name:
+            return _by_component(
+                networkObj,
+                settings,
+                reliability_transform,
+                block_size=settings.block_size,
+                matrix=_matrix_output(settings),
+            )
+        case TransformOptions.DEPENDENCY.name:
+            return _by_component(
+                networkObj,
+                settings,
+                dependency_transform,
+                spill_mb=_spill_mb(settings),
+                matrix=_matrix_output(settings),
+            )
+        case TransformOptions.MAX_FLOW.name:
+            return _by_component(
+                networkObj,
+                settings,
+                max_flow_transform,
+                spill_mb=_spill_mb(settings),
+                matrix=_matrix_output(settings),
+            )
+        case TransformOptions.WALK.name:
+            return walk_transform(
+                networkObj,
+                method=settings.walk_method,
+                k=settings.k_value,
+                attenuation=settings.walk_attenuation,
+                block_size=settings.block_size,
+                dense_cutoff=settings.dense_cutoff,
+            )
+        case TransformOptions.IDENTITY.name:
+            return identity_transform(networkObj)
+        case TransformOptions.RESCALE.name:
+            match settings.rescale_method:
+                case RescaleOptions.GLOBAL_MIN_MAX.name:
+                    return min_max_rescale_transform(
+                        networkObj, a=settings.interval_a, b=settings.interval_b
+                    )
+                case RescaleOptions.RANDOM_WALK.name:
+                    return row_normalize_transform(
+                        networkObj, degree_type=settings.degree_type
+                    )
+                case RescaleOptions.DEGREE_SUM.name:
+                    return degree_sum_rescale_transform(
+                        networkObj, degree_type=settings.degree_type
+                    )
+                case RescaleOptions.DEGREE_PROD.name:
+                    return degree_prod_rescale_transform(
+                        networkObj, degree_type=settings.degree_type
+                    )
+                case RescaleOptions.INVERSE.name:
+                    return inverse_transform(networkObj, epsilon=settings.epsilon)
+                case RescaleOptions.LOG.name:
+                    return log_transform(
+                        networkObj, base=log_base(settings), epsilon=settings.epsilon
+                    )
+                case _:
+                    raise ValueError("Invalid rescale method selected.")
+        case TransformOptions.SYMMETRY.name:
+            match settings.symmetrization_method:
+                case SymmetrizationOptions.SUM.name:
+                    return sum_symmetrize_transform(networkObj)
+                case SymmetrizationOptions.AVERAGE.name:
+                    return average_symmetrize_transform(networkObj)
+                case SymmetrizationOptions.MAX.name:
+                    return max_symmetrize_transform(networkObj)
+                case SymmetrizationOptions.MIN.name:
+                    return min_symmetrize_transform(networkObj)
+                case SymmetrizationOptions.BIN_OR.name:
+                    return bin_or_symmetrize_transform(networkObj)
+                case SymmetrizationOptions.BIN_AND.name:
+                    return bin_and_symmetrize_transform(networkObj)
+                case _:
+                    raise ValueError("Invalid symmetrization method selected.")
+        case TransformOptions.FILTER.name:
+            return filter_transform(
+                networkObj,
+                degree_type=settings.degree_type,
+                filter_type=settings.filter_type,
+                filter_threshold=settings.filter_threshold,
+                filter_mode=settings.filter_mode,
+                filter_value=settings.filter_value,
+                strength_mode=settings.strength_mode,
+                top_k=settings.filter_top_k,
+                alpha=settings.filter_alpha,
+                sketch_size=settings.sketch_size,
+                core_columns=settings.add_core_columns,
+            )
+        case TransformOptions.SIMILARITY.name:
+            return similarity_transform(
+                networkObj,
+                method=settings.similarity_method,
+                degree_type=settings.degree_type,
+                top_k=settings.top_k if settings.set_top_k else None,
+                threshold=settings.similarity_threshold,
+                block_size=settings.block_size,
+            )
+        case _:
+            raise ValueError("Invalid transformation type selected.")
+
+
+def _spill_mb(settings) -> int | None:
+    """
+    Chunk size in megabytes of all-pairs outputs written to disk, None keeps them in memory.
+    Split components are concatenated in memory, so they are never written to disk.
+    """
+    if settings.spill_to_disk and not settings.split_components:
+        return settings.spill_size
+    return None
+
+
+def _matrix_output(settings) -> bool:
+    """
+    Whether all-pairs transforms return a dense matrix, split components and snapshots are
+    concatenated as edge lists.
+    """
+    return settings.matrix_output and not settings.split_components
+
+
+def _by_component(networkObj: NetworkPortObject, settings, func, **kwargs):
+    if settings.split_components:
+        return component_transform(networkObj, func, kwargs, workers=settings.workers)
+    return func(networkObj, **kwargs)
+
+
+def pipeline_schema(
+    input_schema: NetworkPortObjectSpec, steps: list
+) -> NetworkPortObjectSpec:
+    """
+    Returns the schema of the network produced by all steps.
+    """
+    schema = input_schema
+    for step in steps:
+        schema = get_transform_schema(schema, settings=step)
+    return schema
+
+
+def _is_elementwise(step) -> bool:
+    match step.transform_type:
+        case TransformOptions.IDENTITY.name:
+            return True
+        case TransformOptions.RESCALE.name:
+            return step.rescale_method in ELEMENTWISE_RESCALES
+        case TransformOptions.FILTER.name:
+            return step.filter_type == FilterOptions.EDGE.name
+    return False
+
+
+def _is_pointwise(step) -> bool:
+    return step.transform_type == TransformOptions.IDENTITY.name or (
+        step.transform_type == TransformOptions.RESCALE.name
+        and step.rescale_method in POINTWISE_RESCALES
+    )
+
+
+def _is_degree_filter(step) -> bool:
+    return (
+        step.transform_type == TransformOptions.FILTER.name
+        and step.filter_type == FilterOptions.NODE.name
+        and not step.strength_mode
+    )
+
+
+def _is_edge_threshold(step, mode: str) -> bool:
+    return (
+        step.transform_type == TransformOptions.FILTER.name
+        and step.filter_type == FilterOptions.EDGE.name
+        and step.filter_threshold == ThresholdOptions.ABSOLUTE_THRESHOLD.name
+        and step.filter_mode == mode
+    )
+
+
+def _pushed_filter(path_step, edge_filter) -> SimpleNamespace | None:
+    """
+    Returns the edge filter to run before path_step when a following edge filter
+    only keeps results that never use the dropped edges, otherwise None.
+    - distance <= t only uses edges with weight <= t (weights are positive)
+    - bottleneck >= t only uses edges with weight >= t
+    - reliability >= t only uses edges with weight >= t (weights are in (0, 1])
+    """
+    match path_step.transform_type:
+        case TransformOptions.DISTANCE.name:
+            if _is_edge_threshold(edge_filter, FilterModeOptions.LESS.name):
+                return edge_filter
+        case TransformOptions.BOTTLENECK.name | TransformOptions.RELIABILITY.name:
+            if _is_edge_threshold(edge_filter, FilterModeOptions.GREATER.name):
+                return edge_filter
+    return None
+
+
+def plan_pipeline(steps: list, push_filters: bool = True) -> list[tuple[str, list]]:
+    """
+    Builds the execution plan of a pipeline as a list of ("FUSED", steps) stages,
+    computed in a single pass over the weight column, and ("STEP", [step]) stages.
+    - degree filters are moved ahead of pointwise weight maps, they only depend on the edges
+    - with push_filters, absolute edge filters following a distance, bottleneck or
+      reliability transform are also run before it, so the all-pairs search runs on the
+      smaller network (a distance filter additionally bounds the search)
+    - consecutive element-wise steps are fused
+    Pushing filters needs unique (undirected) pairs: of duplicate rows the path transforms
+    use one weight, which an earlier filter may drop in favour of another.
+    """
+    steps = [SimpleNamespace(**vars(step)) for step in steps]
+
+    # move degree filters ahead of pointwise maps
+    i = 1
+    while i < len(steps):
+        if _is_degree_filter(steps[i]) and _is_pointwise(steps[i - 1]):
+            steps[i - 1], steps[i] = steps[i], steps[i - 1]
+            i = max(i - 1, 1)
+        else:
+            i += 1
+
+    # push edge filters into the path transforms
+    pushed = []
+    for i, step in enumerate(steps):
+        edge_filter = None
+        if push_filters and i + 1 < len(steps):
+            edge_filter = _pushed_filter(step, steps[i + 1])
+        if edge_filter is not None:
+            pushed.append(SimpleNamespace(**vars(edge_filter)))
+            if step.transform_type == TransformOptions.DISTANCE.name:
+                step.cutoff = edge_filter.filter_value
+        pushed.append(step)
+
+    plan = []
+    for step in pushed:
+        if _is_elementwise(step):
+            if plan and plan[-1][0] == "FUSED":
+                plan[-1][1].append(step)
+            else:
+                plan.append(("FUSED", [step]))
+        else:
+            plan.append(("STEP", [step]))
+    return plan
+
+
+def describe_plan(plan: list) -> str:
+    parts = []
+    for kind, steps in plan:
+        names = " + ".join(_describe_step(step) for step in steps)
+        parts.append(f"[{names}]" if kind == "FUSED" else names)
+    return " -> ".join(parts)
+
+
+def _describe_step(step) -> str:
+    match step.transform_type:
+        case TransformOptions.RESCALE.name:
+            return f"RESCALE({step.rescale_method})"
+        case TransformOptions.SYMMETRY.name:
+            return f"SYMMETRY({step.symmetrization_method})"
+        case TransformOptions.FILTER.name:
+            match step.filter_type:
+                case FilterOptions.TOP_K.name:
+                    return f"FILTER(TOP_K {step.filter_top_k})"
+                case FilterOptions.BACKBONE.name:
+                    return f"FILTER(BACKBONE {step.filter_alpha})"
+            return f"FILTER({step.filter_type} {step.filter_mode} {step.filter_value})"
+        case TransformOptions.DISTANCE.name if getattr(step, "cutoff", None) is not None:
+            return f"DISTANCE(cutoff {step.cutoff})"
+    return step.transform_type
+
+
+def fused_transform(networkObj: NetworkPortObject, steps: list) -> NetworkPortObject:
+    """
+    Runs element-wise steps (identity, min-max, inverse and log rescales, edge filters)
+    on the weight column in one pass and builds the output network once.
+    """
+    df = networkObj.get_network()
+    weight_label = networkObj.get_weight_label()
+    weights = df[weight_label].to_numpy()
+    rows = np.arange(len(df))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for step in steps:
+            match (step.transform_type, step.rescale_method):
+                case (TransformOptions.IDENTITY.name, _):
+                    weights = np.ones(len(weights), dtype=np.int64)
+                case (TransformOptions.RESCALE.name, RescaleOptions.GLOBAL_MIN_MAX.name):
+                    # missing weights are skipped like in the pandas min and max
+                    if np.isnan(weights).all():
+                        low = high = np.nan
+                    else:
+                        low, high = np.nanmin(weights), np.nanmax(weights)
+                    weights = (weights - low) / (high - low)
+                    weights = weights * (step.interval_b - step.interval_a) + step.interval_a
+                case (TransformOptions.RESCALE.name, RescaleOptions.INVERSE.name):
+                    weights = 1 / (weights + step.epsilon)
+                case (TransformOptions.RESCALE.name, RescaleOptions.LOG.name):
+                    weights = np.log(weights + step.epsilon) / np.log(log_base(step))
+                case (TransformOptions.FILTER.name, _):
+                    if step.filter_threshold == ThresholdOptions.PERCENTILE_THRESHOLD.name:
+                        thresh = np.percentile(weights, step.filter_value)
+                    elif step.filter_threshold == ThresholdOptions.APPROX_PERCENTILE_THRESHOLD.name:
+                        thresh = approximate_percentile(
+                            weights, step.filter_value, k=step.sketch_size
+                        )
+                    else:
+                        thresh = step.filter_value
+                    if step.filter_mode == FilterModeOptions.GREATER.name:
+                        keep = weights >= thresh
+                    else:
+                        keep = weights <= thresh
+                    rows, weights = rows[keep], weights[keep]
+                case _:
+                    raise ValueError(f"Step {step.transform_type} cannot be fused.")
+
+    df = df.iloc[rows].copy()
+    df[weight_label] = weights
+    return NetworkPortObject(networkObj.spec, df)
+
+
+def _has_unique_pairs(networkObj: NetworkPortObject) -> bool:
+    if networkObj.is_matrix():
+        return True
+    if networkObj.is_spilled():
+        # not read into memory for the check
+        return False
+    return edge_keys(
+        networkObj.get_network(),
+        networkObj.get_source_label(),
+        networkObj.get_target_label(),
+        networkObj.is_symmetric(),
+    ).is_unique
+
+
+def run_pipeline(networkObj: NetworkPortObject, steps: list) -> NetworkPortObject:
+    """
+    Plans and runs a pipeline of transformations, only the final network is kept.
+    Networks with snapshots run the steps one by one.
+    """
+    if networkObj.get_snapshots() is not None:
+        for step in steps:
+            networkObj = apply_transform(networkObj, step)
+        return networkObj
+    plan = plan_pipeline(steps, push_filters=_has_unique_pairs(networkObj))
+    LOGGER.info(f"Pipeline plan: {describe_plan(plan)}")
+    for kind, stage in plan:
+        if kind == "FUSED":
+            networkObj = fused_transform(networkObj, stage)
+        else:
+            networkObj = apply_transform(networkObj, stage[0])
+    return networkObj
@@ -0,0 +1,170 @@
+import json
+import logging
+import math
+import os
+
+import pandas as pd
+
+from nodes.network.util import parallel
+from nodes.network.util.distance import distance_transform
+from nodes.network.util.reachability import reachability_transform
+from nodes.network.util.path_algebra import (
+    dense_distance_transform,
+    dense_reachability_transform,
+    bitset_reachability_transform,
+)
+from util.port_objects import NetworkPortObject
+
+LOGGER = logging.getLogger(__name__)
+
+# Seconds per work unit of every engine, written by benchmark_engines.py.
+# The defaults below are used when the extension has not been calibrated.
+COSTS_FILE = os.path.join(os.path.dirname(__file__), "engine_costs.json")
+DEFAULT_COSTS = {
+    "traversal_weighted": 2.5e-7,
+    "traversal_unweighted": 4.3e-7,
+    "dense": 3.8e-9,
+    "bitset": 7.0e-8,
+    # seconds to start one worker process and send it the graph
+    "parallel_startup": 0.15,
+    # dense engines need n² memory, larger networks always use traversal
+    "dense_max_nodes": 20000,
+}
+
+
+def load_costs() -> dict:
+    """
+    Returns the calibrated engine costs, falling back to the defaults.
+    """
+    costs = dict(DEFAULT_COSTS)
+    if os.path.exists(COSTS_FILE):
+        with open(COSTS_FILE) as f:
+            costs.update(json.load(f))
+    return costs
+
+
+def network_profile(networkObj: NetworkPortObject) -> dict:
+    """
+    Size and shape of a network as seen by the cost model.
+    """
+    df = networkObj.get_network()
+    source_label = networkObj.get_source_label()
+    target_label = networkObj.get_target_label()
+    weight_label = networkObj.get_weight_label()
+
+    n = len(pd.unique(pd.concat([df[source_label], df[target_label]])))
+    m = len(df)
+    return {
+        "nodes": n,
+        "edges": m,
+        "density": m / (n * (n - 1)) if n > 1 else 0.0,
+        "weighted": df[weight_label].nunique() > 1,
+        "symmetric": networkObj.is_symmetric(),
+    }
+
+
+def work_units(profile: dict) -> dict:
+    """
+    Work units of every engine for a network profile, the estimated runtime is units × cost.
+    """
+    n = profile["nodes"]
+    # a traversal of an undirected network follows every edge in both directions
+    arcs = profile["edges"] * (2 if profile["symmetric"] else 1)
+    return {
+        "traversal_weighted": n * (arcs + n * math.log2(max(n, 2))),
+        "traversal_unweighted": n * (arcs + n),
+        "dense": n**3,
+        "bitset": n * n * math.ceil(n / 64),
+    }
+
+
+def estimate_costs(transform: str, profile: dict, workers: int, costs: dict) -> dict:
+    """
+    Estimated runtime in seconds of every engine applicable to the transform.
+    """
+    units = work_units(profile)
+    if transform == "DISTANCE" and profile["weighted"]:
+        traversal = units["traversal_weighted"] * costs["traversal_weighted"]
+    else:
+        traversal = units["traversal_unweighted"] * costs["traversal_unweighted"]
+
+    estimates = {"TRAVERSAL": traversal}
+    if workers > 1:
+        estimates["PARALLEL_TRAVERSAL"] = (
+            traversal / workers + costs["parallel_startup"] * workers
+        )
+    if profile["nodes"] <= costs["dense_max_nodes"]:
+        estimates["DENSE"] = units["dense"] * costs["dense"]
+        if transform == "REACHABILITY":
+            estimates["BITSET"] = units["bitset"] * costs["bitset"]
+    return estimates
+
+
+def plan_engine(transform: str, networkObj: NetworkPortObject, workers: int) -> str:
+    """
+    Picks the engine with the lowest estimated runtime and logs the plan.
+    """
+    profile = network_profile(networkObj)
+    estimates = estimate_costs(transform, profile, workers, load_costs())
+    engine = min(estimates, key=estimates.get)
+    LOGGER.info(
+        f"{transform} on {profile['nodes']} nodes, {profile['edges']} edges "
+        f"(density {profile['density']:.3g}, "
+        f"{'weighted' if profile['weighted'] else 'unweighted'}, "
+        f"{'symmetric' if profile['symmetric'] else 'directed'}): "
+        f"using {engine}, estimated {estimates[engine]:.3g}s "
+        f"({', '.join(f'{k} {v:.3g}s' for k, v in estimates.items())})"
+    )
+    return engine
+
+
+def path_transform(
+    networkObj: NetworkPortObject,
+    transform: str,
+    engine: str,
+    block_size: int = 1024,
+    workers: int = 0,
+    cutoff: float | None = None,
+    spill_mb: int | None = None,
+    matrix: bool = False,
+) -> NetworkPortObject:
+    """
+    Runs the distance or reachability transform with the selected path engine.
+    - transform: "DISTANCE" or "REACHABILITY"
+    - engine: "AUTO", "TRAVERSAL", "PARALLEL_TRAVERSAL", "DENSE" or "BITSET"
+    - workers: number of processes for the parallel engine, 0 uses all cores
+    - cutoff: maximum distance searched by the traversal engines, the dense engine
+      computes all distances
+    - spill_mb: chunk size in megabytes when the traversal engines write the distances to
+      a temporary file, None keeps them in memory
+    - matrix: return a dense NetworkMatrix instead of an edge list
+    """
+    workers = parallel.resolve_workers(workers)
+    if engine == "AUTO":
+        engine = plan_engine(transform, networkObj, workers)
+
+    match (transform, engine):
+        case ("DISTANCE", "TRAVERSAL"):
+            return distance_transform(
+                networkObj, cutoff=cutoff, spill_mb=spill_mb, matrix=matrix
+            )
+        case ("DISTANCE", "PARALLEL_TRAVERSAL"):
+            return distance_transform(
+                networkObj, workers=workers, cutoff=cutoff, spill_mb=spill_mb, matrix=matrix
+            )
+        case ("DISTANCE", "DENSE"):
+            return dense_distance_transform(networkObj, block_size=block_size, matrix=matrix)
+        case ("REACHABILITY", "TRAVERSAL"):
+            return reachability_transform(networkObj, matrix=matrix)
+        case ("REACHABILITY", "PARALLEL_TRAVERSAL"):
+            return reachability_transform(networkObj, workers=workers, matrix=matrix)
+        case ("REACHABILITY", "DENSE"):
+            return dense_reachability_transform(
+                networkObj, block_size=block_size, matrix=matrix
+            )
+        case ("REACHABILITY", "BITSET"):
+            return bitset_reachability_transform(networkObj, matrix=matrix)
+        case _:
+            raise ValueError(
+                f"Path engine {engine} does not support the {transform} transform."
+            )
@@ -1,14 +1,20 @@
 import pandas as pd
 import networkx as nx
+from nodes.network.util import parallel
+from nodes.network.util.matrix import collect_matrix
 from util.port_objects import (
     NetworkPortObject,
     NetworkPortObjectSpec,
 )
 
-def reachability_transform(networkObj: NetworkPortObject) -> NetworkPortObject:
+def reachability_transform(
+    networkObj: NetworkPortObject, workers: int = 1, matrix: bool = False
+) -> NetworkPortObject:
     """
     Computes the reachability transform of a network. Doesn't take esge values into account.
     It computes the transitive closure of the network.
+    With workers > 1 the sources are distributed over a process pool.
+    With matrix the output is a dense NetworkMatrix instead of an edge list.
     The output is a NetworkPortObject with the reachability network.
     """
     source_label = networkObj.get_source_label()
@@ -26,11 +32,25 @@ def reachability_transform(networkObj: NetworkPortObject) -> NetworkPortObject:
         target=target_label,
         create_using=nx.DiGraph() if not networkObj.is_symmetric() else nx.Graph(),
     )
-    G_transitive = nx.transitive_closure(
-        G, reflexive=True if networkObj.is_irreflexive() else None
-    )
-    df = nx.to_pandas_edgelist(G_transitive, source=source_label, target=target_label)
-    df["reachable"] = 1
+    if workers > 1:
+        edges = parallel.map_sources(
+            G, parallel.reachability_rows, workers, networkObj.is_irreflexive()
+        )
+    else:
+        G_transitive = nx.transitive_closure(
+            G, reflexive=True if networkObj.is_irreflexive() else None
+        )
+        edges = G_transitive.edges()
+    if matrix:
+        df = collect_matrix(
+            ((s, t, 1) for s, t in edges), list(G.nodes), symmetric=networkObj.is_symmetric()
+        )
+    elif workers > 1:
+        df = pd.DataFrame(edges, columns=[source_label, target_label])
+        df["reachable"] = 1
+    else:
+        df = nx.to_pandas_edgelist(G_transitive, source=source_label, target=target_label)
+        df["reachable"] = 1
 
     return NetworkPortObject(
         NetworkPortObjectSpec(
@@ -44,12 +64,12 @@ def reachability_transform(networkObj: NetworkPortObject) -> NetworkPortObject:
         df,
     )
 
-def k_reachability_transform(
-    networkObj: NetworkPortObject, max_step: int
-) -> NetworkPortObject:
+def reachability_levels(networkObj: NetworkPortObject, max_step: int) -> pd.DataFrame:
     """
-    Computes the k-reachability transform of a network.
-    The output is a NetworkPortObject with the k-step reachability of nodes.
+    Computes the number of steps from every node to every node reachable in at most max_step steps
+    with one breadth-first search per source, as a (source, target, "steps") edge list.
+    A node reaches itself if it lies on a cycle of at most max_step steps.
+    Undirected networks list every pair in both directions.
     """
     source_label = networkObj.get_source_label()
     target_label = networkObj.get_target_label()
@@ -66,49 +86,51 @@ def k_reachability_transform(
         target=target_label,
         create_using=nx.DiGraph() if not networkObj.is_symmetric() else nx.Graph(),
     )
-    reachability = {node: {} for node in G.nodes}
-    node_queue = {node: set(G.neighbors(node)) for node in G.nodes}
-    for step in range(1, max_step + 1):
-        for source in G.nodes:
-            next_queue = set()
-            for target in node_queue[source]:
-                if target in reachability[source]:
-                    continue
-                reachability[source][target] = step
-                if max_step < (2 * step):
-                    remaining_steps = max_step - step
-                    valid_extensions = {
-                        k: v
-                        for k, v in reachability[target].items()
-                        if v <= remaining_steps
-                    }
-                    new_targets = set(valid_extensions.keys()) - set(
-                        reachability[source].keys()
-                    )
-                    new_reachability = {
-                        k: v + step
-                        for k, v in valid_extensions.items()
-                        if k in new_targets
-                    }
-                    reachability.update(new_reachability)
-                else:
-                    next_queue.update(G.neighbors(target))
-            node_queue[source] = next_queue
+    predecessors = G.predecessors if G.is_directed() else G.neighbors
+
+    rows = []
+    for source in G.nodes:
+        steps = nx.single_source_shortest_path_length(G, source, cutoff=max_step)
+        # shortest closed walk: back to the source from any of its predecessors
+        cycle = min(
+            (steps[u] + 1 for u in predecessors(source) if u in steps),
+            default=max_step + 1,
+        )
+        if cycle <= max_step:
+            rows.append((source, source, cycle))
+        rows.extend(
+            (source, target, step) for target, step in steps.items() if target != source
+        )
+    return pd.DataFrame(rows, columns=[source_label, target_label, "steps"])
+
+
+def k_reachability_transform(
+    networkObj: NetworkPortObject, max_step: int
+) -> NetworkPortObject:
+    """
+    Computes the k-reachability transform of a network.
+    The output is a NetworkPortObject with the k-step reachability of nodes.
+    """
+    levels = reachability_levels(networkObj, max_step)
+    return k_reachability_network(networkObj, levels, max_step)
 
-    edge_list = [
-        (source, target, 1)
-        for source, targets in reachability.items()
-        for target in targets.keys()
-    ]
 
+def k_reachability_network(
+    networkObj: NetworkPortObject, levels: pd.DataFrame, max_step: int
+) -> NetworkPortObject:
+    """
+    Builds the k-reachability network from reachability levels computed up to at least max_step steps.
+    """
+    df = levels.loc[levels["steps"] <= max_step].drop(columns="steps")
+    df["reachable"] = 1
     return NetworkPortObject(
         NetworkPortObjectSpec(
-            source_label=source_label,
-            target_label=target_label,
+            source_label=networkObj.get_source_label(),
+            target_label=networkObj.get_target_label(),
             weight_label="reachable",
             irreflexive=networkObj.is_irreflexive(),
             symmetric=networkObj.is_symmetric(),
             two_mode=networkObj.is_two_mode(),
         ),
-        pd.DataFrame(edge_list, columns=[source_label, target_label, "reachable"])
-    )
\ No newline at end of file
+        df.reset_index(drop=True),
+    )
@@ -10,10 +10,9 @@ def identity_transform(networkObj: NetworkPortObject) -> NetworkPortObject:
     The output is a NetworkPortObject with existing edge weights set to 1.
     """
     weight_label = networkObj.get_weight_label()
-    df = networkObj.get_network()
+    df = networkObj.get_network().copy()
     df[weight_label] = 1
-    networkObj._network = df
-    return networkObj
+    return NetworkPortObject(networkObj.spec, df)
 
 
 def min_max_rescale_transform(networkObj: NetworkPortObject, a, b) -> NetworkPortObject:
@@ -22,11 +21,10 @@ def min_max_rescale_transform(networkObj: NetworkPortObject, a, b) -> NetworkPor
     The output is a NetworkPortObject with rescaled edge weights.
     """
     weight_label = networkObj.get_weight_label()
-    df = networkObj.get_network()
+    df = networkObj.get_network().copy()
     df[weight_label] = (df[weight_label] - df[weight_label].min()) / (df[weight_label].max() - df[weight_label].min())
     df[weight_label] = df[weight_label] * (b - a) + a
-    networkObj._network = df
-    return networkObj
+    return NetworkPortObject(networkObj.spec, df)
 
 def row_normalize_transform(networkObj: NetworkPortObject, degree_type) -> NetworkPortObject:
     """
@@ -34,22 +32,18 @@ def row_normalize_transform(networkObj: NetworkPortObject, degree_type) -> Netwo
     The output is a NetworkPortObject with normalized edge weights.
     """
     weight_label = networkObj.get_weight_label()
-    source_label = networkObj.get_source_label()
-    target_label = networkObj.get_target_label()
-    df = networkObj.get_network()
+    df = networkObj.get_network().copy()
+    index = networkObj.get_node_index()
     if degree_type == "OUT":
-        tot = df.groupby(source_label)[weight_label].transform("sum")
-        df[weight_label] = df[weight_label] / tot
-
+        tot = index.degree("OUT", strength=True)[index.src_ids]
     elif degree_type == "IN":
-        tot = df.groupby(target_label)[weight_label].transform("sum")
-        df[weight_label] = df[weight_label] / tot
-
+        tot = index.degree("IN", strength=True)[index.tgt_ids]
     elif degree_type == "TOTAL":
-        tot_out = df.groupby(source_label)[weight_label].transform("sum")
-        tot_in = df.groupby(target_label)[weight_label].transform("sum")
-        denom = tot_out + tot_in
-        df[weight_label] = df[weight_label] / denom
+        tot = index.out_strength[index.src_ids] + index.in_strength[index.tgt_ids]
+    else:
+        raise ValueError(f"Unknown degree_type: {degree_type}")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df[weight_label] = df[weight_label].to_numpy() / tot
 
     return NetworkPortObject(networkObj.spec, df)
 
@@ -61,28 +55,13 @@ def degree_sum_rescale_transform(networkObj: NetworkPortObject, degree_type) ->
     The output is a NetworkPortObject with summed edge weights.
     """
     weight_label = networkObj.get_weight_label()
-    source_label = networkObj.get_source_label()
-    target_label = networkObj.get_target_label()
-    df = networkObj.get_network()
-
-    out_strength = df.groupby(source_label)[weight_label].sum()
-    in_strength = df.groupby(target_label)[weight_label].sum()
-
-    if degree_type == "OUT":
-        d_u = df[source_label].map(out_strength).fillna(0)
-        d_v = df[target_label].map(out_strength).fillna(0)
-    elif degree_type == "IN":
-        d_u = df[source_label].map(in_strength).fillna(0)
-        d_v = df[target_label].map(in_strength).fillna(0)
-    elif degree_type == "TOTAL":
-        d_u = df[source_label].map(out_strength).fillna(0) + df[source_label].map(in_strength).fillna(0)
-        d_v = df[target_label].map(out_strength).fillna(0) + df[target_label].map(in_strength).fillna(0)
-    else:
-        raise ValueError(f"Unknown degree_type: {degree_type}")
+    df = networkObj.get_network().copy()
+    d_u, d_v = _endpoint_strengths(networkObj, degree_type)
 
     denom = d_u + d_v
-    df[weight_label] = df[weight_label] / denom.replace({0: np.nan})
-    df[weight_label] = df[weight_label].fillna(0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = df[weight_label].to_numpy() / np.where(denom == 0, np.nan, denom)
+    df[weight_label] = np.nan_to_num(weights, nan=0.0, posinf=np.inf, neginf=-np.inf)
 
     return NetworkPortObject(networkObj.spec, df)
 
@@ -95,42 +74,35 @@ def degree_prod_rescale_transform(networkObj: NetworkPortObject, degree_type) ->
     The output is a NetworkPortObject with product edge weights.
     """
     weight_label = networkObj.get_weight_label()
-    source_label = networkObj.get_source_label()
-    target_label = networkObj.get_target_label()
-    df = networkObj.get_network()
-
-    out_strength = df.groupby(source_label)[weight_label].sum()
-    in_strength = df.groupby(target_label)[weight_label].sum()
-
-    if degree_type == "OUT":
-        d_u = df[source_label].map(out_strength).fillna(0)
-        d_v = df[target_label].map(out_strength).fillna(0)
-    elif degree_type == "IN":
-        d_u = df[source_label].map(in_strength).fillna(0)
-        d_v = df[target_label].map(in_strength).fillna(0)
-    elif degree_type == "TOTAL":
-        d_u = df[source_label].map(out_strength).fillna(0) + df[source_label].map(in_strength).fillna(0)
-        d_v = df[target_label].map(out_strength).fillna(0) + df[target_label].map(in_strength).fillna(0)
-    else:
-        raise ValueError(f"Unknown degree_type: {degree_type}")
+    df = networkObj.get_network().copy()
+    d_u, d_v = _endpoint_strengths(networkObj, degree_type)
 
     denom = np.sqrt(d_u * d_v)
-    df[weight_label] = df[weight_label] / denom.replace({0: np.nan})
-    df[weight_label] = df[weight_label].fillna(0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = df[weight_label].to_numpy() / np.where(denom == 0, np.nan, denom)
+    df[weight_label] = np.nan_to_num(weights, nan=0.0, posinf=np.inf, neginf=-np.inf)
 
     return NetworkPortObject(networkObj.spec, df)
 
 
+def _endpoint_strengths(networkObj: NetworkPortObject, degree_type):
+    """
+    {out, in, total} strength of the source and target node of every edge.
+    """
+    index = networkObj.get_node_index()
+    strength = index.degree(degree_type, strength=True)
+    return strength[index.src_ids], strength[index.tgt_ids]
+
+
 def inverse_transform(networkObj: NetworkPortObject, epsilon) -> NetworkPortObject:
     """
     Transforms a network by inverting the edge weights.
     The output is a NetworkPortObject with inverted edge weights.
     """
     weight_label = networkObj.get_weight_label()
-    df = networkObj.get_network()
+    df = networkObj.get_network().copy()
     df[weight_label] = 1 / (df[weight_label] + epsilon)
-    networkObj._network = df
-    return networkObj
+    return NetworkPortObject(networkObj.spec, df)
 
 
 def log_transform(networkObj: NetworkPortObject, base, epsilon) -> NetworkPortObject:
@@ -139,7 +111,6 @@ def log_transform(networkObj: NetworkPortObject, base, epsilon) -> NetworkPortOb
     The output is a NetworkPortObject with transformed edge weights.
     """
     weight_label = networkObj.get_weight_label()
-    df = networkObj.get_network()
+    df = networkObj.get_network().copy()
     df[weight_label] = np.log(df[weight_label] + epsilon) / np.log(base)
-    networkObj._network = df
-    return networkObj
\ No newline at end of file
+    return NetworkPortObject(networkObj.spec, df)
\ No newline at end of file
@@ -1,5 +1,6 @@
 from nodes.network.util.options_transform import (
     TransformOptions,
+    WalkOptions,
     RescaleOptions,
     SymmetrizationOptions,
 )
@@ -54,6 +55,31 @@ def get_transform_schema(input_schema: NetworkPortObjectSpec, settings) -> Netwo
                     symmetric=input_schema.symmetric,
                     two_mode=input_schema.two_mode,
                 )
+            case TransformOptions.BOTTLENECK.name | TransformOptions.RELIABILITY.name:
+                if input_schema.two_mode:
+                    raise ValueError("Input must be one-mode.")
+                return NetworkPortObjectSpec(
+                    source_label=input_schema.source_label,
+                    target_label=input_schema.target_label,
+                    weight_label=settings.transform_type.lower(),
+                    symmetric=input_schema.symmetric,
+                    two_mode=False,
+                    irreflexive=input_schema.irreflexive,
+                )
+            case TransformOptions.WALK.name:
+                if input_schema.two_mode:
+                    raise ValueError(
+                        "Walk transform is not supported for two-mode networks."
+                    )
+                return NetworkPortObjectSpec(
+                    source_label=input_schema.source_label,
+                    target_label=input_schema.target_label,
+                    weight_label=settings.walk_method.lower(),
+                    symmetric=input_schema.symmetric
+                    and settings.walk_method != WalkOptions.TRANSITION_PROBABILITY.name,
+                    two_mode=False,
+                    irreflexive=input_schema.irreflexive,
+                )
             case TransformOptions.IDENTITY.name:
                 return NetworkPortObjectSpec(
                     source_label=input_schema.source_label,
@@ -186,6 +212,15 @@ def get_transform_schema(input_schema: NetworkPortObjectSpec, settings) -> Netwo
                     two_mode=input_schema.two_mode,
                     irreflexive=input_schema.irreflexive,
                 )
+            case TransformOptions.SIMILARITY.name:
+                return NetworkPortObjectSpec(
+                    source_label=input_schema.source_label,
+                    target_label=input_schema.target_label,
+                    weight_label=settings.similarity_method.lower(),
+                    symmetric=not settings.set_top_k,
+                    two_mode=False,
+                    irreflexive=True,
+                )
             case _:
                 raise ValueError("Invalid transformation type selected.")
 
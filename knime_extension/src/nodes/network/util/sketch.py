@@ -0,0 +1,106 @@
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch.
+    Values are kept in compactors, an item in level h stands for 2^h values. A full level is
+    sorted and every second item (random offset) is promoted to the next level, so the memory
+    stays O(k log(n / k)) and the rank error is about 1.7 / k of the number of values.
+    Sketches of different chunks can be merged into the sketch of all values.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0) -> None:
+        if k < 8:
+            raise ValueError("Sketch size must be at least 8.")
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values) -> "QuantileSketch":
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # an odd item stays, the others are halved into the next level
+                keep, items = items[: len(items) % 2], items[len(items) % 2 :]
+                offset = self._rng.integers(2)
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], items[offset::2]]
+                )
+            level += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Approximate q-quantile of all values, q in [0, 1].
+        """
+        if self.count == 0:
+            raise ValueError("Cannot compute a quantile of an empty sketch.")
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(items), 2.0**level) for level, items in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return items[order][min(index, len(items) - 1)]
+
+
+def approximate_percentile(
+    values, percentile: float, k: int = 200, chunk_size: int = 1_000_000
+) -> float:
+    """
+    Approximate percentile (0-100, like np.percentile) of a large array.
+    """
+    return build_sketch(values, k, chunk_size).quantile(percentile / 100)
+
+
+def build_sketch(values, k: int = 200, chunk_size: int = 1_000_000) -> QuantileSketch:
+    """
+    Sketch of a large array, every chunk is summarized by its own sketch and merged.
+    """
+    values = np.asarray(values)
+    sketch = QuantileSketch(k)
+    for start in range(0, len(values), chunk_size):
+        sketch.merge(QuantileSketch(k, seed=start).update(values[start : start + chunk_size]))
+    return sketch
+
+
+def threshold_mask(
+    values, thresh: float, greater: bool, chunk_size: int = 1_000_000
+) -> np.ndarray:
+    """
+    Boolean mask of values >= thresh (or <= thresh), computed chunk by chunk.
+    """
+    values = np.asarray(values)
+    mask = np.empty(len(values), dtype=bool)
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start : start + chunk_size]
+        mask[start : start + chunk_size] = chunk >= thresh if greater else chunk <= thresh
+    return mask
@@ -0,0 +1,166 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from nodes.network.util.incremental import edge_keys, incremental_transform
+from util.port_objects import NetworkPortObject, NetworkSnapshots
+
+LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_COLUMN = "snapshot"
+
+
+def snapshot_bins(times: pd.Series, count: int = 0):
+    """
+    Assigns every value of a time or ordinal column to a snapshot bin.
+    With count 0 every distinct value is a bin, otherwise the range of a numeric or date
+    column is cut into count bins of equal width.
+    Returns (bins, labels), missing values get bin -1.
+    """
+    valid = times.notna().to_numpy()
+    bins = np.full(len(times), -1, dtype=np.int64)
+    values = times[valid]
+    if count == 0:
+        distinct = np.sort(values.unique())
+        bins[valid] = np.searchsorted(distinct, values.to_numpy())
+        return bins, pd.Series(distinct).astype(str).tolist()
+
+    is_date = pd.api.types.is_datetime64_any_dtype(times)
+    if not (is_date or pd.api.types.is_numeric_dtype(times)):
+        raise ValueError("Equal-width snapshots need a numeric or date column.")
+    if is_date:
+        numbers = values.astype("datetime64[ns]").to_numpy().view(np.int64)
+    else:
+        numbers = values.to_numpy(dtype=np.float64)
+    if len(numbers) == 0:
+        raise ValueError("The snapshot column has no values.")
+    edges = np.linspace(numbers.min(), numbers.max(), count + 1)
+    bins[valid] = np.clip(np.searchsorted(edges, numbers, side="right") - 1, 0, count - 1)
+    upper = pd.to_datetime(edges[1:].astype(np.int64), unit="ns") if is_date else edges[1:]
+    return bins, pd.Series(upper).astype(str).tolist()
+
+
+def snapshot_network(
+    networkObj: NetworkPortObject,
+    times: pd.Series,
+    mode: str,
+    count: int = 0,
+    window: int = 1,
+) -> NetworkPortObject:
+    """
+    Slices a network into snapshots by a time or ordinal column aligned with its edge rows.
+    "CUMULATIVE" snapshots contain all edges up to their bin, "WINDOW" snapshots the edges of
+    the last window bins. Edges without a time belong to every snapshot.
+    """
+    if window < 1:
+        raise ValueError("The window must span at least one snapshot.")
+    bins, labels = snapshot_bins(times, count)
+    n = len(labels)
+    start = np.where(bins < 0, 0, bins)
+    if mode == "CUMULATIVE":
+        end = np.full(len(bins), n)
+    elif mode == "WINDOW":
+        end = np.where(bins < 0, n, np.minimum(bins + window, n))
+    else:
+        raise ValueError(f"Unknown snapshot mode: {mode}")
+
+    order = np.argsort(start, kind="stable")
+    df = networkObj.get_network().iloc[order].reset_index(drop=True)
+    return NetworkPortObject(
+        networkObj.spec, df, NetworkSnapshots(labels, start[order], end[order])
+    )
+
+
+def snapshot_edges(
+    networkObj: NetworkPortObject, column: str = SNAPSHOT_COLUMN
+) -> pd.DataFrame:
+    """
+    Edge list with one row per edge and snapshot, the snapshot name in column.
+    """
+    snapshots = networkObj.get_snapshots()
+    rows, ids = snapshots.expand()
+    df = networkObj.get_network().iloc[rows].reset_index(drop=True)
+    df[column] = np.asarray(snapshots.labels, dtype=object)[ids]
+    return df
+
+
+def snapshot_delta(networkObj: NetworkPortObject, snapshot: int) -> pd.DataFrame:
+    """
+    Edge delta from the previous snapshot, ended edges with a missing weight first.
+    """
+    snapshots = networkObj.get_snapshots()
+    df = networkObj.get_network()
+    cols = [
+        networkObj.get_source_label(),
+        networkObj.get_target_label(),
+        networkObj.get_weight_label(),
+    ]
+    ended = df.loc[snapshots.end == snapshot, cols].copy()
+    ended[cols[2]] = np.nan
+    return pd.concat([ended, df.loc[snapshots.start == snapshot, cols]], ignore_index=True)
+
+
+def _has_unique_edges(networkObj: NetworkPortObject, snapshot: int) -> bool:
+    df = networkObj.get_network()[networkObj.get_snapshots().active(snapshot)]
+    return edge_keys(
+        df,
+        networkObj.get_source_label(),
+        networkObj.get_target_label(),
+        networkObj.is_symmetric(),
+    ).is_unique
+
+
+def snapshot_transform(
+    networkObj: NetworkPortObject,
+    settings,
+    transform,
+    row_local: bool = False,
+    incremental: str | None = None,
+    max_share: float = 0.2,
+) -> NetworkPortObject:
+    """
+    Runs transform(network, settings) across all snapshots of a network.
+    - row_local transforms (weight maps and absolute edge filters) run once on the base edges
+      and keep the snapshots of the remaining rows
+    - distance and reachability (incremental set to the transform) are computed in full
+      for the first snapshot and updated with the edge delta of every following one, unless
+      the delta exceeds max_share of the edges or nodes
+    - other transforms run on every snapshot
+    The output has one snapshot per input snapshot.
+    """
+    snapshots = networkObj.get_snapshots()
+    df = networkObj.get_network()
+
+    if row_local:
+        result = transform(NetworkPortObject(networkObj.spec, df), settings)
+        rows = df.index.get_indexer(result.get_network().index)
+        return NetworkPortObject(
+            result.spec, result.get_network().reset_index(drop=True), snapshots.take(rows)
+        )
+
+    results = []
+    previous = None
+    previous_unique = False
+    for i in range(len(snapshots)):
+        current = networkObj.get_snapshot(i)
+        # checked once per snapshot, the result of the previous snapshot is carried forward
+        unique = incremental is not None and _has_unique_edges(networkObj, i)
+        if previous is not None and previous_unique and unique:
+            _, result = incremental_transform(
+                previous, results[-1], snapshot_delta(networkObj, i), incremental, max_share
+            )
+        else:
+            result = transform(current, settings)
+        LOGGER.info(f"Snapshot {snapshots.labels[i]}: {len(result.get_network())} rows.")
+        results.append(result)
+        previous = current
+        previous_unique = unique
+
+    counts = [len(result.get_network()) for result in results]
+    start = np.repeat(np.arange(len(results)), counts)
+    return NetworkPortObject(
+        results[0].spec,
+        pd.concat([result.get_network() for result in results], ignore_index=True),
+        NetworkSnapshots(snapshots.labels, start, start + 1),
+    )
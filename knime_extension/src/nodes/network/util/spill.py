@@ -0,0 +1,85 @@
+import os
+import tempfile
+import weakref
+
+import pandas as pd
+
+from util.port_objects import SpilledEdges
+
+# rows buffered before the size of a row is estimated
+SAMPLE_ROWS = 1024
+
+
+class ChunkWriter:
+    """
+    Writes output rows to a temporary Parquet file in chunks of about budget_bytes.
+    Only the rows of the current chunk are held in memory. The chunk size in rows is
+    estimated from the first SAMPLE_ROWS rows, dtypes fixes the column types of all chunks.
+    """
+
+    def __init__(self, columns: list, budget_bytes: int, dtypes: dict | None = None) -> None:
+        self.columns = columns
+        self.budget_bytes = budget_bytes
+        self.dtypes = dtypes or {}
+        self.chunk_rows = SAMPLE_ROWS
+        self.num_rows = 0
+        self._estimated = False
+        self._rows = []
+        self._writer = None
+        fd, self.path = tempfile.mkstemp(prefix="knime_networks_", suffix=".parquet")
+        os.close(fd)
+        # removes the file if the transform fails before close
+        self._cleanup = weakref.finalize(self, SpilledEdges.remove, self.path)
+
+    def append(self, row: tuple) -> None:
+        self._rows.append(row)
+        if len(self._rows) >= self.chunk_rows:
+            self.flush()
+
+    def extend(self, rows) -> None:
+        for row in rows:
+            self.append(row)
+
+    def flush(self) -> None:
+        if not self._rows and self._writer is not None:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        chunk = pd.DataFrame(self._rows, columns=self.columns).astype(self.dtypes)
+        self._rows = []
+        if not self._estimated and len(chunk):
+            row_bytes = chunk.memory_usage(deep=True, index=False).sum() / len(chunk)
+            self.chunk_rows = max(SAMPLE_ROWS, int(self.budget_bytes // max(row_bytes, 1)))
+            self._estimated = True
+
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+        self.num_rows += len(chunk)
+
+    def close(self) -> SpilledEdges:
+        """
+        Writes the last chunk and hands the file over to the returned edge list.
+        """
+        self.flush()
+        self._writer.close()
+        self._cleanup.detach()
+        return SpilledEdges(self.path, self.num_rows)
+
+
+def collect_rows(rows, columns: list, spill_mb: int | None = None, dtypes: dict | None = None):
+    """
+    Edge list of the (source, target, value) rows of an all-pairs transform.
+    Without spill_mb the rows are collected into a DataFrame, otherwise they are written to
+    a temporary Parquet file in chunks of about spill_mb megabytes and a SpilledEdges
+    reference to the file is returned.
+    """
+    if spill_mb is None:
+        return pd.DataFrame(list(rows), columns=columns)
+    writer = ChunkWriter(columns, spill_mb * 1024 * 1024, dtypes)
+    writer.extend(rows)
+    return writer.close()
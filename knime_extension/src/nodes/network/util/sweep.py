@@ -0,0 +1,230 @@
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from nodes.network.util.options_transform import (
+    TransformOptions,
+    FilterOptions,
+    ThresholdOptions,
+    FilterModeOptions,
+    SweepOptions,
+)
+from nodes.network.util.pipeline import STEP_DEFAULTS, apply_transform, validate_transform
+from nodes.network.util.cores import core_numbers
+from nodes.network.util.filter import edge_end_ranks, disparity_p_values
+from nodes.network.util.reachability import reachability_levels, k_reachability_network
+from nodes.network.util.sketch import build_sketch
+from util.port_objects import NetworkPortObject
+
+LOGGER = logging.getLogger(__name__)
+
+
+def sweep_settings(settings, parameter: str, value) -> SimpleNamespace:
+    """
+    Copy of the node settings with the swept parameter set to value.
+    """
+    step = SimpleNamespace(**{key: getattr(settings, key) for key in STEP_DEFAULTS})
+    setattr(step, parameter.lower(), value)
+    return step
+
+
+def parse_sweep_values(text: str, parameter: str, settings) -> list:
+    """
+    Parses the comma separated values of a sweep and checks the settings of every value.
+    """
+    if parameter == SweepOptions.NONE.name:
+        return []
+    key = parameter.lower()
+    cast = type(STEP_DEFAULTS[key])
+    values = []
+    for token in text.replace(";", ",").split(","):
+        token = token.strip()
+        if not token:
+            continue
+        try:
+            value = cast(token)
+        except ValueError:
+            raise ValueError(f"Invalid sweep value '{token}'.") from None
+        if cast is int and value < 1:
+            raise ValueError("Swept step and edge counts must be at least 1.")
+        validate_transform(sweep_settings(settings, parameter, value))
+        values.append(value)
+    if not values:
+        raise ValueError("Enter at least one sweep value.")
+    return values
+
+
+def sweep_transform(
+    networkObj: NetworkPortObject, settings, parameter: str, values: list
+) -> list[NetworkPortObject]:
+    """
+    Runs one transformation for every value of a single parameter.
+    Preprocessing that does not depend on the parameter is shared by all values:
+    threshold filters sort the edge (node, core) values once, top-k filters rank the edges of
+    every node once, backbone filters compute the p-values once and k-reachability runs one
+    breadth-first search per node up to the largest k. Other sweeps, and sweeps over networks
+    with snapshots, run the transformation once per value.
+    """
+    if not values:
+        return []
+    if networkObj.get_snapshots() is not None:
+        return [
+            apply_transform(networkObj, sweep_settings(settings, parameter, value))
+            for value in values
+        ]
+    transform_type = settings.transform_type
+    filter_type = settings.filter_type
+    if transform_type == TransformOptions.FILTER.name:
+        if parameter == SweepOptions.FILTER_VALUE.name:
+            if filter_type == FilterOptions.EDGE.name:
+                return _edge_threshold_sweep(networkObj, settings, values)
+            if filter_type == FilterOptions.NODE.name:
+                return _node_threshold_sweep(networkObj, settings, values)
+            if filter_type == FilterOptions.CORE.name:
+                return _core_threshold_sweep(networkObj, settings, values)
+        if (
+            parameter == SweepOptions.FILTER_TOP_K.name
+            and filter_type == FilterOptions.TOP_K.name
+        ):
+            return _top_k_sweep(networkObj, settings, values)
+        if (
+            parameter == SweepOptions.FILTER_ALPHA.name
+            and filter_type == FilterOptions.BACKBONE.name
+        ):
+            return _backbone_sweep(networkObj, settings, values)
+    if (
+        transform_type == TransformOptions.REACHABILITY.name
+        and settings.set_k
+        and parameter == SweepOptions.K_VALUE.name
+    ):
+        levels = reachability_levels(networkObj, max(values))
+        return [k_reachability_network(networkObj, levels, k) for k in values]
+
+    LOGGER.info(
+        f"No shared preprocessing for {parameter} of {transform_type}, running every value."
+    )
+    return [
+        apply_transform(networkObj, sweep_settings(settings, parameter, value))
+        for value in values
+    ]
+
+
+def sweep_thresholds(filtered: np.ndarray, settings, values: list) -> np.ndarray:
+    """
+    Thresholds of all sweep values for the filtered (edge, node or core) values.
+    """
+    if settings.filter_threshold == ThresholdOptions.ABSOLUTE_THRESHOLD.name:
+        return np.asarray(values, dtype=np.float64)
+    if settings.filter_threshold == ThresholdOptions.PERCENTILE_THRESHOLD.name:
+        return np.atleast_1d(np.percentile(filtered, values))
+    if settings.filter_threshold == ThresholdOptions.APPROX_PERCENTILE_THRESHOLD.name:
+        sketch = build_sketch(filtered, k=settings.sketch_size)
+        return np.asarray([sketch.quantile(value / 100) for value in values])
+    raise ValueError(f"Unknown filter_threshold: {settings.filter_threshold}")
+
+
+def sorted_mask(
+    order: np.ndarray, sorted_values: np.ndarray, thresh: float, greater: bool
+) -> np.ndarray:
+    """
+    Boolean mask of values >= thresh (or <= thresh) found with a binary search in the sorted
+    values, order maps them back to their positions. Missing values are never kept.
+    """
+    mask = np.zeros(len(order), dtype=bool)
+    if np.isnan(thresh):
+        return mask
+    if greater:
+        start = np.searchsorted(sorted_values, thresh, side="left")
+        end = len(sorted_values) - np.isnan(sorted_values).sum()
+        mask[order[start:end]] = True
+    else:
+        mask[order[: np.searchsorted(sorted_values, thresh, side="right")]] = True
+    return mask
+
+
+def _sorted(values: np.ndarray):
+    if not pd.api.types.is_numeric_dtype(values):
+        raise ValueError("Weight column must be numeric.")
+    order = np.argsort(values, kind="stable")
+    return order, values[order]
+
+
+def _edge_threshold_sweep(networkObj: NetworkPortObject, settings, values: list):
+    df = networkObj.get_network()
+    weights = df[networkObj.get_weight_label()].to_numpy()
+    order, sorted_weights = _sorted(weights)
+    greater = settings.filter_mode == FilterModeOptions.GREATER.name
+    return [
+        NetworkPortObject(
+            networkObj.spec, df[sorted_mask(order, sorted_weights, thresh, greater)]
+        )
+        for thresh in sweep_thresholds(weights, settings, values)
+    ]
+
+
+def _node_threshold_sweep(networkObj: NetworkPortObject, settings, values: list):
+    df = networkObj.get_network()
+    index = networkObj.get_node_index()
+    present = index.has_edges(settings.degree_type)
+    node_vals = index.degree(settings.degree_type, strength=settings.strength_mode)[present]
+    order, sorted_vals = _sorted(node_vals)
+    greater = settings.filter_mode == FilterModeOptions.GREATER.name
+
+    results = []
+    for thresh in sweep_thresholds(node_vals, settings, values):
+        keep_nodes = present.copy()
+        keep_nodes[present] = sorted_mask(order, sorted_vals, thresh, greater)
+        results.append(
+            NetworkPortObject(
+                networkObj.spec, df[keep_nodes[index.src_ids] & keep_nodes[index.tgt_ids]]
+            )
+        )
+    return results
+
+
+def _core_threshold_sweep(networkObj: NetworkPortObject, settings, values: list):
+    cores, src_ids, tgt_ids = core_numbers(
+        networkObj, settings.degree_type, weighted=settings.strength_mode
+    )
+    df = networkObj.get_network().copy()
+    if settings.add_core_columns:
+        df[f"{networkObj.get_source_label()}_core"] = cores[src_ids]
+        df[f"{networkObj.get_target_label()}_core"] = cores[tgt_ids]
+    # an edge stays as long as the smaller core number of its nodes reaches the threshold
+    order, sorted_cores = _sorted(np.minimum(cores[src_ids], cores[tgt_ids]))
+    return [
+        NetworkPortObject(networkObj.spec, df[sorted_mask(order, sorted_cores, thresh, True)])
+        for thresh in sweep_thresholds(cores, settings, values)
+    ]
+
+
+def _top_k_sweep(networkObj: NetworkPortObject, settings, values: list):
+    """
+    Ranks the edge ends of every node once, the top-k edges of all k are then a rank cut.
+    The ranks are the ones of the top-k filter, so ties are broken the same way.
+    """
+    df = networkObj.get_network()
+    rows, ranks = edge_end_ranks(
+        networkObj,
+        settings.degree_type,
+        largest=settings.filter_mode == FilterModeOptions.GREATER.name,
+    )
+    results = []
+    for k in values:
+        keep = np.zeros(len(df), dtype=bool)
+        keep[rows[ranks < k]] = True
+        results.append(NetworkPortObject(networkObj.spec, df[keep]))
+    return results
+
+
+def _backbone_sweep(networkObj: NetworkPortObject, settings, values: list):
+    df = networkObj.get_network()
+    p_values, rows = disparity_p_values(networkObj, settings.degree_type)
+    results = []
+    for alpha in values:
+        keep = np.zeros(len(df), dtype=bool)
+        keep[rows[p_values < alpha]] = True
+        results.append(NetworkPortObject(networkObj.spec, df[keep]))
+    return results
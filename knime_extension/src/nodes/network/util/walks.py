@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from nodes.network.util.adjacency import adjacency_matrix
+from util.port_objects import (
+    NetworkPortObject,
+    NetworkPortObjectSpec,
+)
+
+
+def walk_transform(
+    networkObj: NetworkPortObject,
+    method: str,
+    k: int,
+    attenuation: float = 0.1,
+    block_size: int = 1024,
+    dense_cutoff: float = 0.1,
+) -> NetworkPortObject:
+    """
+    Computes walk-based relations between all node pairs.
+    - method: "WALK_COUNT" (A^k), "ATTENUATED_WALK" (sum of attenuation^t · A^t for t = 1..k)
+      or "TRANSITION_PROBABILITY" (P^k with the row-normalized adjacency P)
+    - k: number of steps
+    - attenuation: factor per step for attenuated walks
+    - block_size: number of target columns propagated together
+    - dense_cutoff: density above which a block is propagated as a dense array
+    Edge weights are used as walk weights, use the identity transformation first to count plain walks.
+    The output is a NetworkPortObject with an edge (u, v) for every non-zero entry.
+    """
+    source_label = networkObj.get_source_label()
+    target_label = networkObj.get_target_label()
+
+    if networkObj.is_two_mode():
+        raise ValueError(
+            "Walk transform is not supported for two-mode networks. Consider projection to one-mode network."
+        )
+    if k < 1:
+        raise ValueError("Number of steps must be at least 1.")
+
+    labels, _, A = adjacency_matrix(networkObj)
+    n = A.shape[0]
+    if method == "TRANSITION_PROBABILITY":
+        strength = np.asarray(A.sum(axis=1)).ravel()
+        scale = np.divide(1.0, strength, out=np.zeros(n), where=strength != 0)
+        A = sp.diags(scale) @ A
+    elif method not in ("WALK_COUNT", "ATTENUATED_WALK"):
+        raise ValueError(f"Unknown walk method: {method}")
+    A = A.tocsr()
+    # a filled-up block is multiplied with a dense adjacency if that one is dense as well
+    A_dense = A.toarray() if A.nnz > dense_cutoff * n * n else None
+
+    symmetric = networkObj.is_symmetric() and method != "TRANSITION_PROBABILITY"
+    rows, cols, values = [], [], []
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        # X holds the columns start..stop of A^t, starting with the identity
+        X = sp.csr_matrix(
+            (np.ones(stop - start), (np.arange(start, stop), np.arange(stop - start))),
+            shape=(n, stop - start),
+        )
+        total = None
+        for step in range(1, k + 1):
+            if sp.issparse(X):
+                X = (A @ X).tocsr()
+                if X.nnz > dense_cutoff * X.shape[0] * X.shape[1]:
+                    X = X.toarray()
+            else:
+                X = A_dense @ X if A_dense is not None else A @ X
+            if method == "ATTENUATED_WALK":
+                term = X * attenuation**step
+                if total is None:
+                    total = term
+                elif sp.issparse(total) and sp.issparse(term):
+                    total = total + term
+                else:
+                    total = _as_dense(total) + _as_dense(term)
+        result = total if method == "ATTENUATED_WALK" else X
+
+        if sp.issparse(result):
+            result = result.tocoo()
+            r, c, v = result.row, result.col + start, result.data
+        else:
+            r, c = np.nonzero(result)
+            v = result[r, c]
+            c = c + start
+        keep = v != 0
+        if networkObj.is_irreflexive():
+            keep &= r != c
+        if symmetric:
+            keep &= r <= c
+        rows.append(r[keep])
+        cols.append(c[keep])
+        values.append(v[keep])
+
+    weight_label = method.lower()
+    rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    cols = np.concatenate(cols) if cols else np.empty(0, dtype=np.int64)
+    df = pd.DataFrame(
+        {
+            source_label: labels.take(rows),
+            target_label: labels.take(cols),
+            weight_label: np.concatenate(values) if values else np.empty(0),
+        }
+    )
+
+    return NetworkPortObject(
+        NetworkPortObjectSpec(
+            source_label=source_label,
+            target_label=target_label,
+            weight_label=weight_label,
+            irreflexive=networkObj.is_irreflexive(),
+            symmetric=symmetric,
+            two_mode=False,
+        ),
+        df,
+    )
+
+
+def _as_dense(X) -> np.ndarray:
+    return X.toarray() if sp.issparse(X) else X
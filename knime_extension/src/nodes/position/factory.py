@@ -35,6 +35,21 @@ class NetworkPositionSettings:
         enum=StringMethodOptions,
         default_value=StringMethodOptions.BINARY.name,
     )
+    workers = knext.IntParameter(
+        label="Parallel Workers",
+        description="Number of input networks processed at the same time, 0 uses all "
+        "available cores.",
+        default_value=1,
+        min_value=0,
+        is_advanced=True,
+    )
+    use_processes = knext.BoolParameter(
+        label="Use Processes",
+        description="Process the input networks in separate processes instead of threads. "
+        "Processes also run the Python parts in parallel, but copy the networks.",
+        default_value=False,
+        is_advanced=True,
+    )
 
 
 @knext.node(
@@ -78,4 +93,10 @@ class NetworkPositionNode:
     def execute(
         self, context, input_networks: list[NetworkPortObject], input_attributes: list[AttributePortObject] = []
     ) -> PositionPortObject:
-        return create_positions(input_networks, input_attributes, self.settings.string_method)
+        return create_positions(
+            input_networks,
+            input_attributes,
+            self.settings.string_method,
+            workers=self.settings.workers,
+            processes=self.settings.use_processes,
+        )
@@ -1,7 +1,7 @@
 import knime.extension as knext
-import pandas as pd
 
 import networks_ext
+from util.position_algorithms import long_batches, wide_table
 from util.port_objects import (
     PositionPortObject,
     PositionPortObjectSpec,
@@ -10,8 +10,27 @@ from util.port_types import (
     position_port_type,
 )
 
+
+class PositionTableFormatOptions(knext.EnumParameterOptions):
+    WIDE = (
+        "Wide",
+        "One row per node and one column per dimension.",
+    )
+    LONG = (
+        "Long",
+        "One row per node and dimension with the columns node, dimension and value. "
+        "Only existing coordinates are output unless missing values are filled.",
+    )
+
+
 @knext.parameter_group(label="Position to Table Settings")
 class PositionTableNodeParameters:
+    output_format = knext.EnumParameter(
+        label="Output Format",
+        description="Select the layout of the output table.",
+        enum=PositionTableFormatOptions,
+        default_value=PositionTableFormatOptions.WIDE.name,
+    )
     use_default = knext.BoolParameter(
         label="Fill Missing Values",
         description="Whether to fill missing values with a default value.",
@@ -51,9 +70,12 @@ class PositionTableNode:
         return None
 
     def execute(self, context, input: PositionPortObject) -> knext.Table:
-        positions, _ = input.get_uniform_positions()
-        df = pd.DataFrame.from_dict(positions, orient='index')
-        if self.settings.use_default:
-            df.fillna(self.settings.default_value, inplace=True)
+        default_value = self.settings.default_value if self.settings.use_default else None
+        if self.settings.output_format == PositionTableFormatOptions.LONG.name:
+            # written batch by batch, the table is never held in memory at once
+            table = knext.BatchOutputTable.create(row_ids="generate")
+            for batch in long_batches(input, default_value):
+                table.append(batch)
+            return table
 
-        return knext.Table.from_pandas(df)
+        return knext.Table.from_pyarrow(wide_table(input, default_value), row_ids="keep")
@@ -27,6 +27,11 @@ class PositionTransformOptions(knext.EnumParameterOptions):
     )
     MAX = ("Max Transform", "Compute the maximum coordinate for every node position.")
     MIN = ("Min Transform", "Compute the minimum coordinate for every node position.")
+    MULTI_AGGREGATE = (
+        "Multiple Aggregates",
+        "Compute the selected aggregates for every node position in one pass, "
+        "one dimension per aggregate.",
+    )
     INVERSE = (
         "Inverse Transform",
         "Compute the inverse of all the coordinates for every node position.",
@@ -35,12 +40,33 @@ class PositionTransformOptions(knext.EnumParameterOptions):
         "Log Transform",
         "Compute the logarithm of all the coordinates for every node position.",
     )
+    POWER = (
+        "Power Transform",
+        "Raise all the coordinates of every node position to a power.",
+    )
+    CLIP = (
+        "Clip Transform",
+        "Limit all the coordinates of every node position to an interval.",
+    )
+    RANK = (
+        "Rank Transform",
+        "Replace every coordinate by its rank among the coordinates of its dimension.",
+    )
     ZSCORE = (
         "Z-Score Transform",
         "Compute the Z-Score normalization for every node coordinate.",
     )
 
 
+class AggregateOptions(knext.EnumParameterOptions):
+    SUM = ("Sum", "Sum of all coordinates.")
+    EUCLIDEAN_NORM = ("Euclidean Norm", "Euclidean norm of the coordinates.")
+    MANHATTAN_NORM = ("Manhattan Norm", "Manhattan norm of the coordinates.")
+    AVERAGE = ("Average", "Average of all coordinates.")
+    MAX = ("Max", "Maximum coordinate.")
+    MIN = ("Min", "Minimum coordinate.")
+
+
 @knext.parameter_group(label="Position Transformation Settings")
 class PositionTransformationNodeParameters:
     transform_type = knext.EnumParameter(
@@ -49,6 +75,21 @@ class PositionTransformationNodeParameters:
         enum=PositionTransformOptions,
         default_value=PositionTransformOptions.SUM.name,
     )
+    aggregates = knext.EnumSetParameter(
+        label="Aggregates",
+        description="Select the aggregates to compute, each becomes one dimension of "
+        "the output positions.",
+        default_value=[
+            AggregateOptions.SUM.name,
+            AggregateOptions.EUCLIDEAN_NORM.name,
+            AggregateOptions.MAX.name,
+            AggregateOptions.AVERAGE.name,
+        ],
+        enum=AggregateOptions,
+    ).rule(
+        knext.OneOf(transform_type, [PositionTransformOptions.MULTI_AGGREGATE.name]),
+        knext.Effect.SHOW,
+    )
     use_default = knext.BoolParameter(
         label="Use Default Settings",
         description="Whether to use default value for missing/undefined positions.",
@@ -59,6 +100,40 @@ class PositionTransformationNodeParameters:
         description="Default value to use for missing/undefined positions.",
         default_value=0.0,
     )
+    epsilon = knext.DoubleParameter(
+        label="Epsilon",
+        description="Constant added to every coordinate before the inverse is taken, "
+        "to avoid division by zero.",
+        default_value=1e-6,
+        min_value=0.0,
+    ).rule(
+        knext.OneOf(transform_type, [PositionTransformOptions.INVERSE.name]),
+        knext.Effect.SHOW,
+    )
+    exponent = knext.DoubleParameter(
+        label="Exponent",
+        description="Power every coordinate is raised to.",
+        default_value=2.0,
+    ).rule(
+        knext.OneOf(transform_type, [PositionTransformOptions.POWER.name]),
+        knext.Effect.SHOW,
+    )
+    clip_lower = knext.DoubleParameter(
+        label="Lower Bound",
+        description="Coordinates below the lower bound are set to the lower bound.",
+        default_value=0.0,
+    ).rule(
+        knext.OneOf(transform_type, [PositionTransformOptions.CLIP.name]),
+        knext.Effect.SHOW,
+    )
+    clip_upper = knext.DoubleParameter(
+        label="Upper Bound",
+        description="Coordinates above the upper bound are set to the upper bound.",
+        default_value=1.0,
+    ).rule(
+        knext.OneOf(transform_type, [PositionTransformOptions.CLIP.name]),
+        knext.Effect.SHOW,
+    )
 
 
 @knext.node(
@@ -85,6 +160,18 @@ class PositionTransformationNode(knext.PythonNode):
         configure_context: knext.ConfigurationContext,
         input_schema: PositionPortObjectSpec,
     ) -> PositionPortObjectSpec:
+        if (
+            self.settings.transform_type == PositionTransformOptions.MULTI_AGGREGATE.name
+            and not self.settings.aggregates
+        ):
+            raise knext.InvalidParametersError("Select at least one aggregate.")
+        if (
+            self.settings.transform_type == PositionTransformOptions.CLIP.name
+            and self.settings.clip_lower > self.settings.clip_upper
+        ):
+            raise knext.InvalidParametersError(
+                "Lower bound must not be greater than upper bound."
+            )
         return PositionPortObjectSpec(
             node_column=input_schema.node_column,
         )
@@ -123,18 +210,41 @@ class PositionTransformationNode(knext.PythonNode):
                     input,
                     self.settings.default_value if self.settings.use_default else None,
                 )
+            case PositionTransformOptions.MULTI_AGGREGATE.name:
+                return algo.aggregate_transform(
+                    input,
+                    self.settings.aggregates,
+                    self.settings.default_value if self.settings.use_default else None,
+                )
             case PositionTransformOptions.INVERSE.name:
-                # TODO: Implement custom epsilon handling for inverse transform
                 return algo.inverse_transform(
                     input,
                     self.settings.default_value if self.settings.use_default else None,
-                    epsilon=1e-6,
+                    epsilon=self.settings.epsilon,
                 )
             case PositionTransformOptions.LOG.name:
                 return algo.log_transform(
                     input,
                     self.settings.default_value if self.settings.use_default else None,
                 )
+            case PositionTransformOptions.POWER.name:
+                return algo.power_transform(
+                    input,
+                    self.settings.default_value if self.settings.use_default else None,
+                    exponent=self.settings.exponent,
+                )
+            case PositionTransformOptions.CLIP.name:
+                return algo.clip_transform(
+                    input,
+                    self.settings.default_value if self.settings.use_default else None,
+                    lower=self.settings.clip_lower,
+                    upper=self.settings.clip_upper,
+                )
+            case PositionTransformOptions.RANK.name:
+                return algo.rank_transform(
+                    input,
+                    self.settings.default_value if self.settings.use_default else None,
+                )
             case PositionTransformOptions.ZSCORE.name:
                 return algo.zscore_transform(
                     input,
@@ -0,0 +1,212 @@
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from nodes.position.util.factory import align_layers
+from util.port_objects import (
+    PositionMatrix,
+    PositionPortObject,
+    PositionPortObjectSpec,
+)
+
+# dimension names of the aggregates
+AGGREGATE_LABELS = {
+    "SUM": "sum",
+    "EUCLIDEAN_NORM": "euclidean",
+    "MANHATTAN_NORM": "manhattan",
+    "AVERAGE": "average",
+    "MAX": "max",
+    "MIN": "min",
+}
+
+
+def uniform_matrix(input: PositionPortObject) -> PositionMatrix:
+    """
+    All layers of a position object side by side in one float64 CSR matrix, the dimensions
+    of layer i get the suffix _i like in get_uniform_positions.
+    Rows are the nodes with a position in any layer, columns the dimensions with a stored
+    value at any node. Stored NaN values count as missing coordinates.
+    """
+    layers = []
+    for i, (pos, _, _) in enumerate(input.get_layers(), start=1):
+        if isinstance(pos, PositionMatrix):
+            # matrix layers share their node index, nodes without a coordinate are unused
+            keep = np.diff(pos.matrix.indptr) > 0
+            pos = PositionMatrix(pos.nodes[keep], pos.dims, pos.matrix[keep])
+        else:
+            pos = dict_to_matrix(pos)
+        layers.append(PositionMatrix(pos.nodes, pos.dims.astype(str) + f"_{i}", pos.matrix))
+    if not layers:
+        return PositionMatrix([], [], sp.csr_matrix((0, 0)))
+
+    layers = align_layers(layers)
+    matrix = sp.hstack([layer.matrix for layer in layers], format="csr", dtype=np.float64)
+    dims = pd.Index(np.concatenate([layer.dims.to_numpy(dtype=object) for layer in layers]))
+    used = np.bincount(matrix.indices, minlength=matrix.shape[1]) > 0
+    if not used.all():
+        matrix = matrix[:, used]
+        dims = dims[used]
+    return PositionMatrix(layers[0].nodes, dims, matrix)
+
+
+def dict_to_matrix(positions: dict, dims=()) -> PositionMatrix:
+    """
+    PositionMatrix of a dict[node][dim] = value layer, missing values (None) become NaN.
+    The columns are dims followed by the other dimensions in order of appearance.
+    """
+    counts = [len(coords) for coords in positions.values()]
+    keys = [dim for coords in positions.values() for dim in coords]
+    try:
+        values = np.array(
+            [value for coords in positions.values() for value in coords.values()],
+            dtype=np.float64,
+        )
+    except (TypeError, ValueError):
+        raise ValueError("Position values must be numeric.")
+    codes, dims = pd.factorize(pd.Index(list(dims) + keys, dtype=object))
+    codes = codes[len(codes) - len(keys) :]
+    indptr = np.concatenate([[0], np.cumsum(counts, dtype=np.int64)])
+    matrix = sp.csr_matrix(
+        (values, codes.astype(np.int64), indptr), shape=(len(positions), len(dims))
+    )
+    return PositionMatrix(list(positions), dims, matrix)
+
+
+def row_reduce(ufunc: np.ufunc, data: np.ndarray, indptr: np.ndarray, fill: float) -> np.ndarray:
+    """
+    ufunc.reduce over the values of every row of a CSR matrix with the given data,
+    NaN values are replaced by fill and rows without a stored value give fill.
+    """
+    data = np.where(np.isnan(data), fill, data)
+    starts = indptr[:-1]
+    nonempty = np.diff(indptr) > 0
+    result = np.full(len(starts), fill, dtype=np.float64)
+    # empty rows have no values, so every reduceat segment ends at the next non-empty row
+    if nonempty.any():
+        result[nonempty] = ufunc.reduceat(data, starts[nonempty])
+    return result
+
+
+def missing_counts(matrix) -> np.ndarray:
+    """
+    Number of dimensions without a value (not stored or NaN) in every row.
+    """
+    valid = (~np.isnan(matrix.data)).astype(np.float64)
+    return matrix.shape[1] - row_reduce(np.add, valid, matrix.indptr, 0.0)
+
+
+class RowAggregates:
+    """
+    Aggregates of every row of a uniform position matrix. The row reductions are computed
+    once and shared, so several aggregates of the same positions need a single merge of
+    the layers. A default value adds default × number of missing dimensions to the
+    reductions, missing values are never filled in.
+    """
+
+    def __init__(self, positions: PositionMatrix, default_value=None) -> None:
+        self.positions = positions
+        self.matrix = positions.matrix
+        self.default_value = default_value
+
+    def aggregate(self, name: str) -> np.ndarray:
+        match name:
+            case "SUM":
+                return self.sum
+            case "EUCLIDEAN_NORM":
+                return np.sqrt(self.squared_sum)
+            case "MANHATTAN_NORM":
+                return self.abs_sum
+            case "AVERAGE":
+                return self.average
+            case "MAX":
+                return self._extreme(np.maximum, -np.inf)
+            case "MIN":
+                return self._extreme(np.minimum, np.inf)
+            case _:
+                raise ValueError(f"Unknown aggregate: {name}")
+
+    @cached_property
+    def missing(self) -> np.ndarray:
+        return missing_counts(self.matrix)
+
+    @cached_property
+    def sum(self) -> np.ndarray:
+        return self._with_default(
+            row_reduce(np.add, self.matrix.data, self.matrix.indptr, 0.0), self.default_value
+        )
+
+    @cached_property
+    def squared_sum(self) -> np.ndarray:
+        return self._with_default(
+            row_reduce(np.add, self.matrix.data**2, self.matrix.indptr, 0.0),
+            None if self.default_value is None else self.default_value**2,
+        )
+
+    @cached_property
+    def abs_sum(self) -> np.ndarray:
+        return self._with_default(
+            row_reduce(np.add, np.abs(self.matrix.data), self.matrix.indptr, 0.0),
+            None if self.default_value is None else abs(self.default_value),
+        )
+
+    @property
+    def average(self) -> np.ndarray:
+        # nodes without coordinates get 0
+        if self.default_value is not None:
+            count = np.full(len(self.sum), self.matrix.shape[1], dtype=np.float64)
+        else:
+            count = self.matrix.shape[1] - self.missing
+        return np.divide(self.sum, count, out=np.zeros_like(self.sum), where=count > 0)
+
+    def _with_default(self, total: np.ndarray, default_value) -> np.ndarray:
+        if default_value is None:
+            return total
+        return total + default_value * self.missing
+
+    def _extreme(self, ufunc: np.ufunc, fill: float) -> np.ndarray:
+        # nodes without coordinates have no maximum or minimum
+        extreme = row_reduce(ufunc, self.matrix.data, self.matrix.indptr, fill)
+        found = self.missing < self.matrix.shape[1]
+        if self.default_value is not None:
+            # the default is one of the coordinates of every node missing a dimension
+            extreme = np.where(self.missing > 0, ufunc(extreme, self.default_value), extreme)
+            found |= self.missing > 0
+        return np.where(found, extreme, np.nan)
+
+
+def aggregate_transform(
+    input: PositionPortObject, aggregates: list[str], default_value=None
+) -> PositionPortObject:
+    """
+    Position object with one dimension per aggregate, named by AGGREGATE_LABELS.
+    - aggregates: names of SUM, EUCLIDEAN_NORM, MANHATTAN_NORM, AVERAGE, MAX and MIN
+    """
+    if not aggregates:
+        raise ValueError("At least one aggregate is required.")
+    rows = RowAggregates(uniform_matrix(input), default_value)
+    columns = {AGGREGATE_LABELS[name]: rows.aggregate(name) for name in aggregates}
+    return aggregate_positions(input, rows.positions.nodes, columns)
+
+
+def aggregate_positions(
+    input: PositionPortObject, nodes: pd.Index, columns: dict
+) -> PositionPortObject:
+    """
+    Position object with one layer holding the columns (label -> values) for every node.
+    Every value is stored, NaN values are positions without a result.
+    """
+    labels = list(columns)
+    values = np.column_stack(list(columns.values())) if labels else np.empty((len(nodes), 0))
+    n, k = values.shape
+    matrix = sp.csr_matrix(
+        (values.ravel(), np.tile(np.arange(k, dtype=np.int64), n), np.arange(0, n * k + 1, k)),
+        shape=(n, k),
+    )
+    label = labels[0] if len(labels) == 1 else "aggregates"
+    return PositionPortObject(
+        spec=PositionPortObjectSpec(
+            node_column=input.spec.node_column,
+        ),
+        positions=[(PositionMatrix(nodes, labels, matrix), labels, label)],
+    )
@@ -1,7 +1,14 @@
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
+from nodes.network.util import parallel
+from nodes.network.util.snapshots import SNAPSHOT_COLUMN, snapshot_edges
 from util.port_objects import (
+    NetworkMatrix,
     NetworkPortObject,
+    NetworkPortObjectSpec,
+    PositionMatrix,
     PositionPortObject,
     PositionPortObjectSpec,
     AttributePortObject
@@ -10,73 +17,28 @@ from util.port_objects import (
 #+-------------------------------------------------------------+
 #| Position Factory                                            |
 #+-------------------------------------------------------------+
-def create_positions(input_networks: list[NetworkPortObject], input_attributes: list[AttributePortObject], str_mode) -> PositionPortObject:
-    processed_networks: list[NetworkPortObject] = []
-    for net in input_networks:
-        weight_label = net.spec.weight_label
-        df_orig = net.get_network()
-        if not pd.api.types.is_numeric_dtype(df_orig[weight_label]):
-            if str_mode == "BINARY":
-                df_new = df_orig.copy()
-                df_new[weight_label] = 1
-                processed_networks.append(NetworkPortObject(spec=net.spec, network=df_new))
-                continue
-            elif str_mode == "ONE_HOT":
-                for rel in df_orig[weight_label].unique():
-                    df_rel = df_orig[df_orig[weight_label] == rel].copy()
-                    # Preserve the category for labeling
-                    df_rel["category"] = rel
-                    df_rel[weight_label] = 1
-                    processed_networks.append(NetworkPortObject(spec=net.spec, network=df_rel))
-                continue
-            else:
-                raise ValueError(f"Unknown str_mode: {str_mode}.")
-        processed_networks.append(net)
-
-    input_networks = processed_networks
-    all_pos = []
-
-    for input_network in input_networks:
-        pos = defaultdict(dict)
-        dims = set()
-        source_label = input_network.spec.source_label
-        target_label = input_network.spec.target_label
-        weight_label = input_network.spec.weight_label
-
-
-        df_net = input_network.get_network()
-        df_net = df_net.copy()
-
-        
-        if input_network.spec.symmetric:
-            # Determine columns to include in reversed DataFrame
-            cols = [source_label, target_label, weight_label]
-            if "category" in df_net.columns:
-                cols.append("category")
-                df_rev = df_net[cols].rename(
-                    columns={source_label: target_label, target_label: source_label}
-                )
-            df_net = pd.concat([df_net, df_rev], ignore_index=True)
-
-        df_net["dim"] = (
-            df_net[target_label].astype(str)
-            + (("_" + df_net["category"])if "category" in df_net.columns else "")
-        )
-        
-        pivot = df_net.pivot_table(
-            index=source_label,
-            columns="dim",
-            values=weight_label,
-            aggfunc="first",
-        )
-        for src, row in pivot.iterrows():
-            for dim, val in row.dropna().items():
-                pos[src][dim] = val
-                dims.add(dim)
-
-        pos = dict(pos)
-        dims = list(dims)
-        all_pos.append((pos, dims, weight_label))
+def create_positions(
+    input_networks: list[NetworkPortObject],
+    input_attributes: list[AttributePortObject],
+    str_mode,
+    workers: int = 1,
+    processes: bool = False,
+) -> PositionPortObject:
+    """
+    Creates the position layers of all networks and attributes.
+    With workers > 1 (0 uses all cores) the layers of the networks are built concurrently,
+    in a thread pool or with processes in a process pool. The network layers are aligned
+    to one shared node index at the end.
+    """
+    blocks = _map_networks(input_networks, str_mode, parallel.resolve_workers(workers), processes)
+    layers = align_layers([pos for block in blocks for pos in block])
+    weight_labels = [
+        net.spec.weight_label for net, block in zip(input_networks, blocks) for _ in block
+    ]
+    all_pos = [
+        (pos, pos.dims.tolist(), weight_label)
+        for pos, weight_label in zip(layers, weight_labels)
+    ]
 
     for input_attribute in input_attributes:
         node_column = input_attribute.spec.node_column
@@ -91,4 +53,184 @@ def create_positions(input_networks: list[NetworkPortObject], input_attributes:
     return PositionPortObject(
         spec=spec,
         positions=all_pos,
-    )
\ No newline at end of file
+    )
+
+
+def _map_networks(networks: list, str_mode: str, workers: int, processes: bool) -> list:
+    workers = min(workers, len(networks))
+    if workers <= 1:
+        return [network_layers(net, str_mode) for net in networks]
+    if processes:
+        # port objects are sent to the workers in their serialized form
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    _serialized_network_layers,
+                    [net.spec.serialize() for net in networks],
+                    [net.serialize() for net in networks],
+                    [str_mode] * len(networks),
+                )
+            )
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(network_layers, networks, [str_mode] * len(networks)))
+
+
+def _serialized_network_layers(spec_data: dict, data: bytes, str_mode: str) -> list:
+    spec = NetworkPortObjectSpec.deserialize(spec_data)
+    return network_layers(NetworkPortObject.deserialize(spec, data), str_mode)
+
+
+def align_layers(layers: list[PositionMatrix]) -> list[PositionMatrix]:
+    """
+    Reindexes the rows of all layers to one node index, the union of their nodes in order
+    of appearance.
+    """
+    if not layers:
+        return []
+    nodes = pd.Index(
+        pd.unique(np.concatenate([layer.nodes.to_numpy(dtype=object) for layer in layers]))
+    )
+    aligned = []
+    for layer in layers:
+        if layer.nodes.equals(nodes):
+            aligned.append(layer)
+            continue
+        rows = nodes.get_indexer(layer.nodes)
+        coo = layer.matrix.tocoo()
+        matrix = sp.coo_matrix(
+            (coo.data, (rows[coo.row], coo.col)), shape=(len(nodes), len(layer.dims))
+        ).tocsr()
+        aligned.append(PositionMatrix(nodes, layer.dims, matrix))
+    return aligned
+
+
+def network_layers(net: NetworkPortObject, str_mode: str) -> list[PositionMatrix]:
+    """
+    Position layers of a network: one layer for numeric and binary relations,
+    one layer per category for one-hot encoded string relations.
+    """
+    if net.is_matrix():
+        # matrices are numeric and already hold both halves of symmetric networks
+        return [matrix_positions(net.get_matrix())]
+    if net.get_snapshots() is not None:
+        # every node gets a position per snapshot, named node@snapshot
+        net = NetworkPortObject(spec=net.spec, network=snapshot_edges(net))
+    df = net.get_network()
+    weights = df[net.spec.weight_label]
+    if pd.api.types.is_numeric_dtype(weights):
+        return [network_positions(net, weights.to_numpy(dtype=np.float64, na_value=np.nan))]
+    if str_mode == "BINARY":
+        return [network_positions(net, np.ones(len(df)))]
+    if str_mode == "ONE_HOT":
+        return one_hot_positions(net)
+    raise ValueError(f"Unknown str_mode: {str_mode}.")
+
+
+def _entries(networkObj: NetworkPortObject, suffix=None):
+    """
+    Position entries of an edge list as (sources, dims, rows): the source node, the
+    dimension (target node, with "_suffix" if given) and the edge row of every entry.
+    Symmetric networks are mirrored, so both ends get a position.
+    """
+    source_label = networkObj.spec.source_label
+    target_label = networkObj.spec.target_label
+    df = networkObj.get_network()
+    rows = np.arange(len(df))
+
+    sources = df[source_label].to_numpy()
+    dims = df[target_label].astype(str).to_numpy(dtype=object)
+    if networkObj.spec.symmetric:
+        sources = np.concatenate([sources, df[target_label].to_numpy()])
+        dims = np.concatenate([dims, df[source_label].astype(str).to_numpy(dtype=object)])
+        rows = np.concatenate([rows, rows])
+    if suffix is not None:
+        dims = dims + "_" + suffix[rows]
+    if SNAPSHOT_COLUMN in df.columns:
+        sources = (
+            pd.Series(sources).astype(str).to_numpy(dtype=object)
+            + "@"
+            + df[SNAPSHOT_COLUMN].to_numpy(dtype=object)[rows]
+        )
+    return sources, dims, rows
+
+
+def network_positions(networkObj: NetworkPortObject, weights: np.ndarray) -> PositionMatrix:
+    """
+    Positions of the source nodes of an edge list with the given edge weights,
+    one dimension per target node.
+    """
+    sources, dims, rows = _entries(networkObj)
+    src_ids, nodes = sorted_factorize(sources)
+    return edge_positions(src_ids, nodes, dims, weights[rows])
+
+
+def one_hot_positions(networkObj: NetworkPortObject) -> list[PositionMatrix]:
+    """
+    One binary position layer per category of a string relation, in order of appearance.
+    The categories are encoded once and the entries sorted by (category, source) in a single
+    pass, all layers share one node index. Edges without a category are skipped.
+    """
+    df = networkObj.get_network()
+    cat_ids, categories = pd.factorize(df[networkObj.spec.weight_label])
+    sources, dims, rows = _entries(
+        networkObj, suffix=np.asarray(categories.astype(str), dtype=object)[cat_ids]
+    )
+    src_ids, nodes = sorted_factorize(sources)
+    entry_cats = cat_ids[rows]
+
+    # stable, so the entries of a (category, source) pair keep their edge order
+    order = np.lexsort((src_ids, entry_cats))
+    order = order[entry_cats[order] >= 0]
+    bounds = np.searchsorted(entry_cats[order], np.arange(len(categories) + 1))
+    layers = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        block = order[start:end]
+        layers.append(edge_positions(src_ids[block], nodes, dims[block], np.ones(len(block))))
+    return layers
+
+
+def sorted_factorize(values: np.ndarray):
+    """
+    pd.factorize with sorted labels, the row and column order of a pivot table.
+    Labels of types that cannot be compared keep their order of appearance.
+    """
+    try:
+        return pd.factorize(values, sort=True)
+    except TypeError:
+        return pd.factorize(values)
+
+
+def edge_positions(src_ids: np.ndarray, nodes: pd.Index, dims, weights: np.ndarray) -> PositionMatrix:
+    """
+    Builds the CSR position matrix of (source id, dim, weight) entries in one pass.
+    Missing weights are skipped and the first entry of a (source, dim) pair wins.
+    The dimensions are sorted like the columns of a pivot table.
+    """
+    valid = ~np.isnan(weights)
+    src_ids = src_ids[valid]
+    dim_ids, dim_labels = sorted_factorize(np.asarray(dims, dtype=object)[valid])
+    weights = weights[valid]
+
+    keys = src_ids.astype(np.int64) * len(dim_labels) + dim_ids
+    first = ~pd.Series(keys).duplicated(keep="first").to_numpy()
+    matrix = sp.coo_matrix(
+        (weights[first], (src_ids[first], dim_ids[first])),
+        shape=(len(nodes), len(dim_labels)),
+    ).tocsr()
+    return PositionMatrix(nodes, dim_labels, matrix)
+
+
+def matrix_positions(matrix: NetworkMatrix) -> PositionMatrix:
+    """
+    Positions of a network stored as a matrix, read from its rows without pivoting.
+    """
+    rows, cols = np.nonzero(~np.isnan(matrix.values))
+    used = np.unique(cols)
+    positions = sp.coo_matrix(
+        (
+            matrix.values[rows, cols].astype(np.float64),
+            (rows, np.searchsorted(used, cols)),
+        ),
+        shape=(len(matrix.row_labels), len(used)),
+    ).tocsr()
+    return PositionMatrix(matrix.row_labels, matrix.col_labels[used].astype(str), positions)
@@ -1,8 +1,6 @@
-import math
-from util.port_objects import (
-    PositionPortObject,
-    PositionPortObjectSpec,
-)
+from util.port_objects import PositionPortObject
+from nodes.position.util.aggregate import aggregate_transform
+
 
 def euclidean_norm_transform(
     input: PositionPortObject, default_value=None
@@ -14,24 +12,7 @@ def euclidean_norm_transform(
     Returns:
         new_positions: dict[node_id]['euclidean'] = float
     """
-    positions, _ = input.get_uniform_positions()
-    new_positions = {}
-    for node_id, coord_map in positions.items():
-        if default_value is not None:
-            squared_sum = sum(
-                (coord_map.get(dim, default_value) ** 2)
-                for dim in input.get_dimensions()
-            )
-        else:
-            squared_sum = sum(value**2 for value in coord_map.values())
-        new_positions[node_id] = {"euclidean": math.sqrt(squared_sum)}
-
-    return PositionPortObject(
-        spec=PositionPortObjectSpec(
-            node_column=input.spec.node_column,
-        ),
-        positions=[(new_positions, ["euclidean"], "euclidean")],
-    )
+    return aggregate_transform(input, ["EUCLIDEAN_NORM"], default_value)
 
 
 def manhattan_norm_transform(
@@ -44,55 +25,21 @@ def manhattan_norm_transform(
     Returns:
         new_positions: dict[node_id]['manhattan'] = float
     """
-    positions, all_dims = input.get_uniform_positions()
-    new_positions = {}
-    for node_id, coord_map in positions.items():
-        if default_value is not None:
-            new_positions[node_id] = {
-                "manhattan": sum(
-                    abs(coord_map.get(dim, default_value)) for dim in all_dims
-                )
-            }
-        else:
-            new_positions[node_id] = {
-                "manhattan": sum(abs(value) for value in coord_map.values())
-            }
-    return PositionPortObject(
-        spec=PositionPortObjectSpec(
-            node_column=input.spec.node_column,
-        ),
-        positions=[(new_positions, ["manhattan"], "manhattan")],
-    )
+    return aggregate_transform(input, ["MANHATTAN_NORM"], default_value)
+
 
 def average_transform(
     input: PositionPortObject, default_value=None
 ) -> PositionPortObject:
     """
     Compute the average of all coordinates for each node’s position vector.
+    Nodes without coordinates get 0.
     Input:
         positions: dict[node_id][dim_name] = float
     Returns:
         new_positions: dict[node_id]['average'] = float
     """
-    positions, all_dims = input.get_uniform_positions()
-    new_positions = {}
-    for node_id, coord_map in positions.items():
-        if default_value is not None:
-            total = sum(coord_map.get(dim, default_value) for dim in all_dims)
-            count = len(all_dims)
-        else:
-            if coord_map:
-                total = sum(coord_map.values())
-                count = len(coord_map)
-                new_positions[node_id] = {"average": total / count}
-            else:
-                new_positions[node_id] = {"average": 0.0}
-    return PositionPortObject(
-        spec=PositionPortObjectSpec(
-            node_column=input.spec.node_column,
-        ),
-        positions=[(new_positions, ["average"], "average")],
-    )
+    return aggregate_transform(input, ["AVERAGE"], default_value)
 
 
 def sum_transform(input: PositionPortObject, default_value=None) -> PositionPortObject:
@@ -103,19 +50,4 @@ def sum_transform(input: PositionPortObject, default_value=None) -> PositionPort
     Returns:
         new_positions: dict[node_id]['sum'] = float
     """
-    positions, _ = input.get_uniform_positions()
-    new_positions = {}
-    for node_id, coord_map in positions.items():
-        if default_value is not None:
-            sum_value = sum(
-                coord_map.get(dim, default_value) for dim in input.get_dimensions()
-            )
-        else:
-            sum_value = sum(coord_map.values())
-        new_positions[node_id] = {"sum": sum_value}
-    return PositionPortObject(
-        spec=PositionPortObjectSpec(
-            node_column=input.spec.node_column,
-        ),
-        positions=[(new_positions,["sum"], "sum")],
-    )
\ No newline at end of file
+    return aggregate_transform(input, ["SUM"], default_value)
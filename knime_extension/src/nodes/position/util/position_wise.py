@@ -1,10 +1,51 @@
-import math
-import statistics
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from nodes.position.util.aggregate import dict_to_matrix, uniform_matrix
 from util.port_objects import (
+    PositionMatrix,
     PositionPortObject,
     PositionPortObjectSpec,
 )
 
+# values of the dense blocks filled with the default value, 32 MB of float64
+FILL_BLOCK_CELLS = 1 << 22
+
+
+def elementwise_transform(
+    input: PositionPortObject, kernel, default_value=None
+) -> PositionPortObject:
+    """
+    Applies kernel to the values of every position layer. The kernel gets the CSR matrix
+    of a layer and returns a new data array, so it only runs over stored values. The
+    result owns copies of the index arrays, in-place operations on it never modify the
+    input positions.
+    With a default value every missing coordinate of a node is set to the default first.
+    """
+    layers = []
+    for pos, dims, w in input.get_layers():
+        if isinstance(pos, PositionMatrix):
+            # nodes without a coordinate in this layer have no position to fill
+            rows = np.diff(pos.matrix.indptr) > 0
+        else:
+            pos = dict_to_matrix(pos, dims)
+            rows = None
+        matrix = pos.matrix.astype(np.float64, copy=False)
+        if default_value is not None:
+            matrix = fill_missing(matrix, default_value, rows)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            data = kernel(matrix)
+        result = sp.csr_matrix(
+            (data, matrix.indices.copy(), matrix.indptr.copy()), shape=matrix.shape
+        )
+        layers.append((PositionMatrix(pos.nodes, pos.dims, result), dims, w))
+
+    return PositionPortObject(
+        spec=PositionPortObjectSpec(
+            node_column=input.spec.node_column,
+        ),
+        positions=layers,
+    )
 
 
 def inverse_transform(
@@ -18,117 +59,177 @@ def inverse_transform(
     Returns:
         new_positions: dict[node_id][dim_name] = float
     """
-    positions = input.get_positions()
-
-    for (pos, all_dims, w) in positions:
-        for node_id, coord_map in pos.items():
-            if default_value is not None:
-                for dim in all_dims:
-                    value = coord_map.get(dim, default_value)
-                    coord_map[dim] = 1.0 / (value + epsilon)
-            else:
-                for dim, value in coord_map.items():
-                    coord_map[dim] = 1.0 / (value + epsilon)
-
-    return PositionPortObject(
-        spec=PositionPortObjectSpec(
-            node_column=input.spec.node_column,
-        ),
-        positions=positions,
+    return elementwise_transform(
+        input, lambda matrix: np.reciprocal(matrix.data + epsilon), default_value
     )
 
 
 def log_transform(input: PositionPortObject, default_value=None) -> PositionPortObject:
     """
-    Compute the sum of log-transformed coordinates: sum(log(p_i + 1)).
+    Compute the logarithm of each coordinate: log(p_i + 1).
+    Coordinates below -1 have no logarithm and become missing (NaN), -1 gives -inf.
     Input:
         positions: dict[node_id][dim_name] = float
     Returns:
-        new_positions: dict[node_id]['log_sum'] = float
+        new_positions: dict[node_id][dim_name] = float
     """
-    positions = input.get_positions()
+    return elementwise_transform(input, lambda matrix: np.log1p(matrix.data), default_value)
 
-    for pos,dim,w in positions:
-        # apply log transformation to each coordinate
-        for node_id, coord_map in pos.items():
-            if default_value is not None:
-                for dim in dim:
-                    value = coord_map.get(dim, default_value)
-                    coord_map[dim] = math.log(value + 1.0)
-            else:
-                for dim, value in coord_map.items():
-                    coord_map[dim] = math.log(value + 1.0)
 
-    return PositionPortObject(
-        spec=PositionPortObjectSpec(
-            node_column=input.spec.node_column,
-        ),
-        positions=positions,
+def power_transform(
+    input: PositionPortObject, default_value=None, exponent: float = 2.0
+) -> PositionPortObject:
+    """
+    Raise each coordinate to a power: p_i ** exponent.
+    Input:
+        positions: dict[node_id][dim_name] = float
+    Returns:
+        new_positions: dict[node_id][dim_name] = float
+    """
+    return elementwise_transform(
+        input, lambda matrix: np.power(matrix.data, exponent), default_value
     )
 
 
-def zscore_transform(
-    input: PositionPortObject, default_value=None
+def clip_transform(
+    input: PositionPortObject, default_value=None, lower=None, upper=None
 ) -> PositionPortObject:
     """
-    Standardize each dimension (z-score) across all nodes, then compute the
-    Euclidean norm of the resulting standardized vector for each node.
+    Limit each coordinate to the interval [lower, upper], None leaves a side open.
     Input:
         positions: dict[node_id][dim_name] = float
     Returns:
-        new_positions: dict[node_id]['zscore_norm'] = float
+        new_positions: dict[node_id][dim_name] = float
     """
-    positions, all_dims = input.get_uniform_positions()
+    if lower is not None and upper is not None and lower > upper:
+        raise ValueError("Lower bound must not be greater than upper bound.")
+    return elementwise_transform(
+        input, lambda matrix: np.clip(matrix.data, lower, upper), default_value
+    )
 
-    dim_values = {dim: [] for dim in all_dims}
-    for node_id, coord_map in positions.items():
-        if default_value is not None:
-            for dim in all_dims:
-                val = coord_map.get(dim, default_value)
-                dim_values[dim].append(val)
-        else:
-            for dim, val in coord_map.items():
-                if not isinstance(val, (int, float)):
-                    raise ValueError(
-                        f"Invalid value '{val}' for dimension '{dim}' in node '{node_id}'. Expected numeric type."
-                    )
-                dim_values[dim].append(val)
-
-    dim_stats = {}
-    for dim in all_dims:
-        vals = dim_values[dim]
-        mean = statistics.mean(vals)
-        stdev = statistics.pstdev(vals)
-        dim_stats[dim] = (mean, stdev)
+
+def rank_transform(input: PositionPortObject, default_value=None) -> PositionPortObject:
+    """
+    Replace each coordinate by its rank among the coordinates of its dimension,
+    starting at 1; equal coordinates get their average rank.
+    Input:
+        positions: dict[node_id][dim_name] = float
+    Returns:
+        new_positions: dict[node_id][dim_name] = float
+    """
+
+    def ranks(matrix):
+        values = pd.Series(matrix.data)
+        return values.groupby(matrix.indices).rank(method="average").to_numpy()
+
+    return elementwise_transform(input, ranks, default_value)
+
+
+def fill_missing(matrix, default_value, rows=None, block_rows: int = 65536):
+    """
+    CSR matrix storing a value for every dimension of the selected rows (all rows by
+    default), missing and NaN coordinates are set to default_value. The rows are
+    filled in dense blocks of at most block_rows rows and FILL_BLOCK_CELLS values.
+    """
+    block_rows = max(1, min(block_rows, FILL_BLOCK_CELLS // max(matrix.shape[1], 1)))
+    blocks = []
+    for start in range(0, matrix.shape[0], block_rows):
+        block = matrix[start : start + block_rows]
+        block_ids = np.repeat(np.arange(block.shape[0]), np.diff(block.indptr))
+        dense = np.full(block.shape, float(default_value))
+        dense[block_ids, block.indices] = block.data
+        dense[np.isnan(dense)] = default_value
+        selected = None if rows is None else rows[start : start + block_rows]
+        blocks.append(_dense_to_csr(dense, selected))
+    if not blocks:
+        return matrix
+    return sp.vstack(blocks, format="csr")
+
+
+def zscore_transform(
+    input: PositionPortObject, default_value=None, block_rows: int = 65536
+) -> PositionPortObject:
+    """
+    Standardize each dimension (z-score) across all nodes.
+    Without a default value only the coordinates of a dimension count and the positions
+    stay sparse; with a default value every missing coordinate counts as the default and
+    gets a z-score as well. Dimensions without variation get 0.
+    Input:
+        positions: dict[node_id][dim_name] = float
+        block_rows: number of rows processed at a time
+    Returns:
+        new_positions: dict[node_id][dim_name] = float
+    """
+    positions = uniform_matrix(input)
+    matrix = positions.matrix
+    count, mean, m2 = column_statistics(matrix, default_value, block_rows)
+    std = np.sqrt(np.divide(m2, count, out=np.zeros_like(m2), where=count > 0))
+    scale = np.divide(1.0, std, out=np.zeros_like(std), where=std > 0)
 
     if default_value is not None:
-        for node_id, coord_map in positions.items():
-            for dim in all_dims:
-                raw_val = coord_map.get(dim, default_value)
-                mean, stdev = dim_stats[dim]
-                if stdev > 0:
-                    z = (raw_val - mean) / stdev
-                else:
-                    z = 0.0
-                positions[node_id][dim] = z
-    else:
-        for node_id, coord_map in positions.items():
-            for dim, val in coord_map.items():
-                if not isinstance(val, (int, float)):
-                    raise ValueError(
-                        f"Invalid value '{val}' for dimension '{dim}' in node '{node_id}'. Expected numeric type."
-                    )
-                mean, stdev = dim_stats[dim]
-                if stdev > 0:
-                    z = (val - mean) / stdev
-                else:
-                    z = 0.0
-                positions[node_id][dim] = z
+        # every node gets a z-score in every dimension
+        matrix = fill_missing(matrix, default_value, block_rows=block_rows)
+    data = (matrix.data - mean[matrix.indices]) * scale[matrix.indices]
+    # own index arrays, never shared with the input positions
+    result = sp.csr_matrix(
+        (data, matrix.indices.copy(), matrix.indptr.copy()), shape=matrix.shape
+    )
 
     return PositionPortObject(
         spec=PositionPortObjectSpec(
             node_column=input.spec.node_column,
         ),
-        positions=positions,
-        dimensions=all_dims,
-    )
\ No newline at end of file
+        positions=[
+            (PositionMatrix(positions.nodes, positions.dims, result), positions.dims.tolist(), "zscore")
+        ],
+    )
+
+
+def _dense_to_csr(values: np.ndarray, rows=None):
+    # every value of the selected rows is stored, zeros are coordinates as well
+    n, k = values.shape
+    counts = np.full(n, k, dtype=np.int64) if rows is None else np.where(rows, k, 0)
+    indptr = np.concatenate([[0], np.cumsum(counts)])
+    selected = values if rows is None else values[rows]
+    indices = np.tile(np.arange(k, dtype=np.int64), len(selected))
+    return sp.csr_matrix((selected.ravel(), indices, indptr), shape=(n, k))
+
+
+def column_statistics(matrix, default_value=None, block_rows: int = 65536):
+    """
+    Count, mean and sum of squared deviations (M2) of every column of a CSR matrix.
+    Row blocks are reduced with vectorized Welford updates and merged with Chan's
+    formula, so the matrix is never densified. NaN values are left out; with a default
+    value the missing coordinates of a column form one more group of equal values.
+    """
+    n_cols = matrix.shape[1]
+    count = np.zeros(n_cols)
+    mean = np.zeros(n_cols)
+    m2 = np.zeros(n_cols)
+    for start in range(0, matrix.shape[0], block_rows):
+        block = matrix[start : start + block_rows]
+        valid = ~np.isnan(block.data)
+        cols = block.indices[valid]
+        values = block.data[valid]
+        block_count = np.bincount(cols, minlength=n_cols).astype(np.float64)
+        block_sum = np.bincount(cols, weights=values, minlength=n_cols)
+        block_mean = np.divide(
+            block_sum, block_count, out=np.zeros(n_cols), where=block_count > 0
+        )
+        block_m2 = np.bincount(cols, weights=(values - block_mean[cols]) ** 2, minlength=n_cols)
+        count, mean, m2 = _merge_statistics(count, mean, m2, block_count, block_mean, block_m2)
+    if default_value is not None:
+        missing = matrix.shape[0] - count
+        count, mean, m2 = _merge_statistics(
+            count, mean, m2, missing, np.full(n_cols, float(default_value)), np.zeros(n_cols)
+        )
+    return count, mean, m2
+
+
+def _merge_statistics(count_a, mean_a, m2_a, count_b, mean_b, m2_b):
+    count = count_a + count_b
+    delta = mean_b - mean_a
+    weight = np.divide(count_b, count, out=np.zeros_like(count), where=count > 0)
+    mean = mean_a + delta * weight
+    m2 = m2_a + m2_b + delta**2 * count_a * weight
+    return count, mean, m2
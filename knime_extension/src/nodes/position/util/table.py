@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+from nodes.position.util.aggregate import uniform_matrix
+from nodes.position.util.position_wise import fill_missing
+from util.port_objects import PositionPortObject
+
+# entries per batch of the long table
+BATCH_ROWS = 100_000
+ROW_ID = "<RowID>"
+
+
+def long_batches(
+    input: PositionPortObject,
+    default_value=None,
+    dimension_column: str = "dimension",
+    value_column: str = "value",
+    batch_rows: int = BATCH_ROWS,
+):
+    """
+    Positions as (node, dimension, value) rows, yielded as pyarrow tables of about
+    batch_rows rows straight from the sparse position matrix. Missing coordinates are
+    left out, or set to default_value one block of nodes at a time.
+    """
+    import pyarrow as pa
+
+    positions = uniform_matrix(input)
+    matrix = positions.matrix
+    nodes = _arrow_array(positions.nodes)
+    dims = pa.array(positions.dims.astype(str).to_numpy(dtype=object), type=pa.string())
+    block_rows = max(1, batch_rows // max(matrix.shape[1], 1))
+    for start in range(0, matrix.shape[0], block_rows):
+        block = matrix[start : start + block_rows]
+        if default_value is not None:
+            block = fill_missing(block, default_value)
+        keep = ~np.isnan(block.data)
+        if not keep.any():
+            continue
+        rows = np.repeat(np.arange(start, start + block.shape[0]), np.diff(block.indptr))
+        yield pa.table(
+            {
+                input.spec.node_column: nodes.take(pa.array(rows[keep])),
+                dimension_column: dims.take(pa.array(block.indices[keep])),
+                value_column: pa.array(block.data[keep]),
+            }
+        )
+
+
+def wide_table(input: PositionPortObject, default_value=None):
+    """
+    Positions as a pyarrow table with one row per node and one float column per
+    dimension, the node is the row ID. Every column is filled from the column slice of
+    the sparse matrix, missing coordinates are null or default_value.
+    """
+    import pyarrow as pa
+
+    positions = uniform_matrix(input)
+    matrix = positions.matrix.tocsc()
+    n = matrix.shape[0]
+    fill = np.nan if default_value is None else float(default_value)
+    row_ids = positions.nodes.astype(str).to_numpy(dtype=object)
+    columns = {ROW_ID: pa.array(row_ids, type=pa.string())}
+    for j, dim in enumerate(positions.dims.astype(str)):
+        column = slice(matrix.indptr[j], matrix.indptr[j + 1])
+        values = np.full(n, fill)
+        values[matrix.indices[column]] = matrix.data[column]
+        if default_value is not None:
+            values[np.isnan(values)] = fill
+        columns[dim] = pa.array(values, mask=np.isnan(values))
+    return pa.table(columns)
+
+
+def _arrow_array(nodes: pd.Index):
+    import pyarrow as pa
+
+    try:
+        return pa.array(nodes.to_numpy(dtype=object))
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # nodes of several types, e.g. from networks with different node columns
+        return pa.array(nodes.astype(str).to_numpy(dtype=object), type=pa.string())
@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+import networkx as nx
+from networkx.algorithms.centrality.betweenness import _single_source_dijkstra_path_basic
+
+from util.port_objects import (
+    NetworkPortObject,
+    PositionMatrix,
+    PositionPortObject,
+    PositionPortObjectSpec,
+)
+
+# weight label of the transformed network, used as the label of the position layer
+WALK_POSITION_LABELS = {
+    "DISTANCE": "distance",
+    "REACHABILITY": "reachable",
+    "DEPENDENCY": "dependency",
+}
+
+
+def walk_positions(networkObj: NetworkPortObject, measure: str) -> PositionPortObject:
+    """
+    Positions of the distance, reachability or dependency transform of a network, without
+    the all-pairs edge list in between.
+    Every single-source search writes its targets straight into the CSR arrays of the
+    position matrix. The positions are the same as Position Creation of the transformed
+    network: row s holds d(s, t) or the reachable targets t of s, for dependencies row v
+    holds δ_s(v) in dimension s.
+    - measure: "DISTANCE", "REACHABILITY" or "DEPENDENCY"
+    """
+    if networkObj.is_two_mode():
+        raise ValueError(
+            "Walk positions are not supported for two-mode networks. Consider projection to one-mode network."
+        )
+    weight_label = networkObj.get_weight_label()
+    df = networkObj.get_network()
+    if measure != "REACHABILITY":
+        if not pd.api.types.is_numeric_dtype(df[weight_label]):
+            raise ValueError("Weight column must be numeric.")
+        if (df[weight_label] <= 0).any():
+            raise ValueError("Weight column must be positive.")
+
+    G = nx.from_pandas_edgelist(
+        df,
+        source=networkObj.get_source_label(),
+        target=networkObj.get_target_label(),
+        edge_attr=weight_label if measure != "REACHABILITY" else None,
+        create_using=nx.Graph() if networkObj.is_symmetric() else nx.DiGraph(),
+    )
+    nodes = pd.Index(list(G.nodes))
+    ids = {node: i for i, node in enumerate(nodes)}
+
+    if measure == "DISTANCE":
+        # a constant weight is a scaled hop count, like in distance_transform
+        step = df[weight_label].iloc[0] if df[weight_label].nunique() == 1 else None
+        searches = (_distance_row(G, s, weight_label, step) for s in nodes)
+    elif measure == "REACHABILITY":
+        reflexive = networkObj.is_irreflexive()
+        searches = (_reachability_row(G, s, reflexive) for s in nodes)
+    elif measure == "DEPENDENCY":
+        searches = (_dependency_column(G, s, weight_label) for s in nodes)
+    else:
+        raise ValueError(f"Unknown measure: {measure}")
+
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+    indices = []
+    data = []
+    for i, (targets, values) in enumerate(searches):
+        indices.append(np.fromiter((ids[t] for t in targets), dtype=np.int64, count=len(targets)))
+        data.append(np.asarray(values, dtype=np.float64))
+        indptr[i + 1] = indptr[i] + len(targets)
+    shape = (len(nodes), len(nodes))
+    arrays = (
+        np.concatenate(data) if data else np.empty(0),
+        np.concatenate(indices) if indices else np.empty(0, dtype=np.int64),
+        indptr,
+    )
+    if measure == "DEPENDENCY":
+        # every search fills the column of its source
+        matrix = sp.csc_matrix(arrays, shape=shape).tocsr()
+    else:
+        matrix = sp.csr_matrix(arrays, shape=shape)
+
+    # like Position Creation, only nodes reached by some search are dimensions
+    used = np.bincount(matrix.indices, minlength=len(nodes)) > 0
+    matrix = matrix[:, used]
+    dims = nodes[used].astype(str)
+    return PositionPortObject(
+        spec=PositionPortObjectSpec(node_column="node"),
+        positions=[
+            (PositionMatrix(nodes, dims, matrix), dims.tolist(), WALK_POSITION_LABELS[measure])
+        ],
+    )
+
+
+def _distance_row(G, s, weight_label, step):
+    if step is not None:
+        lengths = nx.single_source_shortest_path_length(G, s)
+        lengths.pop(s, None)
+        return list(lengths), [d * step for d in lengths.values()]
+    lengths = nx.single_source_dijkstra_path_length(G, s, weight=weight_label)
+    lengths.pop(s, None)
+    return list(lengths), list(lengths.values())
+
+
+def _reachability_row(G, s, reflexive: bool):
+    # same targets as the transitive closure of the reachability transform
+    targets = nx.descendants(G, s)
+    if reflexive or G.has_edge(s, s):
+        targets.add(s)
+    targets = list(targets)
+    return targets, np.ones(len(targets))
+
+
+def _dependency_column(G, s, weight_label):
+    S, P, sigma, _ = _single_source_dijkstra_path_basic(G, s, weight_label)
+    delta = dict.fromkeys(S, 0.0)
+    targets = []
+    values = []
+    while S:
+        w = S.pop()
+        for u in P[w]:
+            delta[u] += (sigma[u] / sigma[w]) * (1.0 + delta[w])
+        if w != s:
+            targets.append(w)
+            values.append(delta[w])
+    return targets, values
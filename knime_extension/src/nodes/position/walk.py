@@ -0,0 +1,75 @@
+import knime.extension as knext
+import networks_ext
+from util.position_algorithms import walk_positions
+from util.port_objects import (
+    NetworkPortObject,
+    NetworkPortObjectSpec,
+    PositionPortObject,
+    PositionPortObjectSpec,
+)
+from util.port_types import (
+    network_port_type,
+    position_port_type,
+)
+
+
+class WalkPositionOptions(knext.EnumParameterOptions):
+    DISTANCE = (
+        "Distance",
+        "Positions are the shortest distances from each node to all other nodes.",
+    )
+    REACHABILITY = (
+        "Reachability",
+        "Positions are the nodes reachable from each node.",
+    )
+    DEPENDENCY = (
+        "Dependency",
+        "Positions are the dependencies of each node on all other nodes.",
+    )
+
+
+@knext.parameter_group(label="Walk Position Settings")
+class WalkPositionSettings:
+    measure = knext.EnumParameter(
+        label="Walk Measure",
+        description="Select the walk measure the positions are computed from.",
+        enum=WalkPositionOptions,
+        default_value=WalkPositionOptions.DISTANCE.name,
+    )
+
+
+@knext.node(
+    name="Walk Positions",
+    node_type=knext.NodeType.MANIPULATOR,
+    category=networks_ext.position_category,
+    icon_path="icons/position.png",
+)
+@knext.input_port(
+    name="Input Network",
+    description="Input network to compute positions.",
+    port_type=network_port_type,
+)
+@knext.output_port(
+    name="Output Positions",
+    description="Positions of the walk measure, the same as Position Creation of the "
+    "transformed network without creating the transformed network.",
+    port_type=position_port_type,
+)
+class WalkPositionNode:
+    settings = WalkPositionSettings()
+
+    def configure(
+        self,
+        configure_context: knext.ConfigurationContext,
+        network_schema: NetworkPortObjectSpec,
+    ) -> PositionPortObjectSpec:
+        if network_schema.two_mode:
+            raise knext.InvalidParametersError(
+                "Walk positions are not supported for two-mode networks."
+            )
+        return PositionPortObjectSpec(
+            node_column=network_schema.source_label,
+        )
+
+    def execute(self, context, input_network: NetworkPortObject) -> PositionPortObject:
+        return walk_positions(input_network, self.settings.measure)
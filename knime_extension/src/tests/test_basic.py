@@ -1,7 +1,25 @@
+import math
+import statistics
+
 import pytest
+import numpy as np
 import pandas as pd
-from util.network_algorithms import create_network
-from util.position_algorithms import create_positions
+from util.network_algorithms import create_network, apply_transform, parse_steps
+from util.position_algorithms import (
+    create_positions,
+    walk_positions,
+    sum_transform,
+    max_transform,
+    aggregate_transform,
+    inverse_transform,
+    long_batches,
+    zscore_transform,
+    log_transform,
+    power_transform,
+    clip_transform,
+    rank_transform,
+)
+from nodes.position.util import position_wise
 
 
 # -------------------------------------------------
@@ -91,4 +109,335 @@ def test_factory_only_network_position_string(simple_edge_table_string):
         "A": {"B_friend_1": 1.0, "C_colleague_2": 1.0},
         "B": {"A_friend_1": 1.0, "C_friend_1": 1.0},
         "C": {"B_friend_1": 1.0, "A_colleague_2": 1.0},
-    }
\ No newline at end of file
+    }
+
+def test_factory_symmetric_first_value_wins():
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": True,
+        "irreflexive": False,
+    }
+    df = pd.DataFrame(
+        {
+            "source": ["A", "A", "C"],
+            "target": ["B", "B", "A"],
+            "weight": [1.0, 5.0, 2.0],
+        }
+    )
+
+    net = create_network(df, settings)
+    positions, dims = create_positions([net], [], "BINARY").get_uniform_positions()
+    assert dims == {"A_1", "B_1", "C_1"}
+    assert positions == {
+        "A": {"B_1": 1.0, "C_1": 2.0},
+        "B": {"A_1": 1.0},
+        "C": {"A_1": 2.0},
+    }
+
+
+def test_walk_positions_distance(simple_edge_table):
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    net = create_network(simple_edge_table, settings)
+    positions = walk_positions(net, "DISTANCE").get_positions()
+    assert positions[0][0] == {"A": {"B": 1.0, "C": 3.0}, "B": {"C": 2.0}}
+
+
+def test_aggregates_default_value(simple_edge_table):
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    net = create_network(simple_edge_table, settings)
+    positions = create_positions([net], [], "BINARY")
+    # dimensions B_1 and C_1, B misses B_1
+    assert sum_transform(positions).get_positions()[0][0] == {"A": {"sum": 4.0}, "B": {"sum": 2.0}}
+    assert sum_transform(positions, 10.0).get_positions()[0][0] == {
+        "A": {"sum": 4.0},
+        "B": {"sum": 12.0},
+    }
+    assert max_transform(positions, -1.0).get_positions()[0][0] == {
+        "A": {"max": 3.0},
+        "B": {"max": 2.0},
+    }
+
+
+def test_aggregate_transform_one_dimension_per_aggregate(simple_edge_table):
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    net = create_network(simple_edge_table, settings)
+    out = aggregate_transform(create_positions([net], [], "BINARY"), ["SUM", "MAX", "AVERAGE"])
+    pos, dims, _ = out.get_positions()[0]
+    assert dims == ["sum", "max", "average"]
+    assert pos == {
+        "A": {"sum": 4.0, "max": 3.0, "average": 2.0},
+        "B": {"sum": 2.0, "max": 2.0, "average": 2.0},
+    }
+
+
+def test_inverse_transform_keeps_input(simple_edge_table):
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    net = create_network(simple_edge_table, settings)
+    positions = create_positions([net], [], "BINARY")
+    out = inverse_transform(positions, 0.0, epsilon=1.0)
+    assert out.get_positions()[0][0] == {
+        "A": {"B": 0.5, "C": 0.25},
+        "B": {"B": 1.0, "C": 1 / 3},
+    }
+    assert positions.get_positions()[0][0] == {"A": {"B": 1.0, "C": 3.0}, "B": {"C": 2.0}}
+
+
+def test_long_batches(simple_edge_table):
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    net = create_network(simple_edge_table, settings)
+    positions = create_positions([net], [], "BINARY")
+    batches = list(long_batches(positions, batch_rows=2))
+    assert len(batches) == 2
+    rows = pd.concat([batch.to_pandas() for batch in batches], ignore_index=True)
+    assert rows.values.tolist() == [["A", "B_1", 1.0], ["A", "C_1", 3.0], ["B", "C_1", 2.0]]
+
+
+@pytest.mark.parametrize("measure", ["DISTANCE", "REACHABILITY", "DEPENDENCY"])
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_walk_positions_match_transform_positions(measure, symmetric):
+    df = pd.DataFrame(
+        {
+            "source": ["A", "B", "C", "B", "D", "E"],
+            "target": ["B", "C", "A", "D", "E", "E"],
+            "weight": [1.0, 2.0, 1.0, 3.0, 1.0, 1.0],
+        }
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": symmetric,
+        "irreflexive": True,
+    }
+    net = create_network(df, settings)
+    transformed = apply_transform(net, parse_steps(measure)[0])
+    expected_pos, expected_dims, _ = create_positions([transformed], [], "BINARY").get_positions()[0]
+    pos, dims, _ = walk_positions(net, measure).get_positions()[0]
+    assert sorted(dims) == sorted(expected_dims)
+    assert pos.keys() == expected_pos.keys()
+    for node, coords in expected_pos.items():
+        assert pos[node] == pytest.approx(coords)
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_factory_parallel_matches_serial(processes):
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    first = create_network(
+        pd.DataFrame({"source": ["A", "B"], "target": ["B", "C"], "weight": [1.0, 2.0]}),
+        settings,
+    )
+    second = create_network(
+        pd.DataFrame({"source": ["D", "A", "E"], "target": ["A", "E", "D"], "weight": [3.0, 4.0, 5.0]}),
+        settings,
+    )
+    serial = create_positions([first, second], [], "BINARY")
+    parallel = create_positions([first, second], [], "BINARY", workers=2, processes=processes)
+    # the layers share one node index, the union of both networks
+    nodes = [layer.nodes.tolist() for layer, _, _ in parallel.get_layers()]
+    assert nodes == [["A", "B", "D", "E"], ["A", "B", "D", "E"]]
+    assert parallel.get_positions() == serial.get_positions()
+    assert parallel.get_uniform_positions() == serial.get_uniform_positions()
+
+
+@pytest.mark.parametrize("default_value", [None, 0.5])
+def test_zscore_matches_statistics(default_value, monkeypatch):
+    df = pd.DataFrame(
+        {
+            "source": ["A", "A", "B", "C", "C", "D", "D", "E", "E"],
+            "target": ["B", "C", "C", "A", "D", "A", "B", "B", "D"],
+            "weight": [1.0, 3.0, 2.0, 8.0, 4.0, 5.0, 7.0, 2.5, 1.0],
+        }
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    positions = create_positions([create_network(df, settings)], [], "BINARY")
+    expected = positions.get_positions()[0][0]
+    # fewer rows per block than nodes, so the statistics are merged across blocks,
+    # and the default value is filled in one row at a time
+    monkeypatch.setattr(position_wise, "FILL_BLOCK_CELLS", 5)
+    out = zscore_transform(positions, default_value, block_rows=2)
+    result = out.get_positions()[0][0]
+    for dim in ["A", "B", "C", "D"]:
+        values = {
+            node: coords.get(dim, default_value)
+            for node, coords in expected.items()
+            if default_value is not None or dim in coords
+        }
+        mean = statistics.mean(values.values())
+        stdev = statistics.pstdev(values.values())
+        for node in expected:
+            if node in values:
+                assert result[node][f"{dim}_1"] == pytest.approx((values[node] - mean) / stdev)
+            else:
+                assert f"{dim}_1" not in result[node]
+
+
+@pytest.fixture
+def signed_positions():
+    df = pd.DataFrame(
+        {
+            "source": ["A", "A", "B", "C"],
+            "target": ["B", "C", "C", "B"],
+            "weight": [-2.0, 3.0, 3.0, -0.5],
+        }
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    return create_positions([create_network(df, settings)], [], "BINARY")
+
+
+def test_log_transform_below_minus_one(signed_positions):
+    pos = log_transform(signed_positions).get_positions()[0][0]
+    assert math.isnan(pos["A"]["B"])
+    assert pos["A"]["C"] == pytest.approx(math.log(4.0))
+    assert pos["C"]["B"] == pytest.approx(math.log(0.5))
+
+    df = pd.DataFrame({"source": ["A"], "target": ["B"], "weight": [-1.0]})
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    positions = create_positions([create_network(df, settings)], [], "BINARY")
+    assert log_transform(positions).get_positions()[0][0] == {"A": {"B": -math.inf}}
+
+
+def test_power_transform(signed_positions):
+    assert power_transform(signed_positions, exponent=3.0).get_positions()[0][0] == {
+        "A": {"B": -8.0, "C": 27.0},
+        "B": {"C": 27.0},
+        "C": {"B": -0.125},
+    }
+    # missing coordinates are raised as the default value
+    assert power_transform(signed_positions, 2.0, exponent=2.0).get_positions()[0][0] == {
+        "A": {"B": 4.0, "C": 9.0},
+        "B": {"B": 4.0, "C": 9.0},
+        "C": {"B": 0.25, "C": 4.0},
+    }
+
+
+def test_clip_transform(signed_positions):
+    assert clip_transform(signed_positions, lower=-1.0, upper=2.0).get_positions()[0][0] == {
+        "A": {"B": -1.0, "C": 2.0},
+        "B": {"C": 2.0},
+        "C": {"B": -0.5},
+    }
+    assert clip_transform(signed_positions, upper=0.0).get_positions()[0][0] == {
+        "A": {"B": -2.0, "C": 0.0},
+        "B": {"C": 0.0},
+        "C": {"B": -0.5},
+    }
+    with pytest.raises(ValueError):
+        clip_transform(signed_positions, lower=1.0, upper=0.0)
+
+
+def test_rank_transform(signed_positions):
+    # ranks are per dimension, the tie in C gets the average rank
+    assert rank_transform(signed_positions).get_positions()[0][0] == {
+        "A": {"B": 1.0, "C": 1.5},
+        "B": {"C": 1.5},
+        "C": {"B": 2.0},
+    }
+    assert rank_transform(signed_positions, 0.0).get_positions()[0][0] == {
+        "A": {"B": 1.0, "C": 2.5},
+        "B": {"B": 3.0, "C": 2.5},
+        "C": {"B": 2.0, "C": 1.0},
+    }
+    assert signed_positions.get_positions()[0][0]["A"] == {"B": -2.0, "C": 3.0}
+
+
+def test_transforms_own_their_indices(signed_positions):
+    matrix = signed_positions.get_layers()[0][0].matrix
+    indices, indptr = matrix.indices.copy(), matrix.indptr.copy()
+    for transform in [power_transform, log_transform, zscore_transform]:
+        result = transform(signed_positions).get_layers()[0][0].matrix
+        assert not np.shares_memory(result.indices, matrix.indices)
+        assert not np.shares_memory(result.indptr, matrix.indptr)
+        # in-place operations on the result leave the input positions alone
+        result.indices[:] = 0
+        result.indptr[:] = 0
+        np.testing.assert_array_equal(matrix.indices, indices)
+        np.testing.assert_array_equal(matrix.indptr, indptr)
+
+
+
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_positions_sorted_like_pivot_table(symmetric):
+    df = pd.DataFrame(
+        {"source": ["C", "B", "A"], "target": ["D", "C", "D"], "weight": [1.0, 2.0, 3.0]}
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": symmetric,
+        "irreflexive": True,
+    }
+    positions = create_positions([create_network(df, settings)], [], "BINARY")
+    pos, dims, _ = positions.get_positions()[0]
+    # nodes and dimensions in sorted order, as pivot_table returned them
+    assert list(pos) == (["A", "B", "C", "D"] if symmetric else ["A", "B", "C"])
+    assert dims == sorted(dims)
+    assert all(list(coords) == sorted(coords) for coords in pos.values())
@@ -0,0 +1,722 @@
+import pytest
+import numpy as np
+import pandas as pd
+from util.network_algorithms import (
+    create_network,
+    similarity_transform,
+    filter_transform,
+    parse_steps,
+    plan_pipeline,
+    run_pipeline,
+    apply_transform,
+    sweep_transform,
+    distance_transform,
+    incremental_transform,
+    cached_transform,
+    cache_key,
+    walk_transform,
+    dense_distance_transform,
+    bottleneck_transform,
+    reliability_transform,
+    bitset_reachability_transform,
+    reachability_transform,
+    dependency_transform,
+    max_flow_transform,
+    component_transform,
+)
+from nodes.network.util import planner
+from util.port_objects import NetworkPortObject
+from nodes.network.util.sketch import approximate_percentile
+
+
+# -------------------------------------------------
+# Fixture: Small directed network
+# -------------------------------------------------
+@pytest.fixture
+def small_network():
+    """
+    Returns a NetworkPortObject of the network:
+      A → C, A → D
+      B → C, B → D, B → E
+      C → E
+    """
+    df = pd.DataFrame(
+        {
+            "source": ["A", "A", "B", "B", "B", "C"],
+            "target": ["C", "D", "C", "D", "E", "E"],
+            "weight": [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+        }
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    return create_network(df, settings)
+
+
+# -------------------------------------------------
+# Test: similarity_transform
+# -------------------------------------------------
+def test_similarity_jaccard(small_network):
+    out = similarity_transform(small_network, "JACCARD", "OUT", block_size=1)
+    df = out.get_network()
+    pairs = {frozenset((s, t)): v for s, t, v in df.itertuples(index=False)}
+    assert out.spec.weight_label == "jaccard"
+    assert pairs == {
+        frozenset(("A", "B")): pytest.approx(2 / 3),
+        frozenset(("B", "C")): pytest.approx(1 / 3),
+    }
+
+
+def test_similarity_top_k(small_network):
+    out = similarity_transform(small_network, "COMMON_NEIGHBORS", "OUT", top_k=1)
+    df = out.get_network()
+    assert not out.spec.symmetric
+    assert df.groupby("source").size().max() == 1
+    assert df.set_index("source").loc["A", "common_neighbors"] == 2
+
+
+# -------------------------------------------------
+# Test: filter_transform (top-k edges)
+# -------------------------------------------------
+def test_filter_top_k_out(small_network):
+    df = small_network.get_network()
+    df["weight"] = [1.0, 2.0, 3.0, 1.0, 2.0, 3.0]
+    out = filter_transform(
+        small_network, "OUT", "TOP_K", "ABSOLUTE_THRESHOLD", "GREATER", 0.0, False, top_k=1
+    )
+    edges = set(zip(out.get_network()["source"], out.get_network()["target"]))
+    assert edges == {("A", "D"), ("B", "C"), ("C", "E")}
+
+
+# -------------------------------------------------
+# Test: filter_transform (k-core)
+# -------------------------------------------------
+def test_filter_core(small_network):
+    out = filter_transform(
+        small_network, "TOTAL", "CORE", "ABSOLUTE_THRESHOLD", "GREATER", 2.0, False,
+        core_columns=True,
+    )
+    df = out.get_network()
+    # every node keeps at least two edges, so the whole network is its 2-core
+    assert set(zip(df["source"], df["target"])) == {
+        ("A", "C"), ("A", "D"), ("B", "C"), ("B", "D"), ("B", "E"), ("C", "E")
+    }
+    assert (df["source_core"] == 2).all() and (df["target_core"] == 2).all()
+    # the core numbers are opt-in, by default the columns of the input are kept
+    out = filter_transform(
+        small_network, "TOTAL", "CORE", "ABSOLUTE_THRESHOLD", "GREATER", 2.0, False
+    )
+    assert list(out.get_network().columns) == list(small_network.get_network().columns)
+
+    out = filter_transform(
+        small_network, "TOTAL", "CORE", "ABSOLUTE_THRESHOLD", "GREATER", 3.0, False
+    )
+    assert out.get_network().empty
+
+
+def test_filter_core_duplicate_pairs():
+    # the triangle A, B, C with D attached to A by a row in each direction
+    df = pd.DataFrame(
+        {
+            "source": ["A", "B", "C", "A", "D"],
+            "target": ["B", "C", "A", "D", "A"],
+            "weight": [1.0, 1.0, 1.0, 1.0, 1.0],
+        }
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": True,
+        "irreflexive": True,
+    }
+    out = filter_transform(
+        create_network(df, settings), "TOTAL", "CORE", "ABSOLUTE_THRESHOLD", "GREATER", 2.0, False
+    )
+    df = out.get_network()
+    # D has a single neighbor, so it is not in the 2-core
+    assert set(zip(df["source"], df["target"])) == {("A", "B"), ("B", "C"), ("C", "A")}
+
+
+# -------------------------------------------------
+# Test: approximate_percentile
+# -------------------------------------------------
+def test_approximate_percentile():
+    values = np.random.default_rng(0).exponential(size=100_000)
+    for percentile in [10, 50, 90]:
+        estimate = approximate_percentile(values, percentile, k=200, chunk_size=10_000)
+        rank = (values <= estimate).mean() * 100
+        assert abs(rank - percentile) < 2
+
+
+# -------------------------------------------------
+# Test: run_pipeline
+# -------------------------------------------------
+def test_pipeline_matches_steps(small_network):
+    df = small_network.get_network()
+    df["weight"] = [1.0, 2.0, 3.0, 1.0, 2.0, 3.0]
+    steps = parse_steps(
+        "RESCALE rescale_method=GLOBAL_MIN_MAX interval_a=1 interval_b=2; DISTANCE; FILTER filter_value=2"
+    )
+    plan = plan_pipeline(steps)
+    assert [kind for kind, _ in plan] == ["FUSED", "STEP", "FUSED"]
+
+    out = run_pipeline(small_network, steps)
+    expected = small_network
+    for step in steps:
+        expected = apply_transform(expected, step)
+    assert out.spec.weight_label == "distance"
+    pd.testing.assert_frame_equal(
+        out.get_network().sort_values(["source", "target"]).reset_index(drop=True),
+        expected.get_network().sort_values(["source", "target"]).reset_index(drop=True),
+    )
+
+
+def _step_by_step(network, steps):
+    for step in steps:
+        network = apply_transform(network, step)
+    return network
+
+
+@pytest.mark.parametrize("weights", [[1.0, np.nan, 3.0, 2.0], []])
+def test_fused_min_max_missing_weights(weights):
+    df = pd.DataFrame(
+        {
+            "source": ["A", "B", "C", "D"][: len(weights)],
+            "target": ["B", "C", "D", "A"][: len(weights)],
+            "weight": np.array(weights, dtype=np.float64),
+        }
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    network = create_network(df, settings)
+    steps = parse_steps(
+        "RESCALE rescale_method=GLOBAL_MIN_MAX; FILTER filter_mode=GREATER filter_value=0.4"
+    )
+    assert [kind for kind, _ in plan_pipeline(steps)] == ["FUSED"]
+    out = run_pipeline(network, steps).get_network()
+    expected = _step_by_step(network, steps).get_network()
+    assert len(out) == (2 if weights else 0)
+    pd.testing.assert_frame_equal(out.reset_index(drop=True), expected.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("weights", [[3.0, 4.0], [4.0, 3.0]])
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_pipeline_duplicate_pairs(symmetric, weights):
+    # B-C is listed twice (reversed in the symmetric network), with different weights
+    df = pd.DataFrame(
+        {
+            "source": ["A", "B", "C" if symmetric else "B"],
+            "target": ["B", "C", "B" if symmetric else "C"],
+            "weight": [1.0, *weights],
+        }
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": symmetric,
+        "irreflexive": True,
+    }
+    network = create_network(df, settings)
+    for text in [
+        "DISTANCE; FILTER filter_mode=LESS filter_value=3",
+        "BOTTLENECK; FILTER filter_mode=GREATER filter_value=4",
+    ]:
+        steps = parse_steps(text)
+        out = run_pipeline(network, steps).get_network()
+        expected = _step_by_step(network, steps).get_network()
+        pd.testing.assert_frame_equal(
+            out.sort_values(["source", "target"]).reset_index(drop=True),
+            expected.sort_values(["source", "target"]).reset_index(drop=True),
+        )
+
+
+@pytest.mark.parametrize("k", [1, 2, 3])
+def test_k_reachability_symmetric_both_directions(k):
+    # the path A - B - C - D
+    df = pd.DataFrame(
+        {"source": ["A", "B", "C"], "target": ["B", "C", "D"], "weight": [1.0, 1.0, 1.0]}
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": True,
+        "irreflexive": True,
+    }
+    out = apply_transform(
+        create_network(df, settings), parse_steps(f"REACHABILITY set_k=true k_value={k}")[0]
+    ).get_network()
+    nodes = "ABCD"
+    expected = set()
+    for i, source in enumerate(nodes):
+        for j, target in enumerate(nodes):
+            # every node is back at itself after two steps
+            if 0 < abs(i - j) <= k or (i == j and k >= 2):
+                expected.add((source, target))
+    assert set(zip(out["source"], out["target"])) == expected
+    assert len(out) == len(expected)
+
+
+# -------------------------------------------------
+# Test: sweep_transform
+# -------------------------------------------------
+def test_sweep_matches_single_runs(small_network):
+    df = small_network.get_network()
+    df["weight"] = [1.0, 2.0, 3.0, 1.0, 2.0, 3.0]
+    settings = parse_steps("FILTER filter_mode=GREATER")[0]
+    values = [0.0, 2.0, 2.5, 3.0]
+    outs = sweep_transform(small_network, settings, "FILTER_VALUE", values)
+    assert [len(out.get_network()) for out in outs] == [6, 4, 2, 2]
+    for value, out in zip(values, outs):
+        settings.filter_value = value
+        pd.testing.assert_frame_equal(
+            out.get_network(), apply_transform(small_network, settings).get_network()
+        )
+
+    settings = parse_steps("REACHABILITY set_k=true")[0]
+    outs = sweep_transform(small_network, settings, "K_VALUE", [1, 2])
+    assert len(outs[0].get_network()) == 6
+    # A reaches E in two steps
+    assert len(outs[1].get_network()) == 7
+
+
+@pytest.mark.parametrize("filter_mode", ["GREATER", "LESS"])
+@pytest.mark.parametrize("degree_type", ["OUT", "IN", "TOTAL"])
+def test_top_k_sweep_matches_filter_with_ties(small_network, degree_type, filter_mode):
+    df = small_network.get_network()
+    df["weight"] = [1.0, 2.0, 2.0, 2.0, 1.0, 1.0]
+    settings = parse_steps(
+        f"FILTER filter_type=TOP_K filter_mode={filter_mode} degree_type={degree_type}"
+    )[0]
+    values = [1, 2, 3]
+    outs = sweep_transform(small_network, settings, "FILTER_TOP_K", values)
+    for k, out in zip(values, outs):
+        settings.filter_top_k = k
+        pd.testing.assert_frame_equal(
+            out.get_network(), apply_transform(small_network, settings).get_network()
+        )
+
+
+# -------------------------------------------------
+# Test: incremental_transform
+# -------------------------------------------------
+def test_incremental_distance(small_network):
+    previous = distance_transform(small_network)
+    delta = pd.DataFrame(
+        {
+            "source": ["C", "A", "E"],
+            "target": ["E", "B", "F"],
+            "weight": [np.nan, 1.0, 1.0],
+        }
+    )
+    network, result = incremental_transform(
+        small_network, previous, delta, "DISTANCE", max_share=1.0
+    )
+    assert len(network.get_network()) == 7
+    expected = distance_transform(network)
+    pd.testing.assert_frame_equal(
+        result.get_network().sort_values(["source", "target"]).reset_index(drop=True),
+        expected.get_network().sort_values(["source", "target"]).reset_index(drop=True),
+    )
+
+
+# -------------------------------------------------
+# Test: snapshots
+# -------------------------------------------------
+@pytest.mark.parametrize("max_share", [0.0, 1.0])
+def test_snapshot_distance(small_network, max_share):
+    df = small_network.get_network().assign(year=[2000, 2000, 2001, 2001, 2002, 2002])
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+        "snapshot_mode": "CUMULATIVE",
+        "time_label": "year",
+    }
+    network = create_network(df, settings)
+    assert network.get_snapshots().labels == ["2000", "2001", "2002"]
+    assert len(network.get_snapshot(1).get_network()) == 4
+
+    # 0 recomputes every snapshot, 1 updates every snapshot from the previous one
+    out = apply_transform(network, parse_steps(f"DISTANCE max_share={max_share}")[0])
+    for i in range(3):
+        got = out.get_snapshot(i).get_network()
+        expected = distance_transform(network.get_snapshot(i)).get_network()
+        pd.testing.assert_frame_equal(
+            got.sort_values(["source", "target"]).reset_index(drop=True),
+            expected.sort_values(["source", "target"]).reset_index(drop=True),
+        )
+
+
+# -------------------------------------------------
+# Test: cached_transform
+# -------------------------------------------------
+def test_cached_distance(small_network, tmp_path):
+    pytest.importorskip("pyarrow")
+    settings = parse_steps("DISTANCE")[0]
+    first = cached_transform(small_network, settings, directory=str(tmp_path))
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+    second = cached_transform(small_network, settings, directory=str(tmp_path))
+    assert second.spec.serialize() == first.spec.serialize()
+    pd.testing.assert_frame_equal(
+        second.get_network(), first.get_network().reset_index(drop=True)
+    )
+
+
+def test_cached_results_keep_their_form(small_network, tmp_path):
+    pytest.importorskip("pyarrow")
+    expected = distance_transform(small_network).get_network()
+    # matrix results are not stored, the cache must not turn them into edge lists
+    settings = parse_steps("DISTANCE matrix_output=true")[0]
+    for _ in range(2):
+        result = cached_transform(small_network, settings, directory=str(tmp_path))
+        assert result.is_matrix()
+    assert not list(tmp_path.glob("*.parquet"))
+
+    settings = parse_steps("DISTANCE spill_to_disk=true spill_size=1")[0]
+    for _ in range(2):
+        result = cached_transform(small_network, settings, directory=str(tmp_path))
+        assert result.is_spilled()
+        pd.testing.assert_frame_equal(
+            result.get_network().sort_values(["source", "target"]).reset_index(drop=True),
+            expected.sort_values(["source", "target"]).reset_index(drop=True),
+        )
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+
+
+def test_cache_key_settings(small_network):
+    key = cache_key(small_network, parse_steps("DISTANCE")[0])
+    # settings the distance transform does not read share the cache entry
+    assert key == cache_key(small_network, parse_steps("DISTANCE filter_value=3")[0])
+    assert key == cache_key(small_network, parse_steps("DISTANCE rescale_method=LOG")[0])
+    assert key == cache_key(small_network, parse_steps("DISTANCE workers=2")[0])
+    assert key != cache_key(small_network, parse_steps("DISTANCE split_components=true")[0])
+    assert key != cache_key(small_network, parse_steps("REACHABILITY")[0])
+    walk = cache_key(small_network, parse_steps("WALK")[0])
+    assert walk == cache_key(small_network, parse_steps("WALK walk_attenuation=0.5")[0])
+    assert walk != cache_key(
+        small_network, parse_steps("WALK walk_method=ATTENUATED_WALK walk_attenuation=0.5")[0]
+    )
+
+
+def test_spilled_distance(small_network):
+    pytest.importorskip("pyarrow")
+    expected = distance_transform(small_network).get_network()
+    result = distance_transform(small_network, spill_mb=1)
+    assert result.is_spilled()
+    restored = NetworkPortObject.deserialize(result.spec, result.serialize())
+    assert sum(len(chunk) for chunk in restored.get_network_chunks(2)) == len(expected)
+    pd.testing.assert_frame_equal(
+        restored.get_network(), expected.astype({"distance": "float64"})
+    )
+
+
+def test_matrix_distance(small_network):
+    expected = distance_transform(small_network).get_network()
+    result = distance_transform(small_network, matrix=True)
+    assert result.is_matrix()
+    matrix = result.get_matrix()
+    assert matrix.values.shape == (5, 5)
+    kept = filter_transform(
+        result,
+        degree_type="TOTAL",
+        filter_type="EDGE",
+        filter_threshold="ABSOLUTE_THRESHOLD",
+        filter_mode="LESS",
+        filter_value=1,
+        strength_mode=False,
+    )
+    assert kept.is_matrix()
+    assert len(kept.get_network()) == (expected["distance"] <= 1).sum()
+    df = result.get_network()
+    cols = list(df.columns)
+    pd.testing.assert_frame_equal(
+        df.sort_values(cols[:2]).reset_index(drop=True),
+        expected.sort_values(cols[:2]).reset_index(drop=True).astype({"distance": "float64"}),
+    )
+
+
+def test_matrix_distance_symmetric_orientation():
+    df = pd.DataFrame({"source": ["C", "B", "D"], "target": ["B", "A", "C"], "weight": [1.0, 2.0, 1.0]})
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": True,
+        "irreflexive": True,
+    }
+    network = create_network(df, settings)
+    expected = distance_transform(network).get_network()
+    result = distance_transform(network, matrix=True).get_network()
+    assert (result["source"] < result["target"]).all()
+    pd.testing.assert_frame_equal(
+        result.sort_values(["source", "target"]).reset_index(drop=True),
+        expected.sort_values(["source", "target"]).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+# -------------------------------------------------
+# Test: walk_transform
+# -------------------------------------------------
+def _weighted_network(symmetric=False, irreflexive=True, seed=0, n=8, m=20):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "source": rng.integers(0, n, m),
+            "target": rng.integers(0, n, m),
+            "weight": rng.integers(1, 5, m).astype(float),
+        }
+    ).drop_duplicates(["source", "target"])
+    if irreflexive:
+        df = df[df["source"] != df["target"]]
+    if symmetric:
+        pairs = np.sort(df[["source", "target"]].to_numpy(), axis=1)
+        df = df[~pd.DataFrame(pairs).duplicated().to_numpy()]
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": symmetric,
+        "irreflexive": irreflexive,
+    }
+    return create_network(df.reset_index(drop=True), settings)
+
+
+def _dense_adjacency(network):
+    df = network.get_network()
+    nodes = sorted(set(df["source"]) | set(df["target"]))
+    ids = {node: i for i, node in enumerate(nodes)}
+    A = np.zeros((len(nodes), len(nodes)))
+    for s, t, w in df[["source", "target", "weight"]].itertuples(index=False):
+        A[ids[s], ids[t]] = w
+        if network.is_symmetric():
+            A[ids[t], ids[s]] = w
+    return nodes, A
+
+
+@pytest.mark.parametrize("block_size,dense_cutoff", [(3, 1.0), (3, 0.0), (100, 0.1)])
+@pytest.mark.parametrize("method", ["WALK_COUNT", "ATTENUATED_WALK", "TRANSITION_PROBABILITY"])
+def test_walk_matrix_powers(method, block_size, dense_cutoff):
+    network = _weighted_network(irreflexive=False)
+    nodes, A = _dense_adjacency(network)
+    k = 3
+    if method == "WALK_COUNT":
+        expected = np.linalg.matrix_power(A, k)
+    elif method == "ATTENUATED_WALK":
+        expected = sum(0.5**t * np.linalg.matrix_power(A, t) for t in range(1, k + 1))
+    else:
+        strength = A.sum(axis=1, keepdims=True)
+        P = np.divide(A, strength, out=np.zeros_like(A), where=strength != 0)
+        expected = np.linalg.matrix_power(P, k)
+
+    out = walk_transform(
+        network, method, k, attenuation=0.5, block_size=block_size, dense_cutoff=dense_cutoff
+    )
+    got = {(s, t): v for s, t, v in out.get_network().itertuples(index=False)}
+    rows, cols = np.nonzero(expected)
+    assert got.keys() == {(nodes[i], nodes[j]) for i, j in zip(rows, cols)}
+    for (s, t), v in got.items():
+        assert v == pytest.approx(expected[nodes.index(s), nodes.index(t)])
+
+
+# -------------------------------------------------
+# Test: path algebra closures
+# -------------------------------------------------
+@pytest.mark.parametrize("symmetric", [False, True])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_dense_distance_matches_distance(symmetric, seed):
+    network = _weighted_network(symmetric=symmetric, seed=seed, n=10, m=25)
+    expected = distance_transform(network).get_network()
+    result = dense_distance_transform(network, block_size=2).get_network()
+    pd.testing.assert_frame_equal(
+        result.sort_values(["source", "target"]).reset_index(drop=True),
+        expected.sort_values(["source", "target"]).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def _chain_network(weights):
+    # A → B, B → C, A → C, C → D
+    df = pd.DataFrame(
+        {"source": ["A", "B", "A", "C"], "target": ["B", "C", "C", "D"], "weight": weights}
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    return create_network(df, settings)
+
+
+def test_bottleneck_transform():
+    out = bottleneck_transform(_chain_network([5.0, 3.0, 2.0, 4.0]), block_size=1)
+    got = {(s, t): v for s, t, v in out.get_network().itertuples(index=False)}
+    assert got == {
+        ("A", "B"): 5.0,
+        ("A", "C"): 3.0,
+        ("A", "D"): 3.0,
+        ("B", "C"): 3.0,
+        ("B", "D"): 3.0,
+        ("C", "D"): 4.0,
+    }
+
+
+def test_reliability_transform():
+    out = reliability_transform(_chain_network([0.5, 0.8, 0.3, 0.5]), block_size=1)
+    got = {(s, t): v for s, t, v in out.get_network().itertuples(index=False)}
+    assert got == {
+        ("A", "B"): pytest.approx(0.5),
+        ("A", "C"): pytest.approx(0.4),
+        ("A", "D"): pytest.approx(0.2),
+        ("B", "C"): pytest.approx(0.8),
+        ("B", "D"): pytest.approx(0.4),
+        ("C", "D"): pytest.approx(0.5),
+    }
+
+
+# -------------------------------------------------
+# Test: reachability engines and the engine planner
+# -------------------------------------------------
+@pytest.mark.parametrize("irreflexive", [False, True])
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_bitset_reachability_matches_reachability(symmetric, irreflexive):
+    # two cycles, a self-loop on 6 and a node 7 only reached from the cycles
+    df = pd.DataFrame(
+        {
+            "source": [0, 1, 2, 3, 4, 6, 6, 2],
+            "target": [1, 2, 0, 4, 3, 6, 3, 7],
+            "weight": 1.0,
+        }
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": symmetric,
+        "irreflexive": irreflexive,
+    }
+    network = create_network(df, settings)
+
+    def pairs(out):
+        df = out.get_network()
+        return {
+            tuple(sorted((s, t))) if symmetric else (s, t)
+            for s, t in zip(df["source"], df["target"])
+        }
+
+    expected = pairs(reachability_transform(network))
+    assert pairs(bitset_reachability_transform(network)) == expected
+    # the self-loop always counts, reflexive networks add every node to itself
+    assert (6, 6) in expected
+    assert ((7, 7) in expected) == irreflexive
+
+
+def test_plan_engine(monkeypatch):
+    monkeypatch.setattr(planner, "load_costs", lambda: dict(planner.DEFAULT_COSTS))
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    nodes = np.arange(50)
+    source, target = np.meshgrid(nodes, nodes)
+    keep = source != target
+    dense = create_network(
+        pd.DataFrame({"source": source[keep], "target": target[keep], "weight": 1.0}), settings
+    )
+    assert planner.plan_engine("DISTANCE", dense, workers=1) == "DENSE"
+    assert planner.plan_engine("REACHABILITY", dense, workers=1) == "BITSET"
+
+    # a long path, too many nodes for the n² engines
+    nodes = np.arange(30000)
+    sparse = create_network(
+        pd.DataFrame({"source": nodes[:-1], "target": nodes[1:], "weight": 1.0}), settings
+    )
+    assert planner.plan_engine("DISTANCE", sparse, workers=1) == "TRAVERSAL"
+    assert planner.plan_engine("REACHABILITY", sparse, workers=1) == "TRAVERSAL"
+
+
+# -------------------------------------------------
+# Test: component_transform
+# -------------------------------------------------
+@pytest.fixture
+def two_components():
+    """
+    Two disconnected directed components: A → B → C, B → A and X → Y → Z → X.
+    """
+    df = pd.DataFrame(
+        {
+            "source": ["A", "B", "B", "X", "Y", "Z"],
+            "target": ["B", "C", "A", "Y", "Z", "X"],
+            "weight": [1.0, 2.0, 3.0, 1.0, 2.0, 3.0],
+        }
+    )
+    settings = {
+        "source_label": "source",
+        "target_label": "target",
+        "weight_label": "weight",
+        "two_mode": False,
+        "symmetric": False,
+        "irreflexive": True,
+    }
+    return create_network(df, settings)
+
+
+def _sorted_edges(df):
+    return df.sort_values(list(df.columns[:2])).reset_index(drop=True)
+
+
+@pytest.mark.parametrize(
+    "transform,workers",
+    [
+        (distance_transform, 1),
+        (distance_transform, 2),
+        (reachability_transform, 1),
+        (dependency_transform, 1),
+    ],
+)
+def test_component_transform_matches_unsplit(two_components, transform, workers):
+    split = component_transform(two_components, transform, workers=workers)
+    pd.testing.assert_frame_equal(
+        _sorted_edges(split.get_network()),
+        _sorted_edges(transform(two_components).get_network()),
+    )
+
+
+def test_component_max_flow_drops_cross_pairs(two_components):
+    unsplit = max_flow_transform(two_components).get_network()
+    split = component_transform(two_components, max_flow_transform, workers=1).get_network()
+    first = {"A", "B", "C"}
+    cross = unsplit["source"].isin(first) != unsplit["target"].isin(first)
+    # pairs across components have no flow and are left out of split runs
+    assert (unsplit.loc[cross, "max_flow"] == 0).all()
+    pd.testing.assert_frame_equal(_sorted_edges(split), _sorted_edges(unsplit[~cross]))
@@ -3,7 +3,40 @@ from nodes.network.util.distance import distance_transform
 from nodes.network.util.dependency import dependency_transform
 from nodes.network.util.max_flow import max_flow_transform
 from nodes.network.util.filter import filter_transform
+from nodes.network.util.similarity import similarity_transform
+from nodes.network.util.walks import walk_transform
+from nodes.network.util.path_algebra import (
+    dense_distance_transform,
+    dense_reachability_transform,
+    bitset_reachability_transform,
+    bottleneck_transform,
+    reliability_transform,
+)
+from nodes.network.util.planner import path_transform
+from nodes.network.util.components import component_transform, split_components
 from nodes.network.util.schema_gen import get_transform_schema
+from nodes.network.util.pipeline import (
+    apply_transform,
+    validate_transform,
+    parse_steps,
+    plan_pipeline,
+    pipeline_schema,
+    run_pipeline,
+)
+from nodes.network.util.sweep import parse_sweep_values, sweep_transform
+from nodes.network.util.cache import cached_transform, cache_key, ResultCache
+from nodes.network.util.spill import ChunkWriter, collect_rows
+from nodes.network.util.matrix import collect_matrix
+from nodes.network.util.snapshots import (
+    snapshot_network,
+    snapshot_edges,
+    snapshot_transform,
+)
+from nodes.network.util.incremental import (
+    INCREMENTAL_RESULT_LABELS,
+    apply_edge_delta,
+    incremental_transform,
+)
 from nodes.network.util.reachability import (
     reachability_transform,
     k_reachability_transform,
@@ -27,12 +60,17 @@ from nodes.network.util.rescale import (
 )
 from nodes.network.util.options_transform import (
     TransformOptions,
+    PathEngineOptions,
+    WalkOptions,
     RescaleOptions,
     SymmetrizationOptions,
+    SimilarityOptions,
     FilterOptions,
     ThresholdOptions,
     FilterModeOptions,
     ConstantHandlingOptions,
     LogBaseOptions,
     DegreeTypeOptions,
+    SweepOptions,
+    IncrementalOptions,
 )
@@ -1,6 +1,10 @@
 import knime.extension as knext
+import numpy as np
+import os
 import pandas as pd
 import pickle
+import tempfile
+import weakref
 
 # +---------------------------------------------------------------------------
 # | PositionPortObjectSpec and PositionPortObject
@@ -24,6 +28,32 @@ class PositionPortObjectSpec(knext.PortObjectSpec):
         return self._node_column
 
 
+class PositionMatrix:
+    """
+    Positions of one layer as a sparse matrix: row i holds the coordinates of nodes[i]
+    in the dimensions dims, stored as a scipy CSR matrix. Stored zeros are coordinates,
+    entries that are not stored have no value.
+    """
+
+    def __init__(self, nodes, dims, matrix) -> None:
+        self.nodes = pd.Index(nodes)
+        self.dims = pd.Index(dims)
+        self.matrix = matrix
+
+    def to_dict(self) -> dict:
+        """
+        Positions as dict[node][dim] = value, nodes without a coordinate are left out.
+        """
+        indptr = self.matrix.indptr
+        dims = np.asarray(self.dims, dtype=object)[self.matrix.indices]
+        values = self.matrix.data.tolist()
+        nodes = self.nodes.tolist()
+        return {
+            nodes[i]: dict(zip(dims[indptr[i] : indptr[i + 1]], values[indptr[i] : indptr[i + 1]]))
+            for i in np.flatnonzero(np.diff(indptr))
+        }
+
+
 class PositionPortObject(knext.PortObject):
     def __init__(
         self,
@@ -43,13 +73,26 @@ class PositionPortObject(knext.PortObject):
         positions = pickle.loads(data)
         return cls(spec, positions)
 
+    # positions is a list of (positions, dimensions, weight label) layers,
+    # the positions of a layer are a dict[node][dim] or a PositionMatrix.
+    # Matrices are converted to dicts on first use.
     def get_positions(self):
+        self._positions = [
+            (pos.to_dict(), dims, w) if isinstance(pos, PositionMatrix) else (pos, dims, w)
+            for pos, dims, w in self._positions
+        ]
         return self._positions
-    
+
+    def get_layers(self) -> list:
+        """
+        Layers as they are stored, without converting matrices.
+        """
+        return self._positions
+
     def get_uniform_positions(self):
         dfs = [
             pd.DataFrame(d).T.add_suffix(f'_{i}')
-            for i, (d,_,_) in enumerate(self._positions, start=1)
+            for i, (d,_,_) in enumerate(self.get_positions(), start=1)
         ]
         df = pd.concat(dfs, axis=1)
         dict = df.to_dict(orient='index')
@@ -182,25 +225,287 @@ class NetworkPortObjectSpec(knext.PortObjectSpec):
         return self._weight_label
 
 
+class NetworkNodeIndex:
+    """
+    Integer ids, degrees and strengths of the nodes of an edge list, computed once with
+    np.bincount. Nodes are matched by label across the source and target column.
+    Out-values count a node as source, in-values as target.
+    """
+
+    def __init__(self, df: pd.DataFrame, source_label: str, target_label: str, weight_label: str) -> None:
+        ids, self.labels = pd.factorize(
+            pd.concat([df[source_label], df[target_label]], ignore_index=True)
+        )
+        n = len(self.labels)
+        self.src_ids = ids[: len(df)]
+        self.tgt_ids = ids[len(df) :]
+        self.out_degree = np.bincount(self.src_ids, minlength=n)
+        self.in_degree = np.bincount(self.tgt_ids, minlength=n)
+
+        self.out_strength = self.in_strength = None
+        weights = df[weight_label]
+        if pd.api.types.is_numeric_dtype(weights):
+            # missing weights do not count, like in a pandas groupby sum
+            weights = np.nan_to_num(weights.to_numpy(dtype=np.float64))
+            self.out_strength = np.bincount(self.src_ids, weights=weights, minlength=n)
+            self.in_strength = np.bincount(self.tgt_ids, weights=weights, minlength=n)
+
+    def degree(self, degree_type: str, strength: bool = False) -> np.ndarray:
+        """
+        "OUT", "IN" or "TOTAL" degree (or strength) of every node.
+        """
+        if strength:
+            if self.out_strength is None:
+                raise ValueError("Weight column must be numeric.")
+            out_values, in_values = self.out_strength, self.in_strength
+        else:
+            out_values, in_values = self.out_degree, self.in_degree
+        if degree_type == "OUT":
+            return out_values
+        if degree_type == "IN":
+            return in_values
+        if degree_type == "TOTAL":
+            return out_values + in_values
+        raise ValueError(f"Unknown degree_type: {degree_type}")
+
+    def has_edges(self, degree_type: str) -> np.ndarray:
+        """
+        Nodes with at least one edge of the degree type.
+        """
+        return self.degree(degree_type) > 0
+
+
+class NetworkSnapshots:
+    """
+    Time slices of an edge list, stored as deltas over the one base edge list:
+    edge row i belongs to the snapshots start[i] <= s < end[i]. The rows are sorted by start,
+    so consecutive snapshots differ by the rows that start or end there.
+    """
+
+    def __init__(self, labels: list, start: np.ndarray, end: np.ndarray) -> None:
+        self.labels = list(labels)
+        self.start = np.asarray(start, dtype=np.int64)
+        self.end = np.asarray(end, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def active(self, snapshot: int) -> np.ndarray:
+        """
+        Boolean mask of the edge rows in the snapshot.
+        """
+        return (self.start <= snapshot) & (snapshot < self.end)
+
+    def take(self, rows) -> "NetworkSnapshots":
+        return NetworkSnapshots(self.labels, self.start[rows], self.end[rows])
+
+    def expand(self):
+        """
+        All (row, snapshot) pairs of the edge rows, as two arrays.
+        """
+        counts = np.maximum(self.end - self.start, 0)
+        rows = np.repeat(np.arange(len(counts)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return rows, np.repeat(self.start, counts) + offsets
+
+
+class SpilledEdges:
+    """
+    Edge list stored in a temporary Parquet file written in chunks, read on demand.
+    The file is removed together with the object.
+    """
+
+    # Parquet files start (and end) with this magic number
+    MAGIC = b"PAR1"
+
+    def __init__(self, path: str, num_rows: int) -> None:
+        self.path = path
+        self.num_rows = num_rows
+        self._cleanup = weakref.finalize(self, SpilledEdges.remove, path)
+
+    @staticmethod
+    def remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def read(self) -> pd.DataFrame:
+        import pyarrow.parquet as pq
+
+        return pq.read_table(self.path).to_pandas()
+
+    def iter_chunks(self, rows: int):
+        """
+        Yields the edge list as DataFrames of at most rows rows.
+        """
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(self.path).iter_batches(batch_size=rows):
+            yield batch.to_pandas()
+
+    def to_bytes(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SpilledEdges":
+        import pyarrow.parquet as pq
+
+        fd, path = tempfile.mkstemp(prefix="knime_networks_", suffix=".parquet")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return cls(path, pq.ParquetFile(path).metadata.num_rows)
+
+
+def sorted_pairs(sources: np.ndarray, targets: np.ndarray):
+    """
+    Orients the pairs of a symmetric edge list by label (source <= target), the way the
+    all-pairs transforms write every unordered pair.
+    """
+    swap = sources > targets
+    return np.where(swap, targets, sources), np.where(swap, sources, targets)
+
+
+class NetworkMatrix:
+    """
+    Dense all-pairs result: values[i, j] is the value from row_labels[i] to col_labels[j],
+    NaN where the pair has no value. Symmetric results hold both halves of the matrix.
+    """
+
+    def __init__(self, row_labels, col_labels, values: np.ndarray) -> None:
+        self.row_labels = pd.Index(row_labels)
+        self.col_labels = pd.Index(col_labels)
+        self.values = values
+
+    def to_edges(
+        self, source_label: str, target_label: str, weight_label: str, symmetric: bool
+    ) -> pd.DataFrame:
+        """
+        Edge list of the entries with a value, symmetric results keep every unordered
+        pair once with source <= target.
+        """
+        mask = ~np.isnan(self.values)
+        if symmetric:
+            mask = np.triu(mask)
+        rows, cols = np.nonzero(mask)
+        sources = self.row_labels.to_numpy()[rows]
+        targets = self.col_labels.to_numpy()[cols]
+        if symmetric:
+            sources, targets = sorted_pairs(sources, targets)
+        return pd.DataFrame(
+            {
+                source_label: sources,
+                target_label: targets,
+                weight_label: self.values[rows, cols].astype(np.float64),
+            }
+        )
+
+
 class NetworkPortObject(knext.PortObject):
-    def __init__(self, spec: NetworkPortObjectSpec, network) -> None:
+    def __init__(
+        self, spec: NetworkPortObjectSpec, network, snapshots: NetworkSnapshots = None
+    ) -> None:
         super().__init__(spec)
         self._network = network
+        self._snapshots = snapshots
+        self._node_index = None
 
     def serialize(self) -> bytes:
-        return pickle.dumps(self._network)
+        if self.is_spilled() and self._snapshots is None:
+            # the chunked file is passed on as is
+            return self._network.to_bytes()
+        if self._snapshots is None:
+            # edge lists and matrices are pickled as they are stored
+            network = self._network if self.is_matrix() else self.get_network()
+            return pickle.dumps(network)
+        return pickle.dumps((self.get_network(), self._snapshots))
 
     @classmethod
     def deserialize(
         cls, spec: NetworkPortObjectSpec, data: bytes
     ) -> "NetworkPortObject":
+        if data[: len(SpilledEdges.MAGIC)] == SpilledEdges.MAGIC:
+            return cls(spec, SpilledEdges.from_bytes(data))
         network = pickle.loads(data)
+        if isinstance(network, tuple):
+            return cls(spec, *network)
         return cls(spec, network)
 
-    # network contains a Dataframe edge list of the network
+    # network contains a Dataframe edge list of the network,
+    # with snapshots the edges of all snapshots.
+    # A spilled edge list is read from its file on first use,
+    # a matrix is converted to an edge list on first use.
     def get_network(self) -> pd.DataFrame:
+        if self.is_spilled():
+            self._network = self._network.read()
+        elif self.is_matrix():
+            self._network = self._network.to_edges(
+                self.get_source_label(),
+                self.get_target_label(),
+                self.get_weight_label(),
+                self.is_symmetric(),
+            )
         return self._network
 
+    def is_matrix(self) -> bool:
+        """
+        True while the network is only stored as a dense matrix.
+        """
+        return isinstance(self._network, NetworkMatrix)
+
+    def get_matrix(self) -> NetworkMatrix | None:
+        """
+        Dense matrix of the network, None if it is stored as an edge list.
+        """
+        return self._network if self.is_matrix() else None
+
+    def is_spilled(self) -> bool:
+        """
+        True while the edge list is only stored in a chunked file on disk.
+        """
+        return isinstance(self._network, SpilledEdges)
+
+    def get_network_chunks(self, rows: int = 100_000):
+        """
+        Yields the edge list as DataFrames of at most rows rows, without reading a
+        spilled edge list into memory at once.
+        """
+        if self.is_spilled():
+            yield from self._network.iter_chunks(rows)
+            return
+        network = self.get_network()
+        for start in range(0, len(network), rows):
+            yield network.iloc[start : start + rows]
+
+    def get_snapshots(self) -> NetworkSnapshots | None:
+        return self._snapshots
+
+    def get_snapshot(self, snapshot: int) -> "NetworkPortObject":
+        """
+        Network of a single snapshot.
+        """
+        return NetworkPortObject(
+            self.spec, self.get_network()[self._snapshots.active(snapshot)]
+        )
+
+    def get_node_index(self) -> NetworkNodeIndex:
+        """
+        Degree and strength index of the nodes, computed on first use.
+        The edge list must not be modified in place afterwards.
+        """
+        if self._node_index is None:
+            self._node_index = NetworkNodeIndex(
+                self.get_network(),
+                self.get_source_label(),
+                self.get_target_label(),
+                self.get_weight_label(),
+            )
+        return self._node_index
+
     def get_source_label(self) -> str:
         return self.spec.source_label
 
@@ -1,5 +1,6 @@
 
 from nodes.position.util.factory import create_positions
+from nodes.position.util.aggregate import AGGREGATE_LABELS, aggregate_transform
 from nodes.position.util.min_max import max_transform, min_transform
 from nodes.position.util.norms import (
     euclidean_norm_transform,
@@ -10,8 +11,12 @@ from nodes.position.util.norms import (
 from nodes.position.util.position_wise import (
     inverse_transform,
     log_transform,
+    power_transform,
+    clip_transform,
+    rank_transform,
     zscore_transform,
 )
+from nodes.position.util.table import long_batches, wide_table
 from nodes.position.util.options_dominance import (
     DominanceTypeOptions,
     DominanceStrictOptions,
@@ -23,3 +28,4 @@ from nodes.position.util.major_dominance import majorization_dominance
 from nodes.position.util.lexico_dominance import lexicographic_dominance
 from nodes.position.util.perm_dominance import permutation_dominance
 from nodes.position.util.neigh_dominance import neighborhood_dominance
+from nodes.position.util.walk_positions import walk_positions